@@ -0,0 +1,169 @@
+"""
+FinSignal UI — Agent run tracker.
+Polls per-agent run status, renders the run timeline, and gates "Run All
+Agents": the trigger is refused while any agent is running, and for a short
+grace period after this process launched a run (the backend may not report
+it as running yet). The gate is process-wide, so two sessions clicking at
+once start one run, not two.
+
+The next scheduled run comes from the backend. Without /agents/status, it
+is computed from the agents' known schedule in America/New_York time, so it
+stays correct across daylight saving.
+"""
+
+import html
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import db
+from ttl_cache import TTLCache
+
+POLL_ACTIVE  = float(os.getenv("AGENT_POLL_SECONDS", "5"))
+POLL_IDLE    = float(os.getenv("AGENT_IDLE_POLL_SECONDS", "60"))
+LAUNCH_GRACE = float(os.getenv("AGENT_LAUNCH_GRACE_SECONDS", "30"))
+
+ACTIVE_STATES = {"queued", "starting", "running"}
+_STATE_ICONS  = {"running": "⏳", "queued": "⏳", "starting": "⏳", "succeeded": "✅",
+                 "success": "✅", "done": "✅", "failed": "❌", "error": "❌"}
+
+# Fallback schedule (ET): scraper 6:00, comments 6:30, research every 4h.
+try:
+    SCHEDULE_TZ = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:
+    # No tz database on this image (tzdata not installed): standard time all year.
+    print("[agents] America/New_York not available — fallback schedule uses fixed UTC-5")
+    SCHEDULE_TZ = timezone(timedelta(hours=-5), "EST")
+SCHEDULE = (
+    [("scraper", 6, 0), ("comments", 6, 30)]
+    + [("research", h, 0) for h in (2, 6, 10, 14, 18, 22)]
+)
+
+_status_cache: TTLCache[Optional[dict]] = TTLCache(POLL_ACTIVE, maxsize=1)
+_launch_lock = threading.Lock()
+_launched_at = 0.0
+
+
+# ── Status ────────────────────────────────────────────────────────────────────
+
+def status(refresh: bool = False) -> Optional[dict]:
+    """Latest agent status, shared by every session for POLL_ACTIVE seconds."""
+    entry = None if refresh else _status_cache.get("status")
+    if entry is None:
+        entry = {"status": db.get_agent_status()}
+        _status_cache.set("status", entry)
+    return entry["status"]
+
+
+def invalidate() -> None:
+    """Drop the cached status (a pushed agent_run event made it stale)."""
+    _status_cache.invalidate()
+
+
+def _launch_pending() -> bool:
+    return time.monotonic() - _launched_at < LAUNCH_GRACE
+
+
+def is_active(current: Optional[dict]) -> bool:
+    running = bool(current) and any(r["state"] in ACTIVE_STATES for r in current["runs"])
+    return running or _launch_pending()
+
+
+def poll_interval(current: Optional[dict]) -> float:
+    """How often the tracker should re-poll: fast while a run is active."""
+    return POLL_ACTIVE if is_active(current) else POLL_IDLE
+
+
+def trigger() -> tuple[bool, str]:
+    """Start all agents unless a run is already active. Returns (started, message)."""
+    global _launched_at
+    with _launch_lock:
+        if is_active(status(refresh=True)):
+            return False, "Agents are already running — wait for this run to finish."
+        result = db.run_all_agents()
+        if not result.get("ok", True):
+            return False, f"Failed to start agents: {result.get('error', 'unknown error')}"
+        _launched_at = time.monotonic()
+        _status_cache.invalidate()
+        return True, "🚀 All agents started — scraper, comments, research"
+
+
+# ── Next run ──────────────────────────────────────────────────────────────────
+
+def _parse_ts(stamp) -> Optional[datetime]:
+    if not stamp:
+        return None
+    try:
+        ts = datetime.fromisoformat(str(stamp).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def scheduled_next(now: Optional[datetime] = None) -> tuple[datetime, str]:
+    """Next slot on the fallback schedule, as (UTC time, agent)."""
+    now_et = (now or datetime.now(timezone.utc)).astimezone(SCHEDULE_TZ)
+    slots = []
+    for agent, hour, minute in SCHEDULE:
+        for day_offset in (0, 1):
+            day = now_et.date() + timedelta(days=day_offset)
+            t = datetime(day.year, day.month, day.day, hour, minute, tzinfo=SCHEDULE_TZ)
+            if t > now_et:
+                slots.append((t, agent))
+                break
+    t, agent = min(slots)
+    return t.astimezone(timezone.utc), agent
+
+
+def next_run(current: Optional[dict]) -> tuple[datetime, str]:
+    """Next scheduled run as (UTC time, agent): the backend's answer when it has one."""
+    backend = _parse_ts(current and current.get("next_run"))
+    if backend and backend > datetime.now(timezone.utc):
+        return backend, current.get("next_agent", "")
+    return scheduled_next()
+
+
+def countdown(current: Optional[dict]) -> str:
+    if is_active(current):
+        return "Running…"
+    nxt, _ = next_run(current)
+    total_mins = max(0, int((nxt - datetime.now(timezone.utc)).total_seconds() / 60))
+    h, m = divmod(total_mins, 60)
+    return f"{h}h {m}m" if h else f"{m}m"
+
+
+# ── Timeline ──────────────────────────────────────────────────────────────────
+
+def _duration(run: dict) -> str:
+    start = _parse_ts(run["started_at"])
+    if not start:
+        return "—"
+    end = _parse_ts(run["finished_at"]) or datetime.now(timezone.utc)
+    secs = max(0, int((end - start).total_seconds()))
+    m, s = divmod(secs, 60)
+    return f"{m}m {s:02d}s" if m else f"{s}s"
+
+
+def timeline_html(current: Optional[dict]) -> str:
+    """One row per agent: state, start time, duration (live while running), items."""
+    if not current or not current["runs"]:
+        note = "Waiting for the run to report status…" if _launch_pending() else "No run status available."
+        return f"<div class='agent-timeline empty'>{note}</div>"
+    rows = []
+    for run in current["runs"]:
+        start = _parse_ts(run["started_at"])
+        started = start.astimezone(SCHEDULE_TZ).strftime("%I:%M %p").lstrip("0") if start else "—"
+        items = "" if run["items"] is None else f"{run['items']} items"
+        rows.append(
+            f"<div class='agent-run {run['state']}' title='{html.escape(run['error'] or '', quote=True)}'>"
+            f"<span class='agent-state'>{_STATE_ICONS.get(run['state'], '•')}</span>"
+            f"<span class='agent-name'>{html.escape(run['agent'])}</span>"
+            f"<span class='agent-time'>{started}</span>"
+            f"<span class='agent-duration'>{_duration(run)}</span>"
+            f"<span class='agent-items'>{items}</span>"
+            f"</div>"
+        )
+    return f"<div class='agent-timeline'>{''.join(rows)}</div>"
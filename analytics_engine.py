@@ -0,0 +1,296 @@
+"""
+FinSignal UI — Analytics engine.
+Daily and weekly rollups of posts, comments, quality archives and topic mix,
+built from the content and comment queues and kept as DataFrames. Updates
+are incremental: every bucket older than the newest one already rolled up is
+frozen, so a refresh only recomputes from that bucket forward. Figures are
+cached per data version and shared by every session.
+
+pandas and plotly are imported on first use, never at module import, so the
+app's cold start does not pay for them (see scripts/bench_import_time.py).
+"""
+
+import os
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Optional
+
+import background
+import db
+import niches
+
+REFRESH_TTL  = float(os.getenv("ANALYTICS_TTL_SECONDS", "60"))
+RETRY_AFTER  = 10.0   # seconds between attempts while the backend is unreachable
+HISTORY_DAYS = int(os.getenv("ANALYTICS_HISTORY_DAYS", "90"))
+
+COUNTERS = ("posts", "comments", "archived")
+_COLORS  = {"posts": "#0A66C2", "comments": "#22C55E", "archived": "#F5A623"}
+
+
+# ── Events ────────────────────────────────────────────────────────────────────
+
+def _day(stamp) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(stamp or "")[:10])
+    except ValueError:
+        return None
+
+
+def _events(content_rows: list[dict], comment_rows: list[dict]) -> list[tuple[date, str, str]]:
+    """(day, counter, topic) for every countable event in the queues."""
+    out = []
+    for r in content_rows:
+        status = r.get("status")
+        if status == "posted":
+            counter, d = "posts", _day(r.get("posted_at") or r.get("created_at"))
+        elif status == "archived":
+            counter, d = "archived", _day(r.get("updated_at") or r.get("created_at"))
+        else:
+            continue
+        if d:
+            topic = r.get("topic") or niches.extract_topic(r.get("title") or "", r.get("body") or "")
+            out.append((d, counter, topic))
+    for r in comment_rows:
+        if r.get("status") == "posted":
+            d = _day(r.get("posted_at") or r.get("created_at"))
+            if d:
+                out.append((d, "comments", ""))
+    return out
+
+
+# ── Rollups ───────────────────────────────────────────────────────────────────
+
+class _Rollups:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()           # guards the frames below; never held over HTTP
+        self.refresh_lock = threading.Lock()   # one refresh (fetch + apply) at a time
+        self.daily: Any = None     # DataFrame, one row per day, columns COUNTERS
+        self.weekly: Any = None    # DataFrame, one row per week (Monday start)
+        self.topics: Any = None    # DataFrame, one row per day, posts per topic
+        self.frontier: Optional[date] = None  # newest bucket; older ones are frozen
+        self.target_weights: dict = {}
+        self.version = 0
+        self.refreshed_at = 0.0
+        self.failed_at = 0.0
+        self.figures: dict[tuple, tuple[int, Any]] = {}
+
+
+_state = _Rollups()
+
+
+def _week_start(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+
+def _counts(pd, ev, column: str, index, columns=None):
+    if ev.empty:
+        frame = pd.DataFrame(0, index=index, columns=list(columns or []))
+    else:
+        frame = pd.crosstab(ev["day"], ev[column])
+        frame.columns.name = None
+    frame = frame.reindex(index, fill_value=0)
+    if columns is not None:
+        frame = frame.reindex(columns=list(columns), fill_value=0)
+    return frame.sort_index(axis=1).astype("int64")
+
+
+def _bucket(pd, events, since: date, until: date):
+    """Daily counters and daily topic mix for [since, until]."""
+    index = pd.date_range(since, until, freq="D")
+    ev = pd.DataFrame(
+        [(pd.Timestamp(d), c, t) for d, c, t in events if since <= d <= until],
+        columns=["day", "counter", "topic"],
+    )
+    daily  = _counts(pd, ev, "counter", index, COUNTERS)[list(COUNTERS)]
+    topics = _counts(pd, ev[ev["counter"] == "posts"], "topic", index)
+    return daily, topics
+
+
+def _weekly(days):
+    return days.resample("W-MON", label="left", closed="left").sum()
+
+
+def _nonzero(frame):
+    return frame.loc[:, (frame != 0).any()]
+
+
+def _fetch() -> tuple[list[dict], list[dict], dict]:
+    """Both queues and the strategy health, in parallel. The queues are read in
+    strict mode, so an unreachable backend raises BackendUnavailable instead
+    of looking like empty queues."""
+    content_f = background.submit(db.fetch_strict, db.get_queue_snapshot, "content")
+    comment_f = background.submit(db.fetch_strict, db.get_queue_snapshot, "comments")
+    health_f  = background.submit(db.get_strategy_health)
+    return content_f.result(), comment_f.result(), background.result(health_f, {})
+
+
+def _empty(pd) -> None:
+    """Zero frames for the whole history, so charts render before the first
+    successful fetch. frontier stays unset: that fetch recomputes everything."""
+    today = date.today()
+    _state.daily, _state.topics = _bucket(pd, [], today - timedelta(days=HISTORY_DAYS - 1), today)
+    _state.weekly = _weekly(_state.daily)
+
+
+def refresh(force: bool = False) -> int:
+    """Bring the rollups up to date and return the data version.
+
+    Throttled to once per REFRESH_TTL seconds. Only buckets from the previous
+    frontier (the newest day, and its week, already rolled up) onward are
+    recomputed; the version only changes when those buckets actually change.
+    When the backend cannot be reached nothing advances (frontier, buckets,
+    refresh time), and the fetch is retried after RETRY_AFTER seconds.
+    """
+    import pandas as pd
+
+    def current() -> bool:
+        now = time.monotonic()
+        fresh = _state.frontier is not None and now - _state.refreshed_at < REFRESH_TTL
+        waiting = _state.daily is not None and now - _state.failed_at < RETRY_AFTER
+        return (fresh or waiting) and not force
+
+    with _state.lock:
+        if current():
+            return _state.version
+    with _state.refresh_lock:
+        with _state.lock:
+            if current():   # another thread refreshed while we waited
+                return _state.version
+        try:
+            content_rows, comment_rows, health = _fetch()
+        except db.BackendUnavailable as e:
+            print(f"[analytics] refresh skipped: {e}")
+            with _state.lock:
+                if _state.daily is None:
+                    _empty(pd)
+                _state.failed_at = time.monotonic()
+                return _state.version
+        events = _events(content_rows, comment_rows)
+        with _state.lock:
+            return _apply(pd, events, health.get("target_weights", {}))
+
+
+def _apply(pd, events: list[tuple[date, str, str]], target_weights: dict) -> int:
+    """Fold freshly fetched events into the frames (caller holds _state.lock)."""
+    _state.target_weights = target_weights
+    today = date.today()
+    since = _state.frontier or today - timedelta(days=HISTORY_DAYS - 1)
+    daily, topics = _bucket(pd, events, since, today)
+
+    if _state.daily is None:
+        changed = True
+        _state.daily, _state.topics = daily, topics
+        _state.weekly = _weekly(daily)
+    else:
+        cut = pd.Timestamp(since)
+        old_daily  = _state.daily[_state.daily.index >= cut]
+        old_topics = _state.topics[_state.topics.index >= cut]
+        changed = not (daily.equals(old_daily) and _nonzero(topics).equals(_nonzero(old_topics)))
+        if changed:
+            keep = _state.daily.index < cut
+            _state.daily = pd.concat([_state.daily[keep], daily]).iloc[-HISTORY_DAYS:]
+            _state.topics = (
+                pd.concat([_state.topics[_state.topics.index < cut], topics])
+                .fillna(0).astype("int64").sort_index(axis=1).iloc[-HISTORY_DAYS:]
+            )
+            # Only the week containing the old frontier onward is re-summed.
+            wcut = pd.Timestamp(_week_start(since))
+            _state.weekly = pd.concat([
+                _state.weekly[_state.weekly.index < wcut],
+                _weekly(_state.daily[_state.daily.index >= wcut]),
+            ])
+
+    _state.frontier = today
+    _state.refreshed_at = time.monotonic()
+    if changed:
+        _state.version += 1
+    return _state.version
+
+
+def daily_rollup() -> Any:
+    refresh()
+    return _state.daily
+
+
+def weekly_rollup() -> Any:
+    refresh()
+    return _state.weekly
+
+
+def topic_mix(weeks: int = 4) -> Any:
+    """Share of posts per topic over the last `weeks` weeks next to the target weights (%)."""
+    import pandas as pd
+
+    refresh()
+    recent = _state.topics.iloc[-7 * weeks:].sum()
+    total  = int(recent.sum())
+    actual = (recent / total * 100).round(1) if total else recent.astype(float)
+    target = pd.Series(_state.target_weights, dtype=float)
+    mix = pd.DataFrame({"actual": actual, "target": target}).fillna(0.0)
+    return mix[(mix["actual"] > 0) | (mix["target"] > 0)]
+
+
+# ── Figures ───────────────────────────────────────────────────────────────────
+
+def _cached_figure(key: tuple, build):
+    version = refresh()
+    with _state.lock:
+        hit = _state.figures.get(key)
+        if hit and hit[0] == version:
+            return hit[1]
+    fig = build()
+    with _state.lock:
+        _state.figures[key] = (version, fig)
+    return fig
+
+
+def style_figure(fig, title: str):
+    """Dark, transparent layout shared by every Analytics chart."""
+    fig.update_layout(
+        title=dict(text=title, font=dict(size=14, color="#FAFAFA")),
+        template="plotly_dark",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        margin=dict(l=10, r=10, t=40, b=10),
+        height=300,
+        legend=dict(orientation="h", y=-0.2),
+    )
+    return fig
+
+
+def activity_figure(period: str = "daily"):
+    """Posts, comments and quality archives per day or per week."""
+    def build():
+        import plotly.graph_objects as go
+
+        frame = _state.weekly if period == "weekly" else _state.daily.iloc[-30:]
+        fig = go.Figure([
+            go.Bar(x=frame.index, y=frame[c], name=c.title(), marker_color=_COLORS[c])
+            for c in COUNTERS
+        ])
+        fig.update_layout(barmode="group")
+        return style_figure(fig, f"Activity — {'weekly' if period == 'weekly' else 'last 30 days'}")
+
+    return _cached_figure(("activity", period), build)
+
+
+def topic_mix_figure(weeks: int = 4):
+    """Actual topic share of posts vs the strategy's target weights."""
+    def build():
+        import plotly.graph_objects as go
+
+        mix = topic_mix(weeks)
+        fig = go.Figure([
+            go.Bar(x=mix.index, y=mix["actual"], name="Actual %", marker_color="#0A66C2"),
+            go.Bar(x=mix.index, y=mix["target"], name="Target %", marker_color="#4B5563"),
+        ])
+        fig.update_layout(barmode="group")
+        return style_figure(fig, f"Topic mix — last {weeks} weeks")
+
+    return _cached_figure(("topic_mix", weeks), build)
+
+
+def clear() -> None:
+    global _state
+    _state = _Rollups()
@@ -5,14 +5,29 @@ Streamlit dashboard for LinkedIn content management.
 
 import os
 import sys
-from datetime import datetime, timedelta, timezone
+import time
+from concurrent.futures import Future
 
 import streamlit as st
+import agent_tracker
+import background
 import db
-from pages import content_queue, comment_queue, influencer_manager, strategy_manager, analytics, connections
+import events
+import journal
+import metrics_history
+import page_registry
+import profile_cache
+import styles
+import widgets
+import write_behind
 
 API_URL = os.getenv("API_URL", "http://localhost:8000")
 
+# Opt-in auto-refresh (queue, analytics and connections tabs): a cheap change
+# check that backs off from the min to the max interval while nothing changes.
+AUTO_REFRESH_MIN_SECONDS = float(os.getenv("AUTO_REFRESH_MIN_SECONDS", "15"))
+AUTO_REFRESH_MAX_SECONDS = float(os.getenv("AUTO_REFRESH_MAX_SECONDS", "300"))
+
 # ── Pre-flight: abort if Streamlit runtime context not ready ───────────────────
 try:
     from streamlit.runtime.scriptrunner import get_script_run_ctx
@@ -32,120 +47,8 @@ st.set_page_config(
 
 try:  # ── Wrap entire app body to catch SessionInfo errors ──────────────────────
 
-    # ── Global CSS ─────────────────────────────────────────────────────────────────
-    st.markdown(
-        """
-        <style>
-        /* ── Hide default Streamlit chrome ── */
-        #MainMenu { visibility: hidden; }
-        footer { visibility: hidden; }
-        header { visibility: hidden; }
-        [data-testid="collapsedControl"] { display: none; }
-        section[data-testid="stSidebar"] > div:first-child { padding-top: 1.5rem; }
-        section[data-testid="stSidebar"] { display: none !important; }
-        .block-container { padding-top: 1.2rem; padding-bottom: 2rem; }
-
-        /* ── Metric cards ── */
-        .metric-card {
-            background: #1E2130;
-            border-radius: 8px;
-            padding: 18px 20px;
-            border: 1px solid #2D3748;
-            transition: border-color 0.2s ease;
-            cursor: pointer;
-            min-height: 96px;
-        }
-        .metric-card:hover { border-color: #0A66C2; }
-        .metric-card.active { border-left: 3px solid #0A66C2; }
-        .metric-label {
-            font-size: 0.74rem;
-            color: #9AA0B2;
-            text-transform: uppercase;
-            letter-spacing: 0.07em;
-            margin-bottom: 4px;
-        }
-        .metric-value {
-            font-size: 1.9rem;
-            font-weight: 700;
-            color: #FAFAFA;
-            line-height: 1.1;
-        }
-        .metric-sub {
-            font-size: 0.73rem;
-            color: #6B7280;
-            margin-top: 3px;
-        }
-
-        /* ── Nav tab buttons ── */
-        .tab-nav button {
-            background: #1E2130 !important;
-            border: 1px solid #2D3748 !important;
-            border-radius: 8px !important;
-            color: #9AA0B2 !important;
-            font-weight: 600 !important;
-            padding: 8px 16px !important;
-            transition: all 0.15s ease !important;
-        }
-        .tab-nav button:hover {
-            border-color: #0A66C2 !important;
-            color: #FAFAFA !important;
-        }
-
-        /* ── All st.button rounded corners ── */
-        button[kind="secondary"], button[kind="primary"] {
-            border-radius: 6px !important;
-        }
-
-        /* ── LinkedIn connect banner ── */
-        .li-banner {
-            background: #1A1C2A;
-            border: 1px solid #F5A623;
-            border-radius: 8px;
-            padding: 12px 18px;
-            margin-bottom: 16px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }
-        .li-banner-text {
-            font-size: 0.88rem;
-            color: #F5A623;
-            flex: 1;
-        }
-
-        /* ── Profile chip ── */
-        .profile-chip {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            background: #1E2130;
-            border: 1px solid #2D3748;
-            border-radius: 40px;
-            padding: 6px 14px 6px 6px;
-            float: right;
-        }
-        .profile-avatar {
-            width: 32px;
-            height: 32px;
-            border-radius: 50%;
-            object-fit: cover;
-        }
-        .profile-name {
-            font-size: 0.85rem;
-            font-weight: 600;
-            color: #FAFAFA;
-        }
-        .profile-title {
-            font-size: 0.72rem;
-            color: #9AA0B2;
-        }
-
-        /* ── Divider ── */
-        hr { border-color: #2D3748; margin: 0; }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # ── Global CSS (static/finsignal.css, linked once per page load) ─────────────
+    styles.inject()
 
 
     # ── LinkedIn session helpers ────────────────────────────────────────────────────
@@ -157,40 +60,37 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
             return {}
 
 
-    def init_linkedin_session() -> None:
+    def init_linkedin_session() -> "Future | None":
+        """Apply an OAuth redirect immediately; otherwise, once the cached
+        profile has expired, start refreshing it in the background and return
+        that future."""
         try:
             params = safe_get_query_params()
             if params.get("linkedin_connected") == "true":
-                st.session_state.linkedin_profile = {
-                    "name": params.get("name", ""),
-                    "email": params.get("email", ""),
-                    "picture_url": params.get("picture", ""),
-                }
-                st.session_state.linkedin_connected = True
+                profile_cache.mark_connected(
+                    name=params.get("name", ""),
+                    headline=params.get("email", ""),
+                    picture_url=params.get("picture", ""),
+                )
                 try:
                     st.query_params.clear()
                 except Exception:
                     pass
-            elif not st.session_state.get("linkedin_connected"):
-                # Try to restore from persisted token in backend DB
-                _profile = db.get_linkedin_profile()
-                if _profile.get("connected"):
-                    st.session_state.linkedin_profile = {
-                        "name": _profile.get("name", ""),
-                        "email": _profile.get("headline") or _profile.get("email", ""),
-                        "picture_url": _profile.get("picture_url", ""),
-                    }
-                    st.session_state.linkedin_connected = True
+            elif not profile_cache.is_fresh():
+                # Restore from the persisted token in the backend DB. Strict, so
+                # an unreachable backend is not mistaken for "not connected".
+                return background.submit(db.fetch_strict, db.get_linkedin_profile)
         except Exception as e:
             if "SessionInfo" in str(e) or "session" in str(e).lower():
                 st.rerun()
-            return
+        return None
 
 
     # ── Session state initialization ───────────────────────────────────────────────
 
     if "active_tab" not in st.session_state:
         st.session_state.active_tab = 0
+        db.ensure_tables()
 
     if "posts_range" not in st.session_state:
         st.session_state.posts_range = "7 Days"
@@ -198,40 +98,46 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
     if "comments_range" not in st.session_state:
         st.session_state.comments_range = "7 Days"
 
-    if "linkedin_connected" not in st.session_state:
-        st.session_state.linkedin_connected = False
-
-    if "linkedin_profile" not in st.session_state:
-        st.session_state.linkedin_profile = {}
+    # ── Background fetches ─────────────────────────────────────────────────────────
+    # Everything the header and metric cards need from the backend is requested
+    # here and collected after the shell (and, if still pending, the tab) has been
+    # drawn, so first paint never waits on the API.
 
-    if not st.session_state.get("linkedin_profile_checked"):
-        db.ensure_tables()
-        init_linkedin_session()
-        st.session_state.linkedin_profile_checked = True
+    _range_param = {"Today": "today", "7 Days": "7days", "30 Days": "30days"}
+    _range_labels = ["Today", "7 Days", "30 Days"]
 
+    profile_future = init_linkedin_session()
+    metrics_history.start()  # process-wide sampler behind the card sparklines
+    db.start_journal()       # replays mutations queued while the backend was down
+    db.start_replica()       # local read replica, when REPLICA_PATH is set
+    db.revalidate_in_background()  # /changes off the script thread: drops exactly the stale caches
+    events.start()           # backend change stream: patches caches, nudges sessions
+
+    # Both cards are served by one /metrics call covering both ranges. Ranges
+    # still in db's TTL cache (e.g. after a pr_*/cr_* chip click) are drawn
+    # straight away with no backend call.
+    posts_key      = _range_param[st.session_state.posts_range]
+    comments_key   = _range_param[st.session_state.comments_range]
+    metric_ranges  = sorted({posts_key, comments_key})
+    cached_metrics = db.peek_metrics(metric_ranges)
+    metrics_future = (
+        None if cached_metrics is not None
+        else background.submit(db.get_metrics_for_ranges, metric_ranges)
+    )
+    _empty_metrics = {"posts_count": 0, "comments_count": 0, "pending_comments": 0}
+    agent_future   = background.submit(agent_tracker.status)  # shared, cached for a few seconds
 
-    # ── Header ─────────────────────────────────────────────────────────────────────
-    header_left, header_right = st.columns([3, 1])
 
-    with header_left:
-        st.markdown(
-            """
-            <div style="display:flex;align-items:center;gap:10px;margin-bottom:4px;">
-                <span style="font-size:1.5rem;font-weight:800;color:#FAFAFA;">📊 FinSignal</span>
-            </div>
-            <div style="font-size:0.83rem;color:#6B7280;">
-                Empowering your voice with autonomous intelligence
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    # ── Header pieces that depend on the LinkedIn profile ─────────────────────────
 
-    with header_right:
-        if st.session_state.get("linkedin_connected"):
-            _lp   = st.session_state.get("linkedin_profile", {})
-            pic   = _lp.get("picture_url", "") or ""
-            name  = _lp.get("name", "") or "Connected"
-            title = _lp.get("email", "") or "LinkedIn"
+    def render_profile_chip(profile: dict, with_actions: bool = True) -> None:
+        """Profile chip, or the Connect button when disconnected. with_actions=False
+        draws a preview without the Disconnect button, so the chip can be redrawn
+        later in the same run without a duplicate widget key."""
+        if profile["connected"]:
+            pic   = profile["picture_url"]
+            name  = profile["name"] or "Connected"
+            title = profile["headline"] or "LinkedIn"
             if pic:
                 st.markdown(
                     f"""
@@ -260,22 +166,12 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
                     """,
                     unsafe_allow_html=True,
                 )
+            if not with_actions:
+                return
             st.markdown("<div style='height:4px'></div>", unsafe_allow_html=True)
             if st.button("🔌 Disconnect LinkedIn", key="btn_logout", use_container_width=True):
                 db.linkedin_logout()
-                for _key in [
-                    "linkedin_access_token",
-                    "linkedin_profile_name",
-                    "linkedin_profile_title",
-                    "linkedin_profile_picture_url",
-                    "linkedin_profile_checked",
-                    "linkedin_profile",
-                    "linkedin_connected",
-                    "linkedin_profile_picture",
-                    "linkedin_profile_email",
-                    "session_initialized",
-                ]:
-                    st.session_state.pop(_key, None)
+                profile_cache.mark_disconnected()
                 st.rerun()
         else:
             st.markdown(
@@ -291,87 +187,100 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
                 unsafe_allow_html=True,
             )
 
-    # LinkedIn connect warning banner
-    if not st.session_state.get("linkedin_connected"):
+    def render_li_banner(profile: dict) -> None:
+        # LinkedIn connect warning banner
+        if not profile["connected"]:
+            st.markdown(
+                f"""
+                <div class="li-banner">
+                    <span style="font-size:1.2rem;">⚠️</span>
+                    <span class="li-banner-text">
+                        <strong>Connect your LinkedIn account to enable posting.</strong>
+                        Approving posts and comments requires an active LinkedIn connection.
+                    </span>
+                    <a href="{API_URL}/auth/linkedin" target="_self"
+                       style="background:#F5A623;color:#0F1117;padding:6px 14px;border-radius:6px;
+                              font-size:0.8rem;font-weight:700;text-decoration:none;white-space:nowrap;">
+                        Connect LinkedIn →
+                    </a>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+
+
+    # ── Header ─────────────────────────────────────────────────────────────────────
+    header_left, header_right = st.columns([3, 1])
+
+    with header_left:
         st.markdown(
-            f"""
-            <div class="li-banner">
-                <span style="font-size:1.2rem;">⚠️</span>
-                <span class="li-banner-text">
-                    <strong>Connect your LinkedIn account to enable posting.</strong>
-                    Approving posts and comments requires an active LinkedIn connection.
-                </span>
-                <a href="{API_URL}/auth/linkedin" target="_self"
-                   style="background:#F5A623;color:#0F1117;padding:6px 14px;border-radius:6px;
-                          font-size:0.8rem;font-weight:700;text-decoration:none;white-space:nowrap;">
-                    Connect LinkedIn →
-                </a>
+            """
+            <div style="display:flex;align-items:center;gap:10px;margin-bottom:4px;">
+                <span style="font-size:1.5rem;font-weight:800;color:#FAFAFA;">📊 FinSignal</span>
+            </div>
+            <div style="font-size:0.83rem;color:#6B7280;">
+                Empowering your voice with autonomous intelligence
             </div>
             """,
             unsafe_allow_html=True,
         )
 
+    # A refresh in flight still shows the last known profile (without actions);
+    # only a session that has never fetched it gets the skeleton.
+    known_profile = profile_cache.peek()
+    with header_right:
+        profile_slot = st.empty()
+        if profile_future is None:
+            with profile_slot.container():
+                render_profile_chip(known_profile)
+        elif known_profile is not None:
+            with profile_slot.container():
+                render_profile_chip(known_profile, with_actions=False)
+        else:
+            profile_slot.markdown(
+                '<div class="profile-chip skeleton"><div class="skeleton-avatar"></div>'
+                '<div class="skeleton-line"></div></div>',
+                unsafe_allow_html=True,
+            )
+
+    banner_slot = st.empty()
+    if known_profile is not None:
+        with banner_slot.container():
+            render_li_banner(known_profile)
+
     st.markdown("<hr/>", unsafe_allow_html=True)
     st.markdown("<div style='height:12px'></div>", unsafe_allow_html=True)
 
     # ── Metrics row ────────────────────────────────────────────────────────────────
 
-    def _next_agent_run() -> str:
-        """Return countdown string to next scheduled agent run (ET approximation)."""
-        now_utc = datetime.now(timezone.utc)
-        now_et = now_utc - timedelta(hours=5)  # EST approximation
-        candidates = []
-        # Scraper: 6:00 AM ET
-        for day_offset in [0, 1]:
-            t = (now_et + timedelta(days=day_offset)).replace(hour=6, minute=0, second=0, microsecond=0)
-            if t > now_et:
-                candidates.append(t)
-                break
-        # Comments: 6:30 AM ET
-        for day_offset in [0, 1]:
-            t = (now_et + timedelta(days=day_offset)).replace(hour=6, minute=30, second=0, microsecond=0)
-            if t > now_et:
-                candidates.append(t)
-                break
-        # Research: every 4 hours at 2,6,10,14,18,22
-        for h in [2, 6, 10, 14, 18, 22]:
-            for day_offset in [0, 1]:
-                t = (now_et + timedelta(days=day_offset)).replace(hour=h, minute=0, second=0, microsecond=0)
-                if t > now_et:
-                    candidates.append(t)
-                    break
-        if not candidates:
-            return "—"
-        nxt = min(candidates)
-        delta = nxt - now_et
-        total_mins = int(delta.total_seconds() / 60)
-        h, m = divmod(total_mins, 60)
-        return f"{h}h {m}m" if h else f"{m}m"
-
-    _range_param = {"Today": "today", "7 Days": "7days", "30 Days": "30days"}
-    _range_labels = ["Today", "7 Days", "30 Days"]
-
-    posts_metrics    = db.get_metrics(time_range=_range_param[st.session_state.posts_range])
-    comments_metrics = db.get_metrics(time_range=_range_param[st.session_state.comments_range])
-
-    posts_count      = posts_metrics["posts_count"]
-    comments_count   = comments_metrics["comments_count"]
-    pending_comments = posts_metrics["pending_comments"]  # not range-filtered
+    def _metric_card(label: str, value, sub: str, series: str = "") -> str:
+        """Metric card markup; value=None draws the loading skeleton. `series`
+        names a metrics_history series for the sparkline and 24h delta (read
+        from memory, no backend call)."""
+        trend = ""
+        if series:
+            trend = (
+                f'<div class="metric-trend">{widgets.sparkline(metrics_history.series(series))}'
+                f'{widgets.trend_delta(metrics_history.delta(series))}</div>'
+            )
+        if value is None:
+            return (
+                f'<div class="metric-card skeleton"><div class="metric-label">{label}</div>'
+                f'<div class="metric-value"><span class="skeleton-line"></span></div>'
+                f'<div class="metric-sub">{sub}</div>{trend}</div>'
+            )
+        return (
+            f'<div class="metric-card"><div class="metric-label">{label}</div>'
+            f'<div class="metric-value">{value}</div>'
+            f'<div class="metric-sub">{sub}</div>{trend}</div>'
+        )
 
     c1, c2, c3 = st.columns(3)
 
     # ── Card 1: Posts ──────────────────────────────────────────────────────────
     with c1:
-        st.markdown(
-            f"""
-            <div class="metric-card">
-                <div class="metric-label">Posts</div>
-                <div class="metric-value">{posts_count}</div>
-                <div class="metric-sub">posted to LinkedIn</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        posts_slot = st.empty()
+        posts_slot.markdown(_metric_card("Posts", None, "posted to LinkedIn", f"posts_count:{posts_key}"), unsafe_allow_html=True)
         if st.button("View Posts →", key="nav_to_posts", use_container_width=True):
             st.session_state.active_tab = 0
             st.rerun()
@@ -391,16 +300,8 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
 
     # ── Card 2: Comments ───────────────────────────────────────────────────────
     with c2:
-        st.markdown(
-            f"""
-            <div class="metric-card">
-                <div class="metric-label">Comments</div>
-                <div class="metric-value">{comments_count}</div>
-                <div class="metric-sub">posted to LinkedIn</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        comments_slot = st.empty()
+        comments_slot.markdown(_metric_card("Comments", None, "posted to LinkedIn", f"comments_count:{comments_key}"), unsafe_allow_html=True)
         if st.button("View Comments →", key="nav_to_comments", use_container_width=True):
             st.session_state.active_tab = 1
             st.rerun()
@@ -418,26 +319,14 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
                     st.session_state.active_tab = 1
                     st.rerun()
 
-    # ── Card 3: Next Agent Run ─────────────────────────────────────────────────
+    # ── Card 3: Agent runs ─────────────────────────────────────────────────────
+    # Drawn by fill_shell once the status fetch lands (see agent_card below).
     with c3:
-        countdown = _next_agent_run()
-        st.markdown(
-            f"""
-            <div class="metric-card">
-                <div class="metric-label">Next Agent Run</div>
-                <div class="metric-value" style="font-size:1.5rem;">{countdown}</div>
-                <div class="metric-sub">scraper · research · comments</div>
-            </div>
-            """,
+        agent_slot = st.empty()
+        agent_slot.markdown(
+            _metric_card("Next Agent Run", None, "scraper · research · comments"),
             unsafe_allow_html=True,
         )
-        if st.button("▶ Run All Agents", key="run_all_agents", use_container_width=True):
-            try:
-                import requests as _req
-                _req.post(f"{API_URL}/agents/run-all", timeout=5)
-                st.toast("🚀 All agents started — scraper, comments, research")
-            except Exception:
-                st.error("Failed to start agents")
 
     st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
     st.markdown("<hr/>", unsafe_allow_html=True)
@@ -465,40 +354,129 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
         if st.button("🚀 Generate Post", key="compose_generate", type="primary", use_container_width=True):
             if compose_prompt and compose_prompt.strip():
                 with st.spinner("Generating post with your voice..."):
-                    try:
-                        import requests as _req
-                        r = _req.post(
-                            f"{API_URL}/compose",
-                            json={"prompt": compose_prompt.strip()},
-                            timeout=30,
-                        )
-                        data = r.json()
-                        if data.get("ok"):
-                            st.toast(f"✅ Post created: {data.get('title', 'New post')}")
-                            st.session_state.active_tab = 0
-                            st.rerun()
-                        else:
-                            st.error(f"Failed: {data.get('error', 'Unknown error')}")
-                    except Exception as e:
-                        st.error(f"Error: {e}")
+                    data = db.compose_post(compose_prompt.strip())
+                    if data.get("ok"):
+                        st.toast(f"✅ Post created: {data.get('title', 'New post')}")
+                        st.session_state.active_tab = 0
+                        st.rerun()
+                    else:
+                        st.error(f"Failed: {data.get('error', 'Unknown error')}")
             else:
                 st.warning("Enter a prompt first")
 
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
 
+    # ── Deferred shell fill ────────────────────────────────────────────────────────
+    # Fills the profile chip, banner and metric cards from the background fetches.
+    # Called once without waiting (whatever has already arrived is drawn before the
+    # tab) and once more after the tab, blocking on anything still outstanding.
+
+    _filled: set[str] = set()
+
+    def agent_card(poll_every: float) -> None:
+        """Agent status card and trigger. A fragment, so status polling reruns
+        only this card: every AGENT_POLL_SECONDS while a run is active,
+        AGENT_IDLE_POLL_SECONDS otherwise."""
+
+        @st.experimental_fragment(run_every=poll_every)
+        def card() -> None:
+            current = agent_tracker.status()
+            active  = agent_tracker.is_active(current)
+            if st.session_state.get("agents_active") and not active:
+                # Run finished: new posts/comments, so refresh the header numbers
+                # and drop back to the idle poll rate.
+                st.session_state.agents_active = False
+                db.invalidate_metrics()
+                st.rerun()
+            st.session_state.agents_active = active
+
+            st.markdown(
+                f"""
+                <div class="metric-card">
+                    <div class="metric-label">{"Agents Running" if active else "Next Agent Run"}</div>
+                    <div class="metric-value" style="font-size:1.5rem;">{agent_tracker.countdown(current)}</div>
+                    <div class="metric-sub">scraper · research · comments</div>
+                    {agent_tracker.timeline_html(current) if active or current else ""}
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+            if st.button(
+                "⏳ Agents running…" if active else "▶ Run All Agents",
+                key="run_all_agents", use_container_width=True, disabled=active,
+            ):
+                started, message = agent_tracker.trigger()
+                if started:
+                    st.toast(message)
+                    st.session_state.agents_active = True
+                    st.rerun()  # full rerun re-registers the fragment at the fast poll rate
+                else:
+                    st.warning(message)
+
+        card()
+
+    def draw_metrics(by_range: dict) -> None:
+        posts_slot.markdown(
+            _metric_card("Posts", by_range[posts_key]["posts_count"], "posted to LinkedIn", f"posts_count:{posts_key}"),
+            unsafe_allow_html=True,
+        )
+        comments_slot.markdown(
+            _metric_card("Comments", by_range[comments_key]["comments_count"], "posted to LinkedIn", f"comments_count:{comments_key}"),
+            unsafe_allow_html=True,
+        )
+        # not range-filtered; remembered so the tab label survives a slow fetch
+        st.session_state.pending_comments = by_range[posts_key]["pending_comments"]
+
+    def fill_shell(wait: bool) -> None:
+        if profile_future is not None and "profile" not in _filled and (wait or profile_future.done()):
+            fetched = background.result(profile_future, None)
+            profile = profile_cache.store(fetched) if fetched is not None else profile_cache.current()
+            with profile_slot.container():
+                render_profile_chip(profile)
+            with banner_slot.container():
+                render_li_banner(profile)
+            _filled.add("profile")
+        if metrics_future is not None and "metrics" not in _filled and (wait or metrics_future.done()):
+            draw_metrics(background.result(metrics_future, {r: _empty_metrics for r in metric_ranges}))
+            _filled.add("metrics")
+        if "agents" not in _filled and (wait or agent_future.done()):
+            with agent_slot.container():
+                agent_card(agent_tracker.poll_interval(background.result(agent_future, None)))
+            _filled.add("agents")
+
+    if cached_metrics is not None:
+        draw_metrics(cached_metrics)
+    fill_shell(wait=False)
+
+    # Background saves (write_behind) that the backend rejected since the last run.
+    for failure in write_behind.pop_failures():
+        st.error(f"⚠ {failure} — the change was not saved.")
+
+    # Offline journal: changes waiting for the backend, and replays that did not apply.
+    queued_offline = journal.pending_count()
+    if queued_offline:
+        st.warning(
+            f"📴 {queued_offline} change{'s' if queued_offline != 1 else ''} saved locally — "
+            "they will be sent in order as soon as the backend is reachable."
+        )
+    for problem in journal.problems():
+        msg_col, btn_col = st.columns([8, 1])
+        with msg_col:
+            st.error(f"⚠ {problem['label'] or problem['path']} was not applied: {problem['error']}")
+        with btn_col:
+            if st.button("Dismiss", key=f"journal_dismiss_{problem['id']}"):
+                journal.dismiss(problem["id"])
+                st.rerun()
+
     # ── Custom tab nav ─────────────────────────────────────────────────────────────
-    pending_count = pending_comments
-    tab_labels = [
-        "📝  Content Queue",
-        f"💬  Comment Queue{f'  ({pending_count})' if pending_count else ''}",
-        "🤝  Influencers",
-        "⚙️  Strategy",
-        "📊  Analytics",
-        "🔗  Connections",
-    ]
-
-    t1, t2, t3, t4, t5, t6 = st.columns(6)
-    tab_cols = [t1, t2, t3, t4, t5, t6]
+    # Pending count comes from this run's metrics if they have arrived, otherwise
+    # from the last run that had them.
+    pending_count = st.session_state.get("pending_comments", 0)
+    tab_labels = [p.label for p in page_registry.PAGES]
+    if pending_count:
+        tab_labels[page_registry.COMMENT_QUEUE] += f"  ({pending_count})"
+
+    tab_cols = st.columns(len(tab_labels))
 
     for i, (col, label) in enumerate(zip(tab_cols, tab_labels)):
         with col:
@@ -515,20 +493,72 @@ try:  # ── Wrap entire app body to catch SessionInfo errors ─────
     st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
 
     # ── Tab content ────────────────────────────────────────────────────────────────
-    active = st.session_state.active_tab
-
-    if active == 0:
-        content_queue.render(api_url=API_URL)
-    elif active == 1:
-        comment_queue.render(api_url=API_URL)
-    elif active == 2:
-        influencer_manager.render()
-    elif active == 3:
-        strategy_manager.render()
-    elif active == 4:
-        analytics.render(api_url=API_URL)
-    elif active == 5:
-        connections.render()
+    # Only the active tab's module is imported (see page_registry).
+    page = page_registry.PAGES[st.session_state.active_tab]
+    auto_refresh = False
+    if page.watches and not events.connected():
+        _, toggle_col = st.columns([5, 1])
+        with toggle_col:
+            auto_refresh = st.toggle(
+                "Auto-refresh", key="auto_refresh",
+                help="Check for new rows in the background; slows down while nothing changes.",
+            )
+
+    page_registry.render(st.session_state.active_tab, api_url=API_URL)
+
+    # ── Change listener ───────────────────────────────────────────────────────────
+    # While the event stream is up, a tiny fragment compares in-memory topic
+    # versions and reruns the session only when something this tab shows changed.
+    if events.connected():
+        watched = page.watches + page_registry.ALWAYS_WATCHED
+
+        @st.experimental_fragment(run_every=events.EVENTS_NUDGE_SECONDS)
+        def change_listener() -> None:
+            seen = events.version(watched)
+            if st.session_state.events_seen.get(watched) != seen:
+                st.rerun()
+
+        st.session_state.setdefault("events_seen", {})[watched] = events.version(watched)
+        change_listener()
+
+    # ── Auto-refresh ──────────────────────────────────────────────────────────────
+    # Without the event stream, an opted-in session starts a /changes check in
+    # the background (one throttled call per process) when its interval is due,
+    # and every tick compares the sequences the last check saw (memory only).
+    # Rows are refetched only when the tab's resources moved; each due check
+    # doubles the interval up to AUTO_REFRESH_MAX_SECONDS until one does. A
+    # hidden browser tab makes no checks, and is checked as soon as it is shown
+    # again. Backends without /changes get a plain rerun every
+    # AUTO_REFRESH_MAX_SECONDS.
+    elif auto_refresh:
+        watched = page.watches
+        st.session_state.auto_refresh_seen = db.change_versions(watched)
+        st.session_state.setdefault("auto_refresh_every", AUTO_REFRESH_MIN_SECONDS)
+        st.session_state.auto_refresh_next = time.monotonic() + st.session_state.auto_refresh_every
+
+        @st.experimental_fragment(run_every=AUTO_REFRESH_MIN_SECONDS)
+        def auto_refresher() -> None:
+            state = st.session_state
+            if not widgets.page_visible("auto_refresh_visible"):
+                return
+            current = db.change_versions(watched)
+            if current is not None:
+                if state.auto_refresh_seen is not None and current != state.auto_refresh_seen:
+                    state.auto_refresh_every = AUTO_REFRESH_MIN_SECONDS
+                    st.rerun()
+                state.auto_refresh_seen = current
+            if time.monotonic() < state.auto_refresh_next:
+                return
+            if current is None:
+                state.auto_refresh_every = AUTO_REFRESH_MAX_SECONDS
+                st.rerun()
+            db.revalidate_in_background()
+            state.auto_refresh_every = min(state.auto_refresh_every * 2, AUTO_REFRESH_MAX_SECONDS)
+            state.auto_refresh_next = time.monotonic() + state.auto_refresh_every
+
+        auto_refresher()
+
+    fill_shell(wait=True)
 
 except Exception as _app_err:
     _err_str = str(_app_err)
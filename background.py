@@ -0,0 +1,38 @@
+"""
+FinSignal UI — Background fetches.
+A process-wide thread pool for backend calls that should not block painting.
+Submit early in the script run, draw the layout, then collect the results and
+fill the reserved placeholders. Work submitted here must not touch st.*: pool
+threads have no script-run context.
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "8"))
+
+_pool = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="finsignal-bg")
+
+
+def submit(fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+    return _pool.submit(fn, *args, **kwargs)
+
+
+def result(future: "Future[T]", default: T, timeout: float | None = None) -> T:
+    """Wait for `future` and return its value, or `default` if it raised or timed out."""
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeout:
+        print("[background] fetch timed out")
+        return default
+    except Exception as e:
+        print(f"[background] fetch failed: {e}")
+        return default
+
+
+def ready(future: "Future[T] | None") -> bool:
+    """True once `future` has finished successfully (never blocks)."""
+    return future is not None and future.done() and future.exception() is None
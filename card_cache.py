@@ -0,0 +1,81 @@
+"""
+FinSignal UI — Card HTML cache.
+Process-wide LRU of rendered card / row HTML, shared by every session.
+Entries are keyed by (kind, row id, row version, fingerprint) so a row that
+has not changed since the last rerun skips all of its string work.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+CARD_CACHE_SIZE = int(os.getenv("CARD_CACHE_SIZE", "2048"))
+
+
+class LRUCache:
+    """Small thread-safe LRU; Streamlit runs each session on its own thread."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+        value = factory()
+        with self._lock:
+            self.misses += 1
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_cards = LRUCache(CARD_CACHE_SIZE)
+
+
+def row_version(row: dict) -> str:
+    """Cheap version stamp for a row: updated_at when the backend sends it,
+    otherwise a digest of the row contents. Rows carrying an unflushed
+    write_behind change are tagged with its sequence number."""
+    stamp = row.get("updated_at")
+    if stamp:
+        pending = row.get("_pending")
+        return f"{stamp}#{pending}" if pending else str(stamp)
+    raw = json.dumps(row, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def fingerprint(*parts) -> str:
+    """Fingerprint for data shared by every card (e.g. the LinkedIn profile)."""
+    return "|".join(str(p or "") for p in parts)
+
+
+def cached(kind: str, row: dict, render: Callable[[], T], *extra: Hashable) -> T:
+    """Return render() for this row, reusing the cached result while the row,
+    and any extra key parts (profile fingerprint, selection state), are unchanged."""
+    key = (kind, row.get("id"), row_version(row), *extra)
+    return _cards.get_or_set(key, render)
+
+
+def clear() -> None:
+    _cards.clear()
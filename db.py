@@ -1,60 +1,342 @@
 """
 FinSignal UI — Data layer.
-All reads and writes go through the FastAPI backend API.
-Railway volumes are not shared between services, so the UI never connects
-to SQLite directly.
+All writes go through the FastAPI backend API. Reads go through a driver
+(drivers.py): HTTP by default. On single-host installs that share the
+backend's volume, DATA_DRIVER=sqlite reads the list endpoints straight from
+the backend's SQLite file, read-only. On Railway, volumes are not shared
+between services, so HTTP is the only option there. The UI's own local state
+is the offline mutation journal (journal.py) and the optional read replica
+(replica.py).
 """
 
+import hashlib
+import json as _json
 import os
-from typing import Optional
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Callable, Iterable, Optional, TypedDict, TypeVar
 
 import requests
 
+import background
+import drivers
+import journal
+import replica
+import shared_cache
+import write_behind
+from ttl_cache import TTLCache
+
+T = TypeVar("T")
+
 API_URL = os.getenv("API_URL", "https://web-production-d7d1d.up.railway.app")
 _TIMEOUT = 8
 _COPILOT_TIMEOUT = 45  # Co-pilot calls invoke Claude — needs longer timeout
+_COMPOSE_TIMEOUT = 30
+IDEMPOTENCY_REPLAY = float(os.getenv("IDEMPOTENCY_REPLAY_SECONDS", "15"))
+METRICS_TTL = float(os.getenv("METRICS_TTL_SECONDS", "30"))
+ANALYTICS_TTL = float(os.getenv("ANALYTICS_TTL_SECONDS", "60"))
+
+
+# ── Strict mode ───────────────────────────────────────────────────────────────
+# Getters normally swallow errors and return an empty result. Callers that need
+# to tell "no data" from "endpoint down" (e.g. to show a per-section error)
+# call them through fetch_strict(), which makes failed GETs raise instead.
+
+class BackendUnavailable(Exception):
+    """A GET failed while strict mode was on."""
+
+
+_local = threading.local()
+
+
+def fetch_strict(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Call a db getter with strict mode on for the current thread."""
+    previous = getattr(_local, "strict", False)
+    _local.strict = True
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _local.strict = previous
+
+
+# ── Idempotency ───────────────────────────────────────────────────────────────
+# Every mutating call carries an Idempotency-Key header derived from the action
+# (method + path), its payload, and the resource's current "epoch". The epoch
+# moves on whenever a different action or payload hits the same resource, so
+# a repeat of the same action shares a key, while on → off → on gets three
+# distinct keys. A per-process nonce keeps keys from colliding across restarts.
+#
+# Identical submissions are also collapsed in-process: a call whose key is
+# already in flight waits for that call's outcome instead of sending again. A
+# successful outcome is replayed for IDEMPOTENCY_REPLAY seconds, which covers
+# a double click landing after the first rerun. Failures are never replayed,
+# so a retry goes back to the backend. Repeatable actions pass replay=False:
+# stateless flips (PUT .../toggle with no body) and anything a user may
+# legitimately run again with the same payload (run agents, generate,
+# rebalance, compose, copilot turns). Only concurrent duplicates collapse,
+# and the next run gets a fresh key.
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+_PROCESS_NONCE = uuid.uuid4().hex[:12]
+_mutations_lock = threading.Lock()
+_resource_epochs: dict[str, tuple[str, int]] = {}      # resource -> (last action, epoch)
+_outcomes: dict[str, tuple[float, Future]] = {}        # key -> (replay deadline, outcome)
+
+
+def _resource(path: str) -> str:
+    """/posts/12/publish → /posts/12, /voice-profile → /voice-profile."""
+    return "/".join(path.split("/")[:3])
+
+
+def idempotency_key(method: str, path: str, json: dict | None = None) -> str:
+    action = f"{method} {path} {_json.dumps(json or {}, sort_keys=True, default=str)}"
+    with _mutations_lock:
+        last, epoch = _resource_epochs.get(_resource(path), ("", 0))
+        if action != last:
+            epoch += 1
+            _resource_epochs[_resource(path)] = (action, epoch)
+    raw = f"{_PROCESS_NONCE}|{epoch}|{action}".encode()
+    return hashlib.sha256(raw).hexdigest()[:32]
+
+
+def _idempotent(
+    method: str, path: str, json: dict | None, send: Callable[[dict], dict], replay: bool = True,
+) -> dict:
+    """Run send(headers) once per idempotency key; duplicates share its outcome."""
+    key = idempotency_key(method, path, json)
+    now = time.monotonic()
+    with _mutations_lock:
+        for k in [k for k, (deadline, f) in _outcomes.items() if f.done() and deadline < now]:
+            del _outcomes[k]
+        entry = _outcomes.get(key)
+        owner = entry is None
+        if owner:
+            entry = (float("inf"), Future())
+            _outcomes[key] = entry
+    outcome = entry[1]
+    if not owner:
+        print(f"[db] {method} {path} collapsed into an identical submission")
+        return outcome.result()
+
+    result: dict = {"ok": False}
+    try:
+        result = send({IDEMPOTENCY_HEADER: key})
+    finally:
+        with _mutations_lock:
+            if not replay:
+                _outcomes.pop(key, None)
+                _, epoch = _resource_epochs.get(_resource(path), ("", 0))
+                _resource_epochs[_resource(path)] = ("", epoch)   # next flip: new epoch, new key
+            elif isinstance(result, dict) and result.get("ok") is False:
+                _outcomes.pop(key, None)
+            else:
+                _outcomes[key] = (time.monotonic() + IDEMPOTENCY_REPLAY, outcome)
+        outcome.set_result(result)
+    return result
 
 
 # ── HTTP helpers ──────────────────────────────────────────────────────────────
+# Every HTTP call reports to the journal's circuit breaker: transport failures
+# (connection refused, timeouts, 502/503/504) count toward opening it, and
+# any answer from the backend closes it. Reads served by the SQLite driver
+# say nothing about the API, so they do not report.
+
+def _unreachable(e: Exception) -> bool:
+    if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(e, "response", None)
+    return response is not None and response.status_code in (502, 503, 504)
+
+
+def _report(e: Exception | None) -> bool:
+    """Feed the circuit breaker; returns True when e means "backend unreachable"."""
+    if e is None:
+        journal.report_success()
+        return False
+    if _unreachable(e):
+        journal.report_failure()
+        return True
+    journal.report_success()
+    return False
+
+
+_http_driver, _sqlite_driver = drivers.from_env(API_URL, _TIMEOUT)
+
 
 def _get(path: str, **params) -> list | dict:
+    prefetched = _prefetched(path, params)
+    if prefetched is not None:
+        return prefetched
+    driver = _sqlite_driver if _sqlite_driver and _sqlite_driver.serves(path) else _http_driver
     try:
-        r = requests.get(f"{API_URL}{path}", params={k: v for k, v in params.items() if v is not None}, timeout=_TIMEOUT)
-        r.raise_for_status()
-        return r.json()
+        result = driver.get(path, params)
+        if driver is _http_driver:
+            _report(None)
+        return result
     except Exception as e:
-        print(f"[db] GET {path} failed: {e}")
+        print(f"[db] GET {path} failed ({driver.name}): {e}")
+        if driver is _http_driver:
+            _report(e)
+        if getattr(_local, "strict", False):
+            raise BackendUnavailable(f"GET {path} failed: {e}") from e
         return [] if path not in ("/metrics",) else {}
 
 
-def _post(path: str, json: dict | None = None, timeout: int = _TIMEOUT) -> dict:
-    try:
-        r = requests.post(f"{API_URL}{path}", json=json or {}, timeout=timeout)
-        r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        print(f"[db] POST {path} failed: {e}")
-        return {"ok": False, "error": str(e)}
+def _sender(method: str, path: str, json: dict | None = None, timeout: int = _TIMEOUT) -> Callable[[dict], dict]:
+    """send(headers) for a POST / PUT / DELETE; failures come back as ok=False,
+    with unreachable=True when the backend could not be reached at all."""
+    def send(headers: dict) -> dict:
+        try:
+            r = requests.request(
+                method, f"{API_URL}{path}", headers=headers, timeout=timeout,
+                json=None if method == "DELETE" else (json or {}),
+            )
+            r.raise_for_status()
+            _report(None)
+            _after_write(path)
+            return r.json()
+        except Exception as e:
+            print(f"[db] {method} {path} failed: {e}")
+            return {"ok": False, "error": str(e), "unreachable": _report(e)}
+    return send
 
 
-def _put(path: str, json: dict | None = None, timeout: int = _TIMEOUT) -> dict:
-    try:
-        r = requests.put(f"{API_URL}{path}", json=json or {}, timeout=timeout)
-        r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        print(f"[db] PUT {path} failed: {e}")
-        return {"ok": False}
+def _post(path: str, json: dict | None = None, timeout: int = _TIMEOUT, replay: bool = True) -> dict:
+    return _idempotent("POST", path, json, _sender("POST", path, json, timeout), replay)
+
+
+def _put(path: str, json: dict | None = None, timeout: int = _TIMEOUT, replay: bool = True) -> dict:
+    return _idempotent("PUT", path, json, _sender("PUT", path, json, timeout), replay)
 
 
 def _delete(path: str) -> dict:
+    return _idempotent("DELETE", path, None, _sender("DELETE", path))
+
+
+# ── Collections ───────────────────────────────────────────────────────────────
+# List endpoints by collection name (shared by the journal's conflict checks
+# and the read replica), and the path prefixes whose writes change each one.
+
+COLLECTIONS = {
+    "content":     "/content-queue",
+    "comments":    "/comment-queue",
+    "influencers": "/influencers",
+    "feeds":       "/feeds",
+    "topics":      "/topics",
+    "connections": "/connections",
+}
+
+_WRITE_PREFIXES = {
+    "/content-queue":         "content",
+    "/posts/":                "content",
+    "/comment-queue":         "comments",
+    "/comments/":             "comments",
+    "/influencers":           "influencers",
+    "/discover/suggestions/": "influencers",
+    "/feeds":                 "feeds",
+    "/discover/feeds/":       "feeds",
+    "/topics":                "topics",
+    "/connections":           "connections",
+}
+
+
+def _collection_of(path: str) -> Optional[str]:
+    return next((c for prefix, c in _WRITE_PREFIXES.items() if path.startswith(prefix)), None)
+
+
+# Shared-cache resources changed by writes under each prefix. Strategy saves
+# and voice field saves (PUT /voice-profile) patch their entry instead.
+_SHARED_PREFIXES = {
+    "/content-queue":   ("content_queue",),
+    "/posts/":          ("content_queue",),
+    "/comment-queue":   ("comment_queue",),
+    "/comments/":       ("comment_queue",),
+    "/topics":          ("topics",),
+    "/icp":             ("icp", "icp_history"),
+    "/feeds":           ("feeds",),
+    "/discover/feeds/": ("feeds",),
+    "/voice-profile/":  ("voice_profile", "voice_history"),
+}
+
+
+def _after_write(path: str) -> None:
+    """A write to `path` succeeded: drop what it made stale, for every session."""
+    replica.invalidate(_collection_of(path))
+    for prefix, resources in _SHARED_PREFIXES.items():
+        if path.startswith(prefix):
+            shared_cache.invalidate(*resources)
+
+
+def _shared(resource: str, load: Callable[[], list | dict]) -> list | dict:
+    """load() through the process-wide shared cache (one fetch for all
+    sessions). Failed loads are not cached; they return [] like _get, or
+    raise BackendUnavailable in strict mode."""
     try:
-        r = requests.delete(f"{API_URL}{path}", timeout=_TIMEOUT)
-        r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        print(f"[db] DELETE {path} failed: {e}")
-        return {"ok": False}
+        return shared_cache.get_or_load(resource, lambda: fetch_strict(load))
+    except BackendUnavailable:
+        if getattr(_local, "strict", False):
+            raise
+        return []
+
+
+def _list(collection: str, **params) -> list | dict:
+    """A list endpoint, from the read replica when it can answer, else the backend."""
+    rows = replica.rows(collection, **params)
+    return rows if rows is not None else _get(COLLECTIONS[collection], **params)
+
+
+def start_replica() -> None:
+    """Start syncing the local read replica (no-op unless REPLICA_PATH is set)."""
+    replica.start(lambda path, **params: fetch_strict(_get, path, **params), COLLECTIONS)
+
+
+# ── Offline journal ───────────────────────────────────────────────────────────
+# Triage mutations go through _journaled(): when the backend is unreachable
+# (or earlier journaled work is still queued) they are written to the local
+# journal and replayed in order by journal.py, instead of failing. The caller
+# gets {"ok": True, "queued": True} and the getters overlay the change.
+
+
+
+def _journaled(
+    method: str, path: str, json: dict | None = None, *,
+    collection: str, row_id: int, patch: dict | None = None, label: str = "", kind: str = "request",
+) -> dict:
+    write_behind.flush_row(collection, row_id)   # a held edit of this row goes first
+    if not journal.holding():
+        send = _publish_sender(path) if kind == "publish" else _sender(method, path, json)
+        result = _idempotent(method, path, json, send)
+        if not result.get("unreachable"):
+            return result
+    key = idempotency_key(method, path, json)
+    journal.record(kind, method, path, json, key, collection=collection, row_id=row_id, patch=patch, label=label)
+    return {"ok": True, "queued": True}
+
+
+def _replay_send(entry: dict) -> dict:
+    """Send a journal entry with the idempotency key it was recorded under."""
+    if entry["kind"] == "publish":
+        send = _publish_sender(entry["path"])
+    else:
+        send = _sender(entry["method"], entry["path"], entry["body"])
+    return send({IDEMPOTENCY_HEADER: entry["key"]})
+
+
+def _journal_versions(collection: str) -> dict | None:
+    """{row id: updated_at} straight from the backend (no overlays), None if unreachable."""
+    try:
+        rows = fetch_strict(_get, COLLECTIONS[collection])
+    except BackendUnavailable:
+        return None
+    return {r.get("id"): r.get("updated_at") or "" for r in rows} if isinstance(rows, list) else {}
+
+
+def start_journal() -> None:
+    """Start replaying journaled mutations (once per process)."""
+    journal.start(_replay_send, _journal_versions)
 
 
 # ── Init (no-op — backend owns the schema) ────────────────────────────────────
@@ -70,68 +352,238 @@ def get_metrics(time_range: str = "7days") -> dict:
     result = _get("/metrics", **{"range": time_range})
     if not isinstance(result, dict):
         result = {}
+    return _metrics_from(result)
+
+
+def _metrics_from(result: dict, pending: int | None = None) -> dict:
     return {
         "posts_count":      result.get("posts_count", 0),
         "comments_count":   result.get("comments_count", 0),
-        "pending_comments": result.get("pending_comments", 0),
+        "pending_comments": result.get("pending_comments", pending or 0),
     }
 
 
+_metrics_cache: TTLCache[dict] = TTLCache(METRICS_TTL)
+_multi_range_supported = True
+
+
+def peek_metrics(ranges: list[str]) -> dict[str, dict] | None:
+    """Cached metrics for every range in `ranges`, or None if any is missing/expired."""
+    out = {r: _metrics_cache.get(r) for r in ranges}
+    return None if any(v is None for v in out.values()) else out
+
+
+def get_metrics_for_ranges(ranges: list[str]) -> dict[str, dict]:
+    """Metrics for several ranges at once, cached per range for METRICS_TTL seconds.
+
+    Uncached ranges are requested in one call (?ranges=a,b); the backend answers
+    {"ranges": {range: {...}}, "pending_comments": n}. Backends without that
+    support return a single-range payload for ?range=, which is used for the
+    first range; any others then fall back to one call each. Failed calls are
+    not cached.
+    """
+    global _multi_range_supported
+    out     = {r: _metrics_cache.get(r) for r in ranges}
+    missing = [r for r, v in out.items() if v is None]
+    if not missing:
+        return out
+
+    params = {"range": missing[0]}
+    if _multi_range_supported and len(missing) > 1:
+        params["ranges"] = ",".join(missing)
+    result = _get("/metrics", **params)
+
+    if isinstance(result, dict) and isinstance(result.get("ranges"), dict):
+        pending = result.get("pending_comments")
+        for r in missing:
+            out[r] = _metrics_from(result["ranges"].get(r) or {}, pending)
+            _metrics_cache.set(r, out[r])
+        return out
+
+    if "ranges" in params:
+        _multi_range_supported = False
+    if isinstance(result, dict) and result:
+        out[missing[0]] = _metrics_from(result)
+        _metrics_cache.set(missing[0], out[missing[0]])
+    else:
+        out[missing[0]] = _metrics_from({})
+    for r in missing[1:]:
+        result = _get("/metrics", **{"range": r})
+        if isinstance(result, dict) and result:
+            out[r] = _metrics_from(result)
+            _metrics_cache.set(r, out[r])
+        else:
+            out[r] = _metrics_from({})
+    return out
+
+
+PUSHED_METRICS_TTL = float(os.getenv("PUSHED_METRICS_TTL_SECONDS", "300"))
+
+
+def set_push_updates(active: bool) -> None:
+    """events.py connected (or lost) its stream. While it is connected, queue
+    changes invalidate the metrics, so they can be cached far longer."""
+    _metrics_cache.ttl = PUSHED_METRICS_TTL if active else METRICS_TTL
+
+
+def invalidate_metrics() -> None:
+    _metrics_cache.invalidate()
+
+
 def get_pending_comment_count() -> int:
-    return get_metrics().get("pending_comments", 0)
+    return get_metrics_for_ranges(["7days"])["7days"]["pending_comments"]
 
 
 # ── Content Queue ─────────────────────────────────────────────────────────────
 
 def get_content_queue(status: Optional[str] = None) -> list[dict]:
-    result = _get("/content-queue", status=status)
-    return result if isinstance(result, list) else []
+    result = _list("content", status=status)
+    return journal.apply("content", write_behind.apply("content", result)) if isinstance(result, list) else []
+
+
+def get_queue_snapshot(collection: str) -> list[dict]:
+    """Every row of the "content" or "comments" queue, through the shared cache.
+    The analytics rollups, the pipeline rollups and the summary fallback all
+    read the queues this way, so the Analytics tab costs one fetch per queue."""
+    resource = "content_queue" if collection == "content" else "comment_queue"
+    result = _shared(resource, lambda: _list(collection))
+    return journal.apply(collection, write_behind.apply(collection, result)) if isinstance(result, list) else []
 
 
 def compose_post(prompt: str) -> dict:
-    return _post("/compose", json={"prompt": prompt})
+    return _post("/compose", json={"prompt": prompt}, timeout=_COMPOSE_TIMEOUT, replay=False)
 
 
 def update_content_status(row_id: int, status: str) -> None:
-    _put(f"/content-queue/{row_id}/status", {"status": status})
+    _journaled("PUT", f"/content-queue/{row_id}/status", {"status": status},
+               collection="content", row_id=row_id, patch={"status": status}, label="Post status change")
 
 
 def update_content_body(row_id: int, body: str) -> None:
-    _put(f"/content-queue/{row_id}", {"body": body})
+    write_behind.submit(
+        f"content:{row_id}:body",
+        lambda: _journaled("PUT", f"/content-queue/{row_id}", {"body": body},
+                           collection="content", row_id=row_id, patch={"body": body}, label="Post edit"),
+        collection="content", row_id=row_id, patch={"body": body},
+        label="Saving the post edit",
+    )
 
 
 def delete_content(row_id: int) -> None:
-    _delete(f"/content-queue/{row_id}")
+    _journaled("DELETE", f"/content-queue/{row_id}", collection="content", row_id=row_id, label="Post delete")
+
+
+def delete_post(row_id: int) -> None:
+    _journaled("DELETE", f"/posts/{row_id}", collection="content", row_id=row_id, label="Post delete")
 
 
 def schedule_post(row_id: int, scheduled_at: str) -> dict:
-    return _post(f"/posts/{row_id}/schedule", {"scheduled_at": scheduled_at})
+    return _journaled(
+        "POST", f"/posts/{row_id}/schedule", {"scheduled_at": scheduled_at},
+        collection="content", row_id=row_id, patch={"status": "scheduled", "scheduled_at": scheduled_at},
+        label="Post schedule",
+    )
+
+
+_PUBLISH_TIMEOUT = 20
+_PUBLISH_UNKNOWN = "No answer from the backend in time — it may have posted. Check LinkedIn before retrying."
+
+
+def _publish_sender(path: str) -> Callable[[dict], dict]:
+    """send(headers) for a call that posts to LinkedIn. A read timeout means
+    the request reached the backend, so the outcome is unknown: it comes back
+    as unknown=True, never unreachable, so it is not journaled and replayed
+    (the backend does not honour Idempotency-Key; a replay could post twice)."""
+    def send(headers: dict) -> dict:
+        try:
+            r = requests.post(f"{API_URL}{path}", headers=headers, timeout=_PUBLISH_TIMEOUT)
+            data = r.json() if r.content else {}
+        except requests.ReadTimeout as e:
+            print(f"[db] POST {path} timed out waiting for the answer: {e}")
+            _report(e)
+            return {"ok": False, "error": _PUBLISH_UNKNOWN, "reconnect": False, "unknown": True}
+        except Exception as e:
+            print(f"[db] POST {path} failed: {e}")
+            return {"ok": False, "error": str(e), "reconnect": False, "unreachable": _report(e)}
+        if r.status_code in (502, 503, 504):
+            journal.report_failure()
+            return {"ok": False, "error": f"Backend unavailable ({r.status_code})", "reconnect": False, "unreachable": True}
+        _report(None)
+        _after_write(path)
+        if not isinstance(data, dict):
+            data = {}
+        data.setdefault("ok", r.ok)
+        data["reconnect"] = data.get("action") == "reconnect" or r.status_code == 401
+        return data
+    return send
+
+
+def _publish(path: str) -> dict:
+    """POST a call that posts to LinkedIn. Unlike _post, keeps the backend's
+    error body on a non-2xx answer and flags an expired LinkedIn session as
+    reconnect=True."""
+    return _idempotent("POST", path, None, _publish_sender(path))
+
+
+def publish_post(row_id: int) -> dict:
+    write_behind.flush_row("content", row_id)   # publish the edited body, not the old one
+    return _publish(f"/posts/{row_id}/publish")
+
+
+def publish_linkedin_draft(row_id: int) -> dict:
+    write_behind.flush_row("content", row_id)
+    return _publish(f"/posts/{row_id}/publish-draft")
 
 
 # ── Comment Queue ─────────────────────────────────────────────────────────────
 
 def get_comment_queue(status: Optional[str] = None) -> list[dict]:
-    result = _get("/comment-queue", status=status)
-    return result if isinstance(result, list) else []
+    result = _list("comments", status=status)
+    return journal.apply("comments", write_behind.apply("comments", result)) if isinstance(result, list) else []
+
+
+def approve_comment(row_id: int) -> dict:
+    """Approve and post a comment to LinkedIn (queued=True when journaled offline)."""
+    return _journaled(
+        "POST", f"/comments/{row_id}/approve", kind="publish",
+        collection="comments", row_id=row_id, patch={"status": "posted"}, label="Comment approval",
+    )
+
+
+def ignore_comment(row_id: int) -> dict:
+    return _journaled("POST", f"/comments/{row_id}/ignore",
+                      collection="comments", row_id=row_id, patch={"status": "ignored"}, label="Comment ignore")
 
 
 def update_comment_status(row_id: int, status: str) -> None:
-    _put(f"/comment-queue/{row_id}/status", {"status": status})
+    _journaled("PUT", f"/comment-queue/{row_id}/status", {"status": status},
+               collection="comments", row_id=row_id, patch={"status": status}, label="Comment status change")
 
 
 def update_comment_text(row_id: int, text: str) -> None:
-    _put(f"/comment-queue/{row_id}", {"comment_text": text})
+    write_behind.submit(
+        f"comment:{row_id}:text",
+        lambda: _journaled("PUT", f"/comment-queue/{row_id}", {"comment_text": text},
+                           collection="comments", row_id=row_id, patch={"comment_text": text},
+                           label="Comment edit"),
+        collection="comments", row_id=row_id, patch={"comment_text": text},
+        label="Saving the comment edit",
+    )
 
 
 def schedule_comment(row_id: int, scheduled_at: str) -> dict:
-    return _post(f"/comments/{row_id}/schedule", {"scheduled_at": scheduled_at})
+    return _journaled(
+        "POST", f"/comments/{row_id}/schedule", {"scheduled_at": scheduled_at},
+        collection="comments", row_id=row_id, patch={"status": "scheduled", "scheduled_at": scheduled_at},
+        label="Comment schedule",
+    )
 
 
 # ── Influencers ───────────────────────────────────────────────────────────────
 
 def get_influencers(status: Optional[str] = None) -> list[dict]:
-    result = _get("/influencers", status=status)
-    return result if isinstance(result, list) else []
+    result = _list("influencers", status=status)
+    return journal.apply("influencers", write_behind.apply("influencers", result)) if isinstance(result, list) else []
 
 
 def add_influencer(name: str, linkedin_handle: str, niche: str, notes: str = "", headline: str = "") -> None:
@@ -144,12 +596,23 @@ def add_influencer(name: str, linkedin_handle: str, niche: str, notes: str = "",
     })
 
 
+def _set_influencer_status(row_id: int, action: str, status: str) -> None:
+    # hibernate/activate share one key: the last click wins.
+    write_behind.submit(
+        f"influencer:{row_id}:status",
+        lambda: _journaled("PUT", f"/influencers/{row_id}/{action}", collection="influencers",
+                           row_id=row_id, patch={"status": status}, label=f"Influencer {action}"),
+        collection="influencers", row_id=row_id, patch={"status": status},
+        label=f"Updating the influencer ({action})",
+    )
+
+
 def hibernate_influencer(row_id: int) -> None:
-    _put(f"/influencers/{row_id}/hibernate")
+    _set_influencer_status(row_id, "hibernate", "hibernated")
 
 
 def activate_influencer(row_id: int) -> None:
-    _put(f"/influencers/{row_id}/activate")
+    _set_influencer_status(row_id, "activate", "active")
 
 
 def delete_influencer(row_id: int) -> dict:
@@ -164,7 +627,7 @@ def get_discover_suggestions() -> list[dict]:
 
 
 def trigger_discover_generate() -> dict:
-    return _post("/discover/generate")
+    return _post("/discover/generate", replay=False)
 
 
 def accept_discover_suggestion(row_id: int) -> dict:
@@ -183,7 +646,7 @@ def get_discover_pattern() -> dict:
 # ── Connections ───────────────────────────────────────────────────────────────
 
 def get_connections(status: Optional[str] = None) -> list[dict]:
-    result = _get("/connections", status=status)
+    result = _list("connections", status=status)
     return result if isinstance(result, list) else []
 
 
@@ -205,8 +668,8 @@ def get_recent_connections() -> list[dict]:
 # ── Feeds ─────────────────────────────────────────────────────────────────────
 
 def get_feeds(priority: Optional[str] = None) -> list[dict]:
-    result = _get("/feeds", priority=priority)
-    return result if isinstance(result, list) else []
+    result = _shared("feeds", lambda: _list("feeds")) if priority is None else _list("feeds", priority=priority)
+    return journal.apply("feeds", write_behind.apply("feeds", result)) if isinstance(result, list) else []
 
 
 def save_feed(
@@ -247,7 +710,13 @@ def update_feed(
 
 
 def toggle_feed_active(row_id: int, active: int) -> None:
-    _put(f"/feeds/{row_id}/toggle", {"active": active})
+    write_behind.submit(
+        f"feed:{row_id}:active",
+        lambda: _journaled("PUT", f"/feeds/{row_id}/toggle", {"active": active}, collection="feeds",
+                           row_id=row_id, patch={"active": active}, label="Feed pause/resume"),
+        collection="feeds", row_id=row_id, patch={"active": active},
+        label="Pausing/resuming the feed",
+    )
 
 
 def delete_feed(row_id: int) -> None:
@@ -262,7 +731,7 @@ def get_feed_suggestions() -> list[dict]:
 
 
 def generate_feed_suggestions() -> dict:
-    return _post("/discover/feeds/generate")
+    return _post("/discover/feeds/generate", replay=False)
 
 
 def accept_feed_suggestion(row_id: int) -> dict:
@@ -275,13 +744,23 @@ def dismiss_feed_suggestion(row_id: int) -> dict:
 
 # ── Strategy ──────────────────────────────────────────────────────────────────
 
+# Strategy config and voice profile are read on every Strategy rerun but only
+# change through the calls below. They live in the shared cache and are
+# patched (copy-on-write) on a successful save instead of being refetched.
+
 def get_strategy() -> dict:
-    result = _get("/strategy")
+    result = _shared("strategy", lambda: _get("/strategy"))
     return result if isinstance(result, dict) else {}
 
 
-def update_strategy(data: dict) -> None:
-    _put("/strategy", {"data": data})
+def update_strategy(data: dict) -> dict:
+    """Save the given keys only (the backend merges them into the config)."""
+    result = _put("/strategy", {"data": data})
+    if result.get("ok") is False:
+        shared_cache.invalidate("strategy")
+    else:
+        shared_cache.patch("strategy", lambda cfg: cfg.update(data))
+    return result
 
 
 def get_strategy_health() -> dict:
@@ -302,6 +781,125 @@ def get_strategy_health() -> dict:
 
 # ── Analytics ─────────────────────────────────────────────────────────────────
 
+class AnalyticsSummary(TypedDict):
+    """Every pipeline-health figure the Analytics tab shows."""
+    posts_this_week:    int
+    max_posts_week:     int
+    drafts_pending:     int
+    archived_this_week: int
+    min_quality_score:  int
+    comments_today:     int
+    max_comments_day:   int
+
+
+_DRAFT_STATUSES = ("draft", "draft_saved", "pending")
+
+_analytics_cache: TTLCache[AnalyticsSummary] = TTLCache(ANALYTICS_TTL)
+_summary_endpoint_supported = True
+
+
+def _summary_from(result: dict) -> AnalyticsSummary:
+    return {
+        "posts_this_week":    int(result.get("posts_this_week", 0)),
+        "max_posts_week":     int(result.get("max_posts_week", 8)),
+        "drafts_pending":     int(result.get("drafts_pending", 0)),
+        "archived_this_week": int(result.get("archived_this_week", 0)),
+        "min_quality_score":  int(result.get("min_quality_score", 7)),
+        "comments_today":     int(result.get("comments_today", 0)),
+        "max_comments_day":   int(result.get("max_comments_day", 5)),
+    }
+
+
+def _summary_fan_out() -> AnalyticsSummary:
+    """Assemble the summary from the per-resource endpoints, concurrently."""
+    health_f = background.submit(get_strategy_health)
+    cfg_f    = background.submit(get_strategy)
+    queue_f  = background.submit(get_queue_snapshot, "content")
+    health   = background.result(health_f, {})
+    cfg      = background.result(cfg_f, {})
+    queue    = background.result(queue_f, [])
+    return _summary_from({
+        **health,
+        "drafts_pending":    sum(1 for r in queue if r.get("status") in _DRAFT_STATUSES),
+        "min_quality_score": cfg.get("min_post_quality_score", 7),
+    })
+
+
+def get_analytics_summary() -> AnalyticsSummary:
+    """Pipeline-health summary in one round trip (GET /analytics/summary), cached
+    for ANALYTICS_TTL seconds. Falls back to fanning out over /strategy/health,
+    /strategy and /content-queue when the backend has no summary endpoint."""
+    global _summary_endpoint_supported
+    cached = _analytics_cache.get("summary")
+    if cached is not None:
+        return cached
+
+    result = None
+    if _summary_endpoint_supported:
+        try:
+            result = fetch_strict(_get, "/analytics/summary")
+        except BackendUnavailable as e:
+            # 404: older backend without the endpoint; stop asking. Anything
+            # else is treated as transient and retried on the next miss.
+            resp = getattr(e.__cause__, "response", None)
+            if resp is not None and resp.status_code == 404:
+                _summary_endpoint_supported = False
+    if isinstance(result, dict) and result:
+        summary = _summary_from(result)
+    else:
+        summary = _summary_fan_out()
+    _analytics_cache.set("summary", summary)
+    return summary
+
+
+def invalidate_analytics() -> None:
+    _analytics_cache.invalidate()
+
+
+# ── Agents ─────────────────────────────────────────────────────────────────────
+
+def _agent_run_from(raw: dict) -> dict:
+    return {
+        "agent":       raw.get("agent") or raw.get("name", ""),
+        "state":       raw.get("state") or raw.get("status", "idle"),
+        "started_at":  raw.get("started_at"),
+        "finished_at": raw.get("finished_at"),
+        "items":       raw.get("items", raw.get("items_processed")),
+        "error":       raw.get("error", ""),
+    }
+
+
+_agent_status_supported = True
+
+
+def get_agent_status() -> Optional[dict]:
+    """Latest run per agent plus the next scheduled run (GET /agents/status):
+    {"runs": [...], "next_run": ISO timestamp or None, "next_agent": str}.
+    None when the backend can't say — unreachable, or an older backend
+    without the endpoint (a 404 is remembered and not asked again)."""
+    global _agent_status_supported
+    if not _agent_status_supported:
+        return None
+    try:
+        result = fetch_strict(_get, "/agents/status")
+    except BackendUnavailable as e:
+        resp = getattr(e.__cause__, "response", None)
+        if resp is not None and resp.status_code == 404:
+            _agent_status_supported = False
+        return None
+    if not isinstance(result, dict):
+        return None
+    return {
+        "runs":       [_agent_run_from(r) for r in result.get("runs", []) if isinstance(r, dict)],
+        "next_run":   result.get("next_run"),
+        "next_agent": result.get("next_agent", ""),
+    }
+
+
+def run_all_agents() -> dict:
+    return _post("/agents/run-all", timeout=5, replay=False)
+
+
 # ── LinkedIn OAuth ─────────────────────────────────────────────────────────────
 
 def get_linkedin_profile() -> dict:
@@ -333,16 +931,23 @@ def score_post(text: str) -> dict:
 # ── Topics ─────────────────────────────────────────────────────────────────────
 
 def get_topics() -> list[dict]:
-    result = _get("/topics")
-    return result if isinstance(result, list) else []
+    result = _shared("topics", lambda: _list("topics"))
+    return write_behind.apply("topics", result) if isinstance(result, list) else []
 
 
 def toggle_topic_active(row_id: int) -> dict:
-    return _put(f"/topics/{row_id}/toggle")
+    write_behind.submit(
+        f"topic:{row_id}:active",
+        lambda: _put(f"/topics/{row_id}/toggle", replay=False),
+        collection="topics", row_id=row_id, flip=True,
+        patch=lambda row: {"active": 0 if row.get("active") else 1},
+        label="Toggling the topic",
+    )
+    return {"ok": True, "queued": True}
 
 
 def rebalance_topics() -> dict:
-    return _put("/topics/rebalance")
+    return _put("/topics/rebalance", replay=False)
 
 
 def delete_topic(row_id: int) -> dict:
@@ -350,12 +955,15 @@ def delete_topic(row_id: int) -> dict:
 
 
 def start_topic_copilot(user_message: str) -> dict:
-    result = _post("/topics/copilot/start", {"user_message": user_message}, timeout=_COPILOT_TIMEOUT)
+    result = _post("/topics/copilot/start", {"user_message": user_message}, timeout=_COPILOT_TIMEOUT, replay=False)
     return result if isinstance(result, dict) else {"ok": False}
 
 
 def message_topic_copilot(conv_id: int, user_message: str) -> dict:
-    result = _post(f"/topics/copilot/{conv_id}/message", {"user_message": user_message}, timeout=_COPILOT_TIMEOUT)
+    result = _post(
+        f"/topics/copilot/{conv_id}/message", {"user_message": user_message},
+        timeout=_COPILOT_TIMEOUT, replay=False,
+    )
     return result if isinstance(result, dict) else {"ok": False}
 
 
@@ -367,21 +975,29 @@ def confirm_topic_copilot(conv_id: int) -> dict:
 # ── ICP ────────────────────────────────────────────────────────────────────────
 
 def get_icp() -> dict:
-    result = _get("/icp")
+    result = _shared("icp", lambda: _get("/icp"))
     return result if isinstance(result, dict) else {"exists": False}
 
 
+def get_icp_history() -> list[dict]:
+    result = _shared("icp_history", lambda: _get("/icp/history"))
+    return result if isinstance(result, list) else []
+
+
 def delete_icp() -> dict:
     return _delete("/icp")
 
 
 def start_icp_copilot(user_message: str) -> dict:
-    result = _post("/icp/copilot/start", {"user_message": user_message}, timeout=_COPILOT_TIMEOUT)
+    result = _post("/icp/copilot/start", {"user_message": user_message}, timeout=_COPILOT_TIMEOUT, replay=False)
     return result if isinstance(result, dict) else {"ok": False}
 
 
 def message_icp_copilot(conv_id: int, user_message: str) -> dict:
-    result = _post(f"/icp/copilot/{conv_id}/message", {"user_message": user_message}, timeout=_COPILOT_TIMEOUT)
+    result = _post(
+        f"/icp/copilot/{conv_id}/message", {"user_message": user_message},
+        timeout=_COPILOT_TIMEOUT, replay=False,
+    )
     return result if isinstance(result, dict) else {"ok": False}
 
 
@@ -393,50 +1009,296 @@ def confirm_icp_copilot(conv_id: int) -> dict:
 # ── Voice Profile ───────────────────────────────────────────────────────────────
 
 def get_voice_profile() -> dict:
-    result = _get("/voice-profile")
-    return result if isinstance(result, dict) else {"exists": False}
+    result = _shared("voice_profile", lambda: _get("/voice-profile"))
+    if not isinstance(result, dict):
+        return {"exists": False}
+    return write_behind.apply_one("voice_profile", result)
+
+
+def invalidate_voice_profile() -> None:
+    shared_cache.invalidate("voice_profile", "voice_history")
 
 
 def delete_voice_profile() -> dict:
+    invalidate_voice_profile()
     return _delete("/voice-profile")
 
 
 def get_voice_history() -> list[dict]:
-    result = _get("/voice-profile/history")
+    result = _shared("voice_history", lambda: _get("/voice-profile/history"))
     return result if isinstance(result, list) else []
 
 
 def accept_voice_change(row_id: int) -> dict:
+    invalidate_voice_profile()
     return _put(f"/voice-profile/history/{row_id}/accept")
 
 
 def reject_voice_change(row_id: int) -> dict:
+    invalidate_voice_profile()
     return _put(f"/voice-profile/history/{row_id}/reject")
 
 
 def start_voice_copilot() -> dict:
-    result = _post("/voice-profile/copilot/start", {}, timeout=_COPILOT_TIMEOUT)
+    result = _post("/voice-profile/copilot/start", {}, timeout=_COPILOT_TIMEOUT, replay=False)
     return result if isinstance(result, dict) else {"ok": False}
 
 
 def message_voice_copilot(conv_id: int, user_message: str) -> dict:
-    result = _post(f"/voice-profile/copilot/{conv_id}/message", {"user_message": user_message}, timeout=_COPILOT_TIMEOUT)
+    result = _post(
+        f"/voice-profile/copilot/{conv_id}/message", {"user_message": user_message},
+        timeout=_COPILOT_TIMEOUT, replay=False,
+    )
     return result if isinstance(result, dict) else {"ok": False}
 
 
 def confirm_voice_copilot(conv_id: int) -> dict:
     result = _post(f"/voice-profile/copilot/{conv_id}/confirm", timeout=_COPILOT_TIMEOUT)
+    invalidate_voice_profile()
     return result if isinstance(result, dict) else {"ok": False}
 
 
 def trigger_analyze_edits() -> dict:
-    return _post("/voice-profile/analyze-edits")
+    invalidate_voice_profile()
+    return _post("/voice-profile/analyze-edits", replay=False)
 
 
 def update_voice_profile(change_request: str) -> dict:
-    result = _post("/voice-profile/update", {"change_request": change_request}, timeout=_COPILOT_TIMEOUT)
+    result = _post("/voice-profile/update", {"change_request": change_request}, timeout=_COPILOT_TIMEOUT, replay=False)
+    invalidate_voice_profile()
     return result if isinstance(result, dict) else {"ok": False}
 
 
 def update_voice_field(field_name: str, value: str) -> dict:
-    return _put("/voice-profile", {"field": field_name, "value": value})
+    def send() -> dict:
+        result = _put("/voice-profile", {"field": field_name, "value": value})
+        if result.get("ok") is False:
+            invalidate_voice_profile()   # the in-place patch below no longer holds
+        return result
+
+    shared_cache.patch("voice_profile", lambda profile: profile.update({field_name: value}))
+    write_behind.submit(
+        f"voice:{field_name}",
+        send,
+        collection="voice_profile", patch={field_name: value},
+        label=f"Saving the voice field '{field_name}'",
+    )
+    return {"ok": True, "queued": True}
+
+
+# ── Tab bootstrap ─────────────────────────────────────────────────────────────
+# A tab that needs several resources asks GET /bootstrap/{tab} for all of them
+# in one response, keyed by endpoint path ({"/topics": [...], "/icp": {...}}).
+# Each resource is still produced by its usual getter, so caching, overlays and
+# shaping are unchanged: while a getter runs, _get answers from the composite
+# payload instead of the network. A path the payload lacks is fetched on its
+# own. Tabs whose composite endpoint 404s are remembered and fan out in
+# parallel, one request per resource, as before.
+#
+# Resources already held locally (shared cache, read replica) are left out:
+# the composite asks only for the missing ones (?resources=topics,icp), is
+# skipped when fewer than two are missing (one resource is one GET either
+# way), and a cached resource's getter never waits for it. A page with subtabs
+# passes the names the active subtab shows, so the others are not loaded.
+
+def _in_shared(resource: str) -> Callable[[], bool]:
+    return lambda: shared_cache.peek(resource) is not None
+
+
+def _in_replica(collection: str) -> Callable[[], bool]:
+    return lambda: replica.ready(collection)
+
+
+def _never() -> bool:
+    return False
+
+
+# tab -> name -> (getter, strict, cached). Strict resources raise
+# BackendUnavailable on failure so the page can show a per-section error;
+# cached() is True when the getter can answer without the backend.
+TAB_RESOURCES: dict[str, dict[str, tuple[Callable[[], object], bool, Callable[[], bool]]]] = {
+    "strategy": {
+        "voice":         (get_voice_profile,   True,  _in_shared("voice_profile")),
+        "voice_history": (get_voice_history,   False, _in_shared("voice_history")),
+        "topics":        (get_topics,          True,  _in_shared("topics")),
+        "icp":           (get_icp,             True,  _in_shared("icp")),
+        "icp_history":   (get_icp_history,     False, _in_shared("icp_history")),
+        "strategy":      (get_strategy,        True,  _in_shared("strategy")),
+        "health":        (get_strategy_health, True,  _never),
+        "feeds":         (get_feeds,           False, _in_shared("feeds")),
+    },
+    "influencers": {
+        "influencers":          (get_influencers,          False, _in_replica("influencers")),
+        "discover_pattern":     (get_discover_pattern,     False, _never),
+        "discover_suggestions": (get_discover_suggestions, False, _never),
+    },
+}
+
+_bootstrap_unsupported: set[str] = set()
+
+
+def _prefetched(path: str, params: dict) -> list | dict | None:
+    payload = getattr(_local, "prefetched", None)
+    if not payload or any(v is not None for v in params.values()):
+        return None
+    return payload.get(path)
+
+
+def _fetch_bootstrap(tab: str, names: list[str]) -> dict | None:
+    try:
+        result = fetch_strict(_get, f"/bootstrap/{tab}", resources=",".join(names))
+    except BackendUnavailable as e:
+        resp = getattr(e.__cause__, "response", None)
+        if resp is not None and resp.status_code == 404:
+            _bootstrap_unsupported.add(tab)
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _load(composite: Future | None, getter: Callable[[], object], strict: bool, cached: Callable[[], bool]):
+    # Wait for the composite only while the resource still needs the backend
+    # (another session may have cached it in the meantime).
+    if composite is not None and not cached():
+        _local.prefetched = background.result(composite, None)
+    try:
+        return fetch_strict(getter) if strict else getter()
+    finally:
+        _local.prefetched = None
+
+
+def bootstrap(tab: str, names: Optional[Iterable[str]] = None) -> dict[str, Future]:
+    """Start loading what `tab` needs (all of TAB_RESOURCES[tab], or only
+    `names`); returns one future per resource. At most one round trip when the
+    backend has /bootstrap/{tab}, covering only the resources not already cached."""
+    resources = TAB_RESOURCES[tab]
+    if names is not None:
+        resources = {name: resources[name] for name in names}
+    missing = {name for name, (_, _, cached) in resources.items() if not cached()}
+    composite = None
+    if len(missing) > 1 and tab not in _bootstrap_unsupported:
+        composite = background.submit(_fetch_bootstrap, tab, sorted(missing))
+    return {
+        name: background.submit(_load, composite if name in missing else None, getter, strict, cached)
+        for name, (getter, strict, cached) in resources.items()
+    }
+
+
+# ── Change sequence ───────────────────────────────────────────────────────────
+# The backend bumps a global change sequence on every write, plus one sequence
+# per resource: GET /changes → {"seq": 812, "resources": {"topics": 40, ...}}.
+# revalidate() runs on the background pool once per rerun (throttled to one
+# call per CHANGE_SEQ_INTERVAL for the whole process) and drops exactly the caches
+# whose resource moved. While the backend answers, shared-cache entries live
+# for CHANGE_SEQ_TTL instead of SHARED_CACHE_TTL, since staleness is now
+# reported. A 404 turns the check off and restores the default TTL.
+
+CHANGE_SEQ_INTERVAL = float(os.getenv("CHANGE_SEQ_INTERVAL_SECONDS", "2"))
+CHANGE_SEQ_TTL      = float(os.getenv("CHANGE_SEQ_TTL_SECONDS", "600"))
+
+# backend resource -> (shared-cache resources, replica collection, touches header metrics)
+_CHANGE_TARGETS: dict[str, tuple[tuple[str, ...], Optional[str], bool]] = {
+    "content":       (("content_queue",),                  "content",     True),
+    "comments":      (("comment_queue",),                  "comments",    True),
+    "influencers":   ((),                                  "influencers", False),
+    "connections":   ((),                                  "connections", False),
+    "feeds":         (("feeds",),                          "feeds",       False),
+    "topics":        (("topics",),                         "topics",      False),
+    "strategy":      (("strategy",),                       None,          True),
+    "icp":           (("icp", "icp_history"),              None,          False),
+    "voice_profile": (("voice_profile", "voice_history"),  None,          False),
+}
+
+_seq_lock = threading.Lock()
+_seq_checking = False
+_seq_checked_at = 0.0
+_seq_global: Optional[int] = None
+_seq_resources: dict[str, int] = {}
+_changes_supported = True
+
+
+def _mark_stale(resource: str) -> None:
+    if resource not in _CHANGE_TARGETS:
+        shared_cache.invalidate()
+        for collection in COLLECTIONS:
+            replica.invalidate(collection)
+        invalidate_metrics()
+        invalidate_analytics()
+        return
+    shared, collection, metrics = _CHANGE_TARGETS[resource]
+    if shared:
+        shared_cache.invalidate(*shared)
+    replica.invalidate(collection)
+    if metrics:
+        invalidate_metrics()
+        invalidate_analytics()
+
+
+def revalidate() -> set[str]:
+    """Ask the backend which resources changed since the last check and drop
+    their caches. Returns the stale resource names (empty when nothing moved,
+    when the check is throttled, or when the backend has no /changes)."""
+    global _seq_checking, _seq_checked_at, _seq_global, _seq_resources, _changes_supported
+    with _seq_lock:
+        now = time.monotonic()
+        if not _changes_supported or _seq_checking or now - _seq_checked_at < CHANGE_SEQ_INTERVAL:
+            return set()
+        if journal.circuit_open():
+            return set()
+        _seq_checking = True
+    try:
+        try:
+            result = fetch_strict(_get, "/changes")
+        except BackendUnavailable as e:
+            resp = getattr(e.__cause__, "response", None)
+            if resp is not None and resp.status_code == 404:
+                _changes_supported = False
+                shared_cache.set_ttl(shared_cache.SHARED_CACHE_TTL)
+            return set()
+        if not isinstance(result, dict) or not isinstance(result.get("seq"), int):
+            return set()
+
+        seq = result["seq"]
+        resources = {str(k): v for k, v in (result.get("resources") or {}).items()}
+        with _seq_lock:
+            previous, known = _seq_global, _seq_resources
+            _seq_global, _seq_resources = seq, resources
+        shared_cache.set_ttl(CHANGE_SEQ_TTL)
+        if previous is None or seq == previous:
+            return set()
+        if seq < previous:
+            # The counter went backwards (backend restarted): trust nothing.
+            stale = set(_CHANGE_TARGETS) | set(resources)
+        else:
+            stale = {name for name, value in resources.items() if known.get(name) != value}
+            if not stale:
+                stale = {"*"}   # moved without saying what: treat everything as stale
+        for name in stale:
+            _mark_stale(name)
+        print(f"[db] change sequence {previous} → {seq}: stale {sorted(stale)}")
+        return stale
+    finally:
+        with _seq_lock:
+            _seq_checking = False
+            _seq_checked_at = time.monotonic()
+
+
+def revalidate_in_background() -> None:
+    """Start revalidate() on the shared pool, unless a check is already
+    running or throttled. The script thread never waits on /changes; caches
+    it finds stale are dropped when it lands and read fresh on the next rerun."""
+    with _seq_lock:
+        if not _changes_supported or _seq_checking or time.monotonic() - _seq_checked_at < CHANGE_SEQ_INTERVAL:
+            return
+    background.submit(revalidate)
+
+
+def change_versions(resources: tuple[str, ...]) -> Optional[tuple[int, ...]]:
+    """The sequence the last /changes check saw for each of `resources` (the
+    global sequence for one it does not list); memory only, never calls the
+    backend. None when the backend has no /changes or has not answered yet.
+    Used as a cheap "did this tab's data change" check by the app's
+    auto-refresh, which starts the checks with revalidate_in_background()."""
+    with _seq_lock:
+        if not _changes_supported or _seq_global is None:
+            return None
+        return tuple(_seq_resources.get(r, _seq_global) for r in resources)
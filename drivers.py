@@ -0,0 +1,168 @@
+"""
+FinSignal UI — Data-access drivers.
+db._get reads through a driver. Both drivers return the same shapes (the
+JSON the backend's list endpoints return: a list of row dicts) and raise on
+failure. db turns failures into empty results or BackendUnavailable, as
+before.
+
+  HttpDriver     GET <API_URL><path>, the default and the only driver for writes.
+  SqliteDriver   Read-only queries on the backend's own SQLite file, for
+                 single-host installs where the UI and the backend share a
+                 volume. It serves the list endpoints in SQLITE_ROUTES and
+                 leaves every other path to HTTP.
+
+Configuration: DATA_DRIVER=http (default) or sqlite, with BACKEND_DB_PATH
+pointing at the backend database. The SQLite file is opened with mode=ro,
+so the UI can never write to it. Each route selects an explicit column list
+(the fields the endpoint returns), never SELECT *, so internal columns stay
+out of the rows; columns a given backend version lacks are left out, and
+0/1 flags come back as JSON booleans. scripts/check_driver_contract.py runs
+the same endpoints through both drivers against a live install and compares
+the shapes; scripts/check_driver_fixture.py does the same against a fixture
+database and a stub server serving the same rows.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import NamedTuple, Optional
+
+import requests
+
+DATA_DRIVER     = os.getenv("DATA_DRIVER", "http").lower()
+BACKEND_DB_PATH = os.getenv("BACKEND_DB_PATH", "")
+
+
+class Route(NamedTuple):
+    """How the SQLite driver answers one list endpoint."""
+    table:    str
+    columns:  tuple[str, ...]       # the fields the endpoint returns
+    filters:  tuple[str, ...]       # query params matched on equality
+    order:    str                   # ORDER BY, the endpoint's row order
+    booleans: tuple[str, ...] = ()  # 0/1 columns the endpoint returns as true/false
+
+
+_STAMPS = ("created_at", "updated_at")
+
+SQLITE_ROUTES: dict[str, Route] = {
+    "/content-queue": Route(
+        "content_queue",
+        ("id", "title", "body", "topic", "status", "linkedin_post_id",
+         *_STAMPS, "status_changed_at", "scheduled_at", "posted_at"),
+        ("status",), "created_at DESC, id DESC",
+    ),
+    "/comment-queue": Route(
+        "comment_queue",
+        ("id", "influencer_name", "post_url", "post_content", "post_snippet", "comment_text", "status",
+         *_STAMPS, "status_changed_at", "scheduled_at", "posted_at"),
+        ("status",), "created_at DESC, id DESC",
+    ),
+    "/influencers": Route(
+        "influencers",
+        ("id", "name", "linkedin_handle", "headline", "niche", "status", "comments_posted", *_STAMPS),
+        ("status",), "id",
+    ),
+    "/feeds": Route(
+        "feeds",
+        ("id", "name", "url", "feed_type", "category", "priority", "source", "active",
+         "last_fetched", *_STAMPS),
+        ("priority",), "id", booleans=("active",),
+    ),
+    "/topics": Route(
+        "topics",
+        ("id", "name", "weight", "context", "active", *_STAMPS),
+        (), "id", booleans=("active",),
+    ),
+    "/connections": Route(
+        "connections",
+        ("id", "name", "linkedin_handle", "source", "status", "sent_at", *_STAMPS),
+        ("status",), "created_at DESC, id DESC",
+    ),
+}
+
+
+class HttpDriver:
+    name = "http"
+
+    def __init__(self, api_url: str, timeout: float) -> None:
+        self.api_url = api_url
+        self.timeout = timeout
+
+    def serves(self, path: str) -> bool:
+        return True
+
+    def get(self, path: str, params: dict) -> list | dict:
+        r = requests.get(
+            f"{self.api_url}{path}",
+            params={k: v for k, v in params.items() if v is not None},
+            timeout=self.timeout,
+        )
+        r.raise_for_status()
+        return r.json()
+
+
+class SqliteDriver:
+    name = "sqlite"
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._local = threading.local()   # one read-only connection per thread
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=5)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def _columns(self, table: str) -> set[str]:
+        """Columns the table actually has, read once per thread."""
+        known = getattr(self._local, "columns", None)
+        if known is None:
+            known = self._local.columns = {}
+        if table not in known:
+            known[table] = {row["name"] for row in self._conn().execute(f"PRAGMA table_info({table})")}
+            if not known[table]:
+                raise sqlite3.OperationalError(f"no such table: {table}")
+        return known[table]
+
+    def serves(self, path: str) -> bool:
+        return path in SQLITE_ROUTES
+
+    def get(self, path: str, params: dict) -> list | dict:
+        route = SQLITE_ROUTES[path]
+        present = self._columns(route.table)
+        where, args = [], []
+        for name in route.filters:
+            if params.get(name) is not None:
+                where.append(f"{name} = ?")
+                args.append(params[name])
+        # A table without updated_at cannot answer a delta; the full list is
+        # a valid (if larger) answer, since callers upsert what they get.
+        if params.get("updated_since") is not None and "updated_at" in present:
+            where.append("updated_at > ?")
+            args.append(params["updated_since"])
+        columns = [c for c in route.columns if c in present]
+        sql = f"SELECT {', '.join(columns)} FROM {route.table}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {route.order}"
+        rows = [dict(row) for row in self._conn().execute(sql, args)]
+        for name in route.booleans:
+            if name in present:
+                for row in rows:
+                    if row[name] is not None:
+                        row[name] = bool(row[name])
+        return rows
+
+
+def from_env(api_url: str, timeout: float) -> tuple[HttpDriver, Optional[SqliteDriver]]:
+    """(HTTP driver, SQLite driver or None) as configured by DATA_DRIVER."""
+    http = HttpDriver(api_url, timeout)
+    if DATA_DRIVER != "sqlite":
+        return http, None
+    if not BACKEND_DB_PATH or not os.path.exists(BACKEND_DB_PATH):
+        print(f"[drivers] DATA_DRIVER=sqlite but BACKEND_DB_PATH={BACKEND_DB_PATH!r} is missing — using HTTP")
+        return http, None
+    return http, SqliteDriver(BACKEND_DB_PATH)
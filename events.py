@@ -0,0 +1,181 @@
+"""
+FinSignal UI — Backend change notifications.
+One background thread per process subscribes to the backend's event stream
+(GET /events, text/event-stream) and turns events into cache updates and
+per-topic version bumps:
+
+  queue_item   {"queue": "content" | "comments", "change": "created" |
+               "status_changed" | "updated" | "deleted", "id": 12, "row": {...}}
+               The row is upserted into the read replica (or the collection is
+               invalidated when no row is sent), and header metrics are dropped.
+               Bumps the queue's topic, plus "pending" for any comment change.
+  agent_run    {"agent": "research", "state": "succeeded", ...}
+               Drops the agent status cache; a finished run also drops metrics.
+               Bumps "agents".
+
+Sessions say which topics they show (see page_registry.Page.watches). The
+app's listener fragment compares the topics' version in memory every
+EVENTS_NUDGE_SECONDS and reruns the session only when one moved, so idle
+sessions never call the backend. While the stream is connected, header
+metrics are cached for longer (db.set_push_updates), since a change now
+arrives as an event instead of being found by polling.
+
+A backend without /events (404) is remembered and the stream is not retried.
+Other failures reconnect with backoff and send Last-Event-ID so the backend
+can replay what was missed.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Iterable, Iterator
+
+import requests
+
+import agent_tracker
+import db
+import replica
+
+EVENTS_NUDGE_SECONDS      = float(os.getenv("EVENTS_NUDGE_SECONDS", "2"))
+EVENTS_READ_TIMEOUT       = float(os.getenv("EVENTS_READ_TIMEOUT_SECONDS", "90"))   # > backend heartbeat
+EVENTS_RECONNECT_SECONDS  = 2.0
+EVENTS_MAX_RECONNECT      = 60.0
+
+_FINISHED = {"succeeded", "success", "done", "failed", "error"}
+
+_lock = threading.Lock()
+_versions: dict[str, int] = {}
+_connected = False
+_supported = True
+_last_event_id = ""
+_started = False
+
+
+# ── Stream ────────────────────────────────────────────────────────────────────
+
+def _parse(lines: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """(event, data, id) for each SSE message; comments and retry are skipped."""
+    event, data, event_id = "message", [], ""
+    for line in lines:
+        if line is None:
+            continue
+        if line == "":
+            if data:
+                yield event, "\n".join(data), event_id
+            event, data, event_id = "message", [], ""
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+        elif field == "id":
+            event_id = value
+
+
+def _set_connected(value: bool) -> None:
+    global _connected
+    with _lock:
+        changed = _connected != value
+        _connected = value
+    if changed:
+        db.set_push_updates(value)
+        print(f"[events] stream {'connected' if value else 'disconnected'}")
+
+
+def _stream() -> None:
+    global _supported, _last_event_id
+    headers = {"Accept": "text/event-stream"}
+    if _last_event_id:
+        headers["Last-Event-ID"] = _last_event_id
+    with requests.get(
+        f"{db.API_URL}/events", headers=headers, stream=True, timeout=(5, EVENTS_READ_TIMEOUT),
+    ) as r:
+        if r.status_code == 404:
+            _supported = False
+            print("[events] backend has no /events stream — falling back to polling")
+            return
+        r.raise_for_status()
+        _set_connected(True)
+        for event, data, event_id in _parse(r.iter_lines(decode_unicode=True)):
+            if event_id:
+                _last_event_id = event_id
+            try:
+                _handle(event, json.loads(data))
+            except Exception as e:
+                print(f"[events] bad {event} event: {e}")
+
+
+def _loop() -> None:
+    delay = EVENTS_RECONNECT_SECONDS
+    while _supported:
+        started = time.monotonic()
+        try:
+            _stream()
+        except Exception as e:
+            print(f"[events] stream failed: {e}")
+        _set_connected(False)
+        if not _supported:
+            return
+        if time.monotonic() - started > EVENTS_MAX_RECONNECT:
+            delay = EVENTS_RECONNECT_SECONDS   # it was up for a while: reconnect promptly
+        time.sleep(delay)
+        delay = min(delay * 2, EVENTS_MAX_RECONNECT)
+
+
+def start() -> None:
+    """Start the subscriber thread (once per process)."""
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_loop, name="finsignal-events", daemon=True).start()
+
+
+# ── Handling ──────────────────────────────────────────────────────────────────
+
+def _bump(*topics: str) -> None:
+    with _lock:
+        for topic in topics:
+            _versions[topic] = _versions.get(topic, 0) + 1
+
+
+def _handle(event: str, data: dict) -> None:
+    if event == "queue_item":
+        collection = data.get("queue")
+        if collection not in ("content", "comments"):
+            return
+        row = data.get("row")
+        if isinstance(row, dict) and data.get("change") != "deleted":
+            replica.upsert(collection, row)
+        else:
+            replica.invalidate(collection)
+        db.invalidate_metrics()
+        db.invalidate_analytics()
+        # Any comment change (new, approved, ignored, deleted) can move the
+        # pending count shown in every session's tab label.
+        _bump(collection, *(("pending",) if collection == "comments" else ()))
+    elif event == "agent_run":
+        agent_tracker.invalidate()
+        if data.get("state") in _FINISHED:
+            db.invalidate_metrics()
+            db.invalidate_analytics()
+        _bump("agents")
+
+
+# ── Sessions ──────────────────────────────────────────────────────────────────
+
+def connected() -> bool:
+    with _lock:
+        return _connected
+
+
+def version(topics: Iterable[str]) -> tuple[int, ...]:
+    """Current versions of `topics`; it changes whenever one of them has an event."""
+    with _lock:
+        return tuple(_versions.get(t, 0) for t in topics)
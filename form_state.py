@@ -0,0 +1,32 @@
+"""
+FinSignal UI — Form state.
+Minimal diffs for settings forms. A form compares what the user would save
+against the config it was rendered from. Only the keys that actually
+changed are sent, in one request. A save with no changes sends nothing.
+"""
+
+from typing import Any
+
+
+def normalize(value: Any) -> Any:
+    """Comparable form of a config value: 8 == 8.0, " a " == "a",
+    and nested dicts and lists are compared element by element."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    return value
+
+
+def diff(baseline: dict, values: dict) -> dict:
+    """The entries of `values` that differ from `baseline` (missing keys count as changed)."""
+    return {
+        key: value for key, value in values.items()
+        if key not in baseline or normalize(baseline[key]) != normalize(value)
+    }
@@ -0,0 +1,312 @@
+"""
+FinSignal UI — Offline mutation journal.
+Triage actions (approving or ignoring a comment, editing or scheduling a
+draft, hibernating an influencer, pausing a feed…) must not be lost when the
+backend is down or restarting. db sends them through here. When the backend
+cannot be reached, the mutation is written to a local SQLite journal, and a
+background thread replays it in order once the backend answers again.
+
+Circuit breaker: CIRCUIT_FAILURES consecutive transport failures (connection
+refused, timeout, 502/503/504) open the circuit. While it is open, mutations
+are journaled without being attempted. After CIRCUIT_RETRY_SECONDS (doubling
+up to CIRCUIT_MAX_RETRY_SECONDS), the replay thread probes with the oldest
+entry. A success closes the circuit. While entries are still queued, new
+mutations are journaled behind them, so everything lands in the order it was
+made.
+
+Conflicts: each entry records the row's updated_at as the user last saw it.
+Before an entry is replayed, the row is re-read from the backend. If the row
+changed or disappeared in the meantime, the entry (and any later entries for
+the same row) is not sent and is reported instead. Rejected entries are
+reported the same way. Until an entry is replayed, getters overlay its change
+on the rows they return and mark them `_journaled` (see widgets.offline_badge).
+
+The journal lives at JOURNAL_PATH. Put it on a volume so queued work also
+survives a restart of the UI container.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+JOURNAL_PATH              = os.path.expanduser(os.getenv("JOURNAL_PATH", "~/.finsignal/journal.sqlite3"))
+CIRCUIT_FAILURES          = int(os.getenv("CIRCUIT_FAILURES", "2"))
+CIRCUIT_RETRY_SECONDS     = float(os.getenv("CIRCUIT_RETRY_SECONDS", "10"))
+CIRCUIT_MAX_RETRY_SECONDS = float(os.getenv("CIRCUIT_MAX_RETRY_SECONDS", "120"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mutations (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at  REAL NOT NULL,
+    kind        TEXT NOT NULL,
+    method      TEXT NOT NULL,
+    path        TEXT NOT NULL,
+    body        TEXT,
+    idem_key    TEXT NOT NULL,
+    collection  TEXT NOT NULL DEFAULT '',
+    row_id      TEXT,
+    base        TEXT,
+    patch       TEXT,
+    label       TEXT NOT NULL DEFAULT '',
+    state       TEXT NOT NULL DEFAULT 'pending',
+    error       TEXT
+)
+"""
+
+_MISSING = object()
+
+_cond = threading.Condition()
+_conn: Optional[sqlite3.Connection] = None
+_pending: list[dict] = []                  # in-memory mirror of state='pending', in id order
+_seen: dict[tuple[str, Any], str] = {}     # (collection, row id) -> updated_at last shown
+_started = False
+
+
+# ── Storage ───────────────────────────────────────────────────────────────────
+
+def _entry(row: sqlite3.Row) -> dict:
+    return {
+        "id":         row["id"],
+        "created_at": row["created_at"],
+        "kind":       row["kind"],
+        "method":     row["method"],
+        "path":       row["path"],
+        "body":       json.loads(row["body"]) if row["body"] else None,
+        "key":        row["idem_key"],
+        "collection": row["collection"],
+        "row_id":     json.loads(row["row_id"]) if row["row_id"] else None,
+        "base":       row["base"],
+        "patch":      json.loads(row["patch"]) if row["patch"] else None,
+        "label":      row["label"],
+        "state":      row["state"],
+        "error":      row["error"],
+    }
+
+
+def _db() -> sqlite3.Connection:
+    """The journal connection, opened on first use (caller holds _cond)."""
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(JOURNAL_PATH) or ".", exist_ok=True)
+        _conn = sqlite3.connect(JOURNAL_PATH, check_same_thread=False, isolation_level=None)
+        _conn.row_factory = sqlite3.Row
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute(_SCHEMA)
+        rows = _conn.execute("SELECT * FROM mutations WHERE state = 'pending' ORDER BY id").fetchall()
+        _pending[:] = [_entry(r) for r in rows]
+    return _conn
+
+
+def _set_state(entry_id: int, state: str, error: str = "") -> None:
+    _db().execute("UPDATE mutations SET state = ?, error = ? WHERE id = ?", (state, error, entry_id))
+    _pending[:] = [e for e in _pending if e["id"] != entry_id]
+
+
+def record(
+    kind: str, method: str, path: str, body: Optional[dict], key: str, *,
+    collection: str = "", row_id: Any = None, patch: Optional[dict] = None, label: str = "",
+) -> int:
+    """Append a mutation to the journal and wake the replay thread."""
+    with _cond:
+        conn = _db()
+        follows = any(e["collection"] == collection and e["row_id"] == row_id for e in _pending)
+        # Only the first queued change to a row is checked against the backend;
+        # later ones build on it.
+        base = None if follows or not collection else _seen.get((collection, row_id))
+        cur = conn.execute(
+            "INSERT INTO mutations (created_at, kind, method, path, body, idem_key, collection,"
+            " row_id, base, patch, label) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (time.time(), kind, method, path, json.dumps(body) if body is not None else None, key,
+             collection, json.dumps(row_id) if row_id is not None else None, base,
+             json.dumps(patch) if patch is not None else None, label),
+        )
+        _pending.append(_entry(conn.execute("SELECT * FROM mutations WHERE id = ?", (cur.lastrowid,)).fetchone()))
+        print(f"[journal] queued {method} {path} (#{cur.lastrowid})")
+        _cond.notify_all()
+        return cur.lastrowid
+
+
+def pending_count() -> int:
+    with _cond:
+        _db()
+        return len(_pending)
+
+
+def problems() -> list[dict]:
+    """Entries that were not replayed: state 'conflict' or 'failed', oldest first."""
+    with _cond:
+        rows = _db().execute(
+            "SELECT * FROM mutations WHERE state IN ('conflict', 'failed') ORDER BY id"
+        ).fetchall()
+    return [_entry(r) for r in rows]
+
+
+def dismiss(entry_id: int) -> None:
+    with _cond:
+        _db().execute("DELETE FROM mutations WHERE id = ? AND state != 'pending'", (entry_id,))
+
+
+# ── Circuit breaker ───────────────────────────────────────────────────────────
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.failures = 0
+        self.open_until = 0.0
+        self.backoff = CIRCUIT_RETRY_SECONDS
+
+
+_circuit = _Circuit()
+
+
+def report_success() -> None:
+    """A backend call succeeded: close the circuit."""
+    with _cond:
+        if _circuit.failures or _circuit.open_until:
+            print("[journal] backend reachable — circuit closed")
+            _cond.notify_all()
+        _circuit.failures = 0
+        _circuit.open_until = 0.0
+        _circuit.backoff = CIRCUIT_RETRY_SECONDS
+
+
+def report_failure(trip: bool = False) -> None:
+    """A backend call failed at the transport level; trip=True opens at once."""
+    with _cond:
+        _circuit.failures += 1
+        if not trip and _circuit.failures < CIRCUIT_FAILURES:
+            return
+        if time.monotonic() >= _circuit.open_until:
+            _circuit.open_until = time.monotonic() + _circuit.backoff
+            print(f"[journal] backend unreachable — circuit open for {_circuit.backoff:.0f}s")
+            _circuit.backoff = min(_circuit.backoff * 2, CIRCUIT_MAX_RETRY_SECONDS)
+
+
+def circuit_open() -> bool:
+    with _cond:
+        return time.monotonic() < _circuit.open_until
+
+
+def holding() -> bool:
+    """True while new mutations must be journaled instead of sent: the circuit
+    is open, or earlier mutations are still waiting to be replayed."""
+    with _cond:
+        _db()
+        return bool(_pending) or time.monotonic() < _circuit.open_until
+
+
+# ── Replay ────────────────────────────────────────────────────────────────────
+
+def _replay_pass(send: Callable[[dict], dict], versions: Callable[[str], Optional[dict]]) -> None:
+    with _cond:
+        queue = list(_pending)
+    fetched: dict[str, dict] = {}
+    blocked: set[tuple[str, Any]] = set()
+    for entry in queue:
+        row = (entry["collection"], entry["row_id"])
+        if row in blocked:
+            with _cond:
+                _set_state(entry["id"], "conflict", "Follows a change that could not be applied")
+            continue
+        if entry["collection"] and entry["row_id"] is not None and entry["base"]:
+            if entry["collection"] not in fetched:
+                current = versions(entry["collection"])
+                if current is None:
+                    report_failure(trip=True)
+                    return
+                fetched[entry["collection"]] = current
+            now = fetched[entry["collection"]].get(entry["row_id"], _MISSING)
+            gone_already = now is _MISSING and entry["method"] == "DELETE"
+            if now is _MISSING and not gone_already:
+                conflict = "The item no longer exists on the backend"
+            elif not gone_already and now and now != entry["base"]:
+                conflict = "The item changed on the backend after this change was made"
+            else:
+                conflict = ""
+            if conflict:
+                blocked.add(row)
+                with _cond:
+                    _set_state(entry["id"], "conflict", conflict)
+                print(f"[journal] #{entry['id']} {entry['method']} {entry['path']}: {conflict}")
+                continue
+            if gone_already:
+                with _cond:
+                    _set_state(entry["id"], "done")
+                continue
+
+        result = send(entry)
+        if isinstance(result, dict) and result.get("unreachable"):
+            report_failure(trip=True)
+            return
+        with _cond:
+            if isinstance(result, dict) and result.get("ok") is False:
+                blocked.add(row)
+                _set_state(entry["id"], "failed", result.get("error") or "The backend rejected the change")
+            else:
+                _db().execute("DELETE FROM mutations WHERE id = ?", (entry["id"],))
+                _pending[:] = [e for e in _pending if e["id"] != entry["id"]]
+                print(f"[journal] replayed #{entry['id']} {entry['method']} {entry['path']}")
+
+
+def _loop(send: Callable[[dict], dict], versions: Callable[[str], Optional[dict]]) -> None:
+    while True:
+        with _cond:
+            _db()
+            wait = _circuit.open_until - time.monotonic()
+            if not _pending or wait > 0:
+                _cond.wait(timeout=wait if wait > 0 else None)
+                continue
+        try:
+            _replay_pass(send, versions)
+        except Exception as e:
+            print(f"[journal] replay failed: {e}")
+            report_failure(trip=True)
+
+
+def start(send: Callable[[dict], dict], versions: Callable[[str], Optional[dict]]) -> None:
+    """Start the replay thread once per process.
+
+    send(entry) performs an entry's request and returns its result dict
+    (with unreachable=True on a transport failure). versions(collection)
+    returns {row id: updated_at} fresh from the backend, or None if it
+    cannot be reached.
+    """
+    global _started
+    with _cond:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_loop, args=(send, versions), name="finsignal-journal", daemon=True).start()
+
+
+# ── Read side ─────────────────────────────────────────────────────────────────
+
+def apply(collection: str, rows: list[dict]) -> list[dict]:
+    """Remember each row's updated_at (the base for conflict checks) and
+    overlay queued changes for `collection`; rows with a queued delete are dropped."""
+    with _cond:
+        for row in rows:
+            _seen[(collection, row.get("id"))] = row.get("updated_at") or ""
+        queued = [e for e in _pending if e["collection"] == collection]
+    if not queued:
+        return rows
+    by_row: dict[Any, list[dict]] = {}
+    for entry in queued:
+        by_row.setdefault(entry["row_id"], []).append(entry)
+    out = []
+    for row in rows:
+        entries = by_row.get(row.get("id"))
+        if not entries:
+            out.append(row)
+            continue
+        if any(e["method"] == "DELETE" for e in entries):
+            continue
+        row = dict(row)
+        for entry in entries:
+            row.update(entry["patch"] or {})
+        row["_journaled"] = entries[-1]["id"]
+        row["_pending"] = f"j{entries[-1]['id']}"   # see card_cache.row_version
+        out.append(row)
+    return out
@@ -0,0 +1,129 @@
+"""
+FinSignal UI — Live metrics history.
+The backend has no history endpoint, so a background thread samples the
+header metrics (all ranges, one call) and the strategy health counters on a
+fixed interval into process-wide ring buffers. Memory is fixed: each series
+is two preallocated array('d') buffers sized retention / interval. Sparklines
+and trend deltas read from here and never touch the backend.
+"""
+
+import os
+import threading
+import time
+from array import array
+from typing import Optional
+
+import db
+
+SAMPLE_INTERVAL = float(os.getenv("METRICS_SAMPLE_SECONDS", "300"))
+RETENTION_HOURS = float(os.getenv("METRICS_RETENTION_HOURS", "24"))
+
+RANGES         = ["today", "7days", "30days"]
+HEALTH_FIELDS  = ("comments_today", "posts_this_week", "archived_this_week")
+
+
+class RingBuffer:
+    """Fixed-capacity (timestamp, value) series; the oldest sample is overwritten."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(2, capacity)
+        self._ts   = array("d", bytes(8 * self.capacity))
+        self._vals = array("d", bytes(8 * self.capacity))
+        self._head = 0      # next write position
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, value: float, ts: Optional[float] = None) -> None:
+        with self._lock:
+            self._ts[self._head]   = time.time() if ts is None else ts
+            self._vals[self._head] = value
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def values(self) -> list[float]:
+        """Samples oldest → newest."""
+        with self._lock:
+            start = (self._head - self._size) % self.capacity
+            if start + self._size <= self.capacity:
+                return self._vals[start:start + self._size].tolist()
+            return self._vals[start:].tolist() + self._vals[:self._head].tolist()
+
+    def delta(self, window: float) -> Optional[float]:
+        """Newest value minus the oldest value inside the last `window` seconds."""
+        with self._lock:
+            if self._size < 2:
+                return None
+            newest = (self._head - 1) % self.capacity
+            cutoff = self._ts[newest] - window
+            oldest = newest
+            for i in range(1, self._size):
+                j = (newest - i) % self.capacity
+                if self._ts[j] < cutoff:
+                    break
+                oldest = j
+            return self._vals[newest] - self._vals[oldest]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+_capacity = int(RETENTION_HOURS * 3600 / SAMPLE_INTERVAL)
+_series: dict[str, RingBuffer] = {}
+_series_lock = threading.Lock()
+_started = False
+
+
+def _buffer(name: str) -> RingBuffer:
+    with _series_lock:
+        if name not in _series:
+            _series[name] = RingBuffer(_capacity)
+        return _series[name]
+
+
+def sample() -> None:
+    """Take one sample of every series (two backend calls).
+
+    Strict fetches: a backend outage skips the sample instead of recording
+    a row of zeros into every sparkline.
+    """
+    now = time.time()
+    by_range = db.fetch_strict(db.get_metrics_for_ranges, RANGES)
+    for r, m in by_range.items():
+        _buffer(f"posts_count:{r}").append(m["posts_count"], now)
+        _buffer(f"comments_count:{r}").append(m["comments_count"], now)
+    _buffer("pending_comments").append(by_range[RANGES[0]]["pending_comments"], now)
+    health = db.fetch_strict(db.get_strategy_health)
+    for field in HEALTH_FIELDS:
+        _buffer(field).append(health[field], now)
+
+
+def _loop() -> None:
+    while True:
+        try:
+            sample()
+        except Exception as e:
+            print(f"[metrics_history] sample failed: {e}")
+        time.sleep(SAMPLE_INTERVAL)
+
+
+def start() -> None:
+    """Start the process-wide sampler once; later calls are no-ops."""
+    global _started
+    with _series_lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_loop, name="finsignal-metrics-sampler", daemon=True).start()
+
+
+def series(name: str) -> list[float]:
+    """Samples for `name` (e.g. "posts_count:7days", "archived_this_week"), oldest first."""
+    with _series_lock:
+        buf = _series.get(name)
+    return buf.values() if buf else []
+
+
+def delta(name: str, window: float = 24 * 3600) -> Optional[float]:
+    with _series_lock:
+        buf = _series.get(name)
+    return buf.delta(window) if buf else None
@@ -0,0 +1,22 @@
+"""
+FinSignal UI — Niche detection.
+Keyword rules that tag a post with its FinCrime niche, shared by the Content
+Queue cards and the Analytics topic-mix rollups.
+"""
+
+NICHE_KEYWORDS = {
+    "AML": ["aml", "anti-money", "money laundering", "bsa", "suspicious", "sar"],
+    "Fraud": ["fraud", "scam", "synthetic", "identity theft", "mule"],
+    "KYC": ["kyc", "know your customer", "onboarding", "verification", "cdd"],
+    "Sanctions": ["sanctions", "ofac", "sdn", "compliance", "prohibited"],
+    "RegTech": ["regtech", "regulation", "fincen", "compliance tech", "ai", "model"],
+    "Crypto": ["crypto", "blockchain", "defi", "digital asset", "bitcoin", "ethereum"],
+}
+
+
+def extract_topic(title: str, body: str) -> str:
+    text = (title + " " + body).lower()
+    for niche, kws in NICHE_KEYWORDS.items():
+        if any(kw in text for kw in kws):
+            return niche
+    return "FinCrime"
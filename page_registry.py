@@ -0,0 +1,47 @@
+"""
+FinSignal UI — Page registry.
+One entry per top-level tab. A tab's module under pages/ is imported the first
+time that tab is rendered, so a cold start only pays for the shell plus the
+active tab. Page modules must keep heavy libraries (pandas, plotly) behind
+function-level imports for the same reason.
+"""
+
+import importlib
+from types import ModuleType
+from typing import NamedTuple
+
+
+class Page(NamedTuple):
+    module: str                # module name under pages/
+    label: str                 # tab button label
+    takes_api_url: bool        # render() accepts api_url=
+    watches: tuple[str, ...]   # backend resources shown: events.py nudges, auto-refresh checks
+
+
+PAGES: tuple[Page, ...] = (
+    Page("content_queue",      "📝  Content Queue", True,  ("content",)),
+    Page("comment_queue",      "💬  Comment Queue", True,  ("comments",)),
+    Page("influencer_manager", "🤝  Influencers",   False, ()),
+    Page("strategy_manager",   "⚙️  Strategy",      False, ()),
+    Page("analytics",          "📊  Analytics",     True,  ("content", "comments")),
+    Page("connections",        "🔗  Connections",   False, ("connections",)),
+)
+
+# Every tab shows the pending-comment count in its nav, so a comment change reruns any tab.
+ALWAYS_WATCHED = ("pending",)
+
+COMMENT_QUEUE = 1  # index of the tab whose label carries the pending count
+
+
+def load(index: int) -> ModuleType:
+    """Import (once per process) and return the module behind tab `index`."""
+    return importlib.import_module(f"pages.{PAGES[index].module}")
+
+
+def render(index: int, api_url: str) -> None:
+    page   = PAGES[index]
+    module = load(index)
+    if page.takes_api_url:
+        module.render(api_url=api_url)
+    else:
+        module.render()
@@ -3,60 +3,10 @@ Analytics page — content pipeline health and post quality scorer.
 """
 
 import streamlit as st
+import analytics_engine
 import db
-
-_CSS = """
-<style>
-.analytics-card {
-    background: #1E2130;
-    border-radius: 8px;
-    padding: 16px 18px;
-    border: 1px solid #2D3748;
-    min-height: 90px;
-}
-.analytics-label {
-    font-size: 0.72rem;
-    color: #9AA0B2;
-    text-transform: uppercase;
-    letter-spacing: 0.07em;
-    margin-bottom: 4px;
-}
-.analytics-value {
-    font-size: 1.6rem;
-    font-weight: 700;
-    color: #FAFAFA;
-    line-height: 1.1;
-}
-.analytics-sub {
-    font-size: 0.72rem;
-    color: #6B7280;
-    margin-top: 3px;
-}
-.score-bar-container {
-    background: #2D3748;
-    border-radius: 4px;
-    height: 10px;
-    margin-top: 4px;
-    overflow: hidden;
-}
-.score-bar-fill {
-    height: 100%;
-    border-radius: 4px;
-    transition: width 0.3s ease;
-}
-.locked-card {
-    background: #161820;
-    border-radius: 8px;
-    border: 1px dashed #2D3748;
-    padding: 24px;
-    text-align: center;
-    color: #4B5563;
-}
-.locked-icon { font-size: 1.8rem; margin-bottom: 8px; }
-.locked-title { font-size: 0.88rem; font-weight: 700; color: #6B7280; margin-bottom: 4px; }
-.locked-sub { font-size: 0.78rem; color: #4B5563; }
-</style>
-"""
+import pipeline_analytics
+import profile_cache
 
 
 def _score_color(score: int) -> str:
@@ -67,6 +17,12 @@ def _score_color(score: int) -> str:
     return "#EF4444"
 
 
+def _fmt_hours(hours: float) -> str:
+    if hours >= 48:
+        return f"{hours / 24:.1f}d"
+    return f"{hours:.1f}h"
+
+
 def _score_bar(label: str, score: int) -> str:
     pct   = score * 10
     color = _score_color(score)
@@ -84,7 +40,6 @@ def _score_bar(label: str, score: int) -> str:
 
 
 def render(api_url: str = "") -> None:
-    st.markdown(_CSS, unsafe_allow_html=True)
 
     st.markdown(
         "<div style='font-size:1.3rem;font-weight:800;color:#FAFAFA;margin-bottom:4px;'>"
@@ -94,10 +49,11 @@ def render(api_url: str = "") -> None:
         unsafe_allow_html=True,
     )
 
-    # LinkedIn status banner
-    li_connected = st.session_state.get("linkedin_access_token") is not None
+    # LinkedIn status banner (none until app.py's profile fetch has landed)
+    profile      = profile_cache.peek()
+    li_connected = bool(profile and profile["connected"])
     if li_connected:
-        name = st.session_state.get("linkedin_profile_name", "Connected")
+        name = profile["name"] or "Connected"
         st.markdown(
             f"""<div style='background:#0D2137;border:1px solid #0A66C2;border-radius:8px;
                            padding:10px 16px;margin-bottom:16px;font-size:0.83rem;color:#60A5FA;'>
@@ -105,7 +61,7 @@ def render(api_url: str = "") -> None:
             </div>""",
             unsafe_allow_html=True,
         )
-    else:
+    elif profile is not None:
         st.markdown(
             f"""<div style='background:#1A1C2A;border:1px solid #F5A623;border-radius:8px;
                            padding:10px 16px;margin-bottom:16px;display:flex;align-items:center;
@@ -131,17 +87,15 @@ def render(api_url: str = "") -> None:
         unsafe_allow_html=True,
     )
 
-    metrics = db.get_metrics()
-    health  = db.get_strategy_health()
-    cfg     = db.get_strategy()
+    summary = db.get_analytics_summary()
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
         st.markdown(
             f"""<div class='analytics-card'>
                 <div class='analytics-label'>Posts This Week</div>
-                <div class='analytics-value'>{metrics['posts_this_week']}</div>
-                <div class='analytics-sub'>of {health['max_posts_week']} max</div>
+                <div class='analytics-value'>{summary['posts_this_week']}</div>
+                <div class='analytics-sub'>of {summary['max_posts_week']} max</div>
             </div>""",
             unsafe_allow_html=True,
         )
@@ -149,7 +103,7 @@ def render(api_url: str = "") -> None:
         st.markdown(
             f"""<div class='analytics-card'>
                 <div class='analytics-label'>Drafts Pending</div>
-                <div class='analytics-value'>{metrics['draft_count']}</div>
+                <div class='analytics-value'>{summary['drafts_pending']}</div>
                 <div class='analytics-sub'>awaiting review</div>
             </div>""",
             unsafe_allow_html=True,
@@ -158,17 +112,16 @@ def render(api_url: str = "") -> None:
         st.markdown(
             f"""<div class='analytics-card'>
                 <div class='analytics-label'>Archived (Quality)</div>
-                <div class='analytics-value'>{health['archived_this_week']}</div>
+                <div class='analytics-value'>{summary['archived_this_week']}</div>
                 <div class='analytics-sub'>rejected this week</div>
             </div>""",
             unsafe_allow_html=True,
         )
     with c4:
-        min_score = int(cfg.get("min_post_quality_score", 7))
         st.markdown(
             f"""<div class='analytics-card'>
                 <div class='analytics-label'>Quality Threshold</div>
-                <div class='analytics-value'>{min_score}/10</div>
+                <div class='analytics-value'>{summary['min_quality_score']}/10</div>
                 <div class='analytics-sub'>min score to publish</div>
             </div>""",
             unsafe_allow_html=True,
@@ -178,6 +131,85 @@ def render(api_url: str = "") -> None:
     st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
 
+    # ── Trends ──────────────────────────────────────────────────────────────────
+    trend_hdr, trend_toggle = st.columns([3, 1])
+    with trend_hdr:
+        st.markdown(
+            "<div style='font-size:1rem;font-weight:700;color:#FAFAFA;margin-bottom:8px;'>"
+            "Trends</div>",
+            unsafe_allow_html=True,
+        )
+    with trend_toggle:
+        period = st.radio(
+            "Period", ["Daily", "Weekly"],
+            horizontal=True, key="analytics_trend_period", label_visibility="collapsed",
+        )
+
+    try:
+        chart_l, chart_r = st.columns([3, 2])
+        with chart_l:
+            st.plotly_chart(analytics_engine.activity_figure(period.lower()), use_container_width=True)
+        with chart_r:
+            st.plotly_chart(analytics_engine.topic_mix_figure(), use_container_width=True)
+    except ImportError:
+        st.info("Trend charts need pandas and plotly (see requirements.txt).")
+
+    st.markdown("<div style='height:24px'></div>", unsafe_allow_html=True)
+    st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
+    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+
+    # ── Pipeline Flow ───────────────────────────────────────────────────────────
+    st.markdown(
+        "<div style='font-size:1rem;font-weight:700;color:#FAFAFA;margin-bottom:12px;'>"
+        "Pipeline Flow</div>",
+        unsafe_allow_html=True,
+    )
+
+    try:
+        funnel  = pipeline_analytics.funnel()
+        backlog = pipeline_analytics.backlog_age()
+        stages  = pipeline_analytics.time_in_state()
+
+        cards = st.columns(4)
+        for i, (queue, label) in enumerate([("content", "Draft Backlog"), ("comments", "Comment Backlog")]):
+            age = backlog.loc[queue]
+            row = funnel.loc[queue]
+            with cards[2 * i]:
+                st.markdown(
+                    f"""<div class='analytics-card'>
+                        <div class='analytics-label'>{label}</div>
+                        <div class='analytics-value'>{int(age['count'])}</div>
+                        <div class='analytics-sub'>p50 age {_fmt_hours(age['p50'])} · p90 {_fmt_hours(age['p90'])}</div>
+                    </div>""",
+                    unsafe_allow_html=True,
+                )
+            with cards[2 * i + 1]:
+                st.markdown(
+                    f"""<div class='analytics-card'>
+                        <div class='analytics-label'>{label.split()[0]} Funnel</div>
+                        <div class='analytics-value'>{int(row['posted'])}</div>
+                        <div class='analytics-sub'>posted · {int(row['scheduled'])} scheduled ·
+                            {int(row['dropped'])} dropped</div>
+                    </div>""",
+                    unsafe_allow_html=True,
+                )
+
+        flow_l, flow_r = st.columns([3, 2])
+        with flow_l:
+            st.plotly_chart(pipeline_analytics.throughput_figure(), use_container_width=True)
+        with flow_r:
+            st.markdown(
+                "<div class='analytics-label'>Time in state (hours)</div>",
+                unsafe_allow_html=True,
+            )
+            st.dataframe(stages, use_container_width=True)
+    except ImportError:
+        st.info("Pipeline analytics need pandas and plotly (see requirements.txt).")
+
+    st.markdown("<div style='height:24px'></div>", unsafe_allow_html=True)
+    st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
+    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+
     # ── Post Quality Scorer ──────────────────────────────────────────────────────
     st.markdown(
         "<div style='font-size:1rem;font-weight:700;color:#FAFAFA;margin-bottom:8px;'>"
@@ -269,8 +301,8 @@ def render(api_url: str = "") -> None:
                     <div class='locked-title' style='color:{lock_color};'>{title}</div>
                     <div class='locked-sub'>{sub}</div>
                     {"" if li_connected else
-                     f"<div style='margin-top:12px;'><a href='{api_url}/auth/linkedin' target='_self' "
-                     f"style='font-size:0.78rem;color:#0A66C2;text-decoration:none;'>🔗 Connect LinkedIn</a></div>"}
+                     f"<div style='margin-top:12px;'><a class='locked-link' href='{api_url}/auth/linkedin' "
+                     f"target='_self'>🔗 Connect LinkedIn</a></div>"}
                 </div>""",
                 unsafe_allow_html=True,
             )
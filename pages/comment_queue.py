@@ -3,91 +3,11 @@ Comment Queue page — pending inbox with approve / schedule / edit / ignore act
 """
 
 import re
-import requests as _requests
 import streamlit as st
 from datetime import datetime, timedelta, timezone
+import card_cache
 import db
-
-_CSS = """
-<style>
-.comment-card {
-    background: #1E2130;
-    border-radius: 8px;
-    padding: 16px 18px;
-    margin-bottom: 6px;
-    border: 1px solid #2D3748;
-}
-.influencer-header {
-    display: flex;
-    align-items: center;
-    gap: 10px;
-    margin-bottom: 10px;
-}
-.inf-avatar {
-    width: 38px;
-    height: 38px;
-    border-radius: 50%;
-    background: #0A66C2;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-size: 0.88rem;
-    font-weight: 700;
-    color: #fff;
-    flex-shrink: 0;
-}
-.inf-name {
-    font-size: 0.9rem;
-    font-weight: 700;
-    color: #FAFAFA;
-}
-.post-snippet {
-    background: #0F1117;
-    border-left: 3px solid #2D3748;
-    border-radius: 0 6px 6px 0;
-    padding: 10px 14px;
-    font-size: 0.82rem;
-    color: #9AA0B2;
-    font-style: italic;
-    margin-bottom: 10px;
-    line-height: 1.5;
-}
-.reply-box {
-    background: #161825;
-    border: 1px solid #2D3748;
-    border-radius: 6px;
-    padding: 10px 14px;
-    font-size: 0.85rem;
-    color: #D0D4E0;
-    line-height: 1.55;
-    white-space: pre-wrap;
-    margin-bottom: 10px;
-}
-.group-label {
-    font-size: 0.78rem;
-    font-weight: 700;
-    color: #6B7280;
-    text-transform: uppercase;
-    letter-spacing: 0.07em;
-    margin: 20px 0 10px;
-}
-.posted-row {
-    display: flex;
-    align-items: center;
-    padding: 9px 0;
-    border-bottom: 1px solid #2D3748;
-    gap: 12px;
-    font-size: 0.85rem;
-}
-.empty-state {
-    text-align: center;
-    color: #6B7280;
-    font-size: 0.95rem;
-    padding: 60px 0 40px;
-}
-.empty-icon { font-size: 2.5rem; margin-bottom: 10px; }
-</style>
-"""
+import widgets
 
 
 def _extract_influencer_name(post_url: str, fallback: str) -> str:
@@ -106,18 +26,6 @@ def _initials(name: str) -> str:
     return name[:2].upper()
 
 
-def _api(method: str, path: str, api_url: str) -> tuple[bool, dict]:
-    try:
-        r = getattr(_requests, method)(f"{api_url}{path}", timeout=10)
-        try:
-            data = r.json()
-        except Exception:
-            data = {}
-        return r.status_code < 300, data
-    except Exception as e:
-        return False, {"error": str(e)}
-
-
 def _generate_time_slots() -> list[tuple[str, str]]:
     """Generate scheduling slots: next even hour, then every 2h up to 12h from now."""
     now = datetime.utcnow()
@@ -173,10 +81,20 @@ def _format_scheduled_time(iso_str: str) -> str:
     return f"Tomorrow at {hour_12}:00 {ampm} ET"
 
 
+def _reset_comment_panel() -> None:
+    st.session_state.pop("cm_panel", None)
+
+
+def _comment_label(n: int, row: dict) -> str:
+    inf_name = _extract_influencer_name(row.get("post_url", ""), row.get("influencer_name", ""))
+    text     = row.get("comment_text") or ""
+    return f"#{n} · {inf_name} — {text[:50]}{'…' if len(text) > 50 else ''}"
+
+
 def _render_pending_cards(rows: list[dict], api_url: str) -> None:
     if not rows:
         st.markdown(
-            '<div class="empty-state"><div class="empty-icon">✅</div>No pending comments</div>',
+            '<div class="empty-state lg"><div class="empty-icon">✅</div>No pending comments</div>',
             unsafe_allow_html=True,
         )
         return
@@ -190,6 +108,24 @@ def _render_pending_cards(rows: list[dict], api_url: str) -> None:
         )
         groups.setdefault(inf_name, []).append(row)
 
+    # Number cards in display (grouped) order so '#n' matches the selector
+    ordered = [row for group_rows in groups.values() for row in group_rows]
+    numbers = {row["id"]: n for n, row in enumerate(ordered, start=1)}
+
+    # ── Shared action bar: one selector + one set of buttons for the list ─────
+    sel_col, _ = st.columns([3, 2])
+    with sel_col:
+        selected = widgets.row_selector(
+            ordered,
+            key="cm_selected",
+            label_fn=_comment_label,
+            placeholder="Select a comment to act on…",
+            on_change=_reset_comment_panel,
+        )
+    if selected:
+        _render_comment_actions(selected, api_url)
+    selected_id = selected["id"] if selected else None
+
     for inf_name, group_rows in groups.items():
         inits = "?" if inf_name in ("", "Influencer") else _initials(inf_name)
         st.markdown(
@@ -197,198 +133,228 @@ def _render_pending_cards(rows: list[dict], api_url: str) -> None:
             unsafe_allow_html=True,
         )
 
+        # The '#n' pill depends on the row's position, so it is joined in
+        # here rather than cached.
         for row in group_rows:
-            row_id       = row["id"]
-            post_url     = row.get("post_url") or ""
-            post_content = row.get("post_content") or row.get("post_snippet") or ""
-            comment_text = row.get("comment_text") or ""
-            created      = row.get("created_at", "")[:16]
-
-            # View original post link — only shown for real https:// URLs
-            if post_url.startswith("https://"):
-                post_link_html = (
-                    '<div style="margin-bottom:8px;">'
-                    f'<a href="{post_url}" target="_blank" rel="noopener noreferrer" '
-                    'style="font-size:0.78rem;color:#0A66C2;text-decoration:none;">'
-                    'View original post →</a></div>'
-                )
-            else:
-                post_link_html = ""
-
-            # "Commenting on:" post context block
-            if post_content:
-                ctx_text = post_content[:200] + ("..." if len(post_content) > 200 else "")
-                post_context_html = (
-                    '<div style="font-size:0.75rem;color:#6B7280;margin-bottom:4px;">Commenting on:</div>'
-                    f'<div style="background:#161825;border-left:3px solid #0A66C2;'
-                    f'border-radius:0 4px 4px 0;padding:8px 12px;font-size:0.8rem;'
-                    f'color:#9AA0B2;line-height:1.5;margin-bottom:10px;">{ctx_text}</div>'
-                )
-            else:
-                post_context_html = (
-                    '<div style="font-size:0.75rem;color:#6B7280;margin-bottom:4px;">Commenting on:</div>'
-                    '<div style="background:#161825;border-left:3px solid #2D3748;'
-                    'border-radius:0 4px 4px 0;padding:8px 12px;font-size:0.8rem;'
-                    'color:#4B5563;font-style:italic;line-height:1.5;margin-bottom:10px;">'
-                    'Post content unavailable — view original post for context</div>'
-                )
-
+            is_sel     = row["id"] == selected_id
+            head, tail = card_cache.cached(
+                "cm_pending", row,
+                lambda: _comment_card_html(row, inf_name, inits, is_sel),
+                is_sel,
+            )
             st.markdown(
-                f"""
-                <div class="comment-card">
-                    <div class="influencer-header">
-                        <div class="inf-avatar">{inits}</div>
-                        <div>
-                            <div class="inf-name">{inf_name}</div>
-                            <div style="font-size:0.72rem;color:#6B7280;">Drafted {created}</div>
-                        </div>
-                    </div>
-                    {post_link_html}
-                    {post_context_html}
-                    <div class="reply-box">{comment_text}</div>
-                </div>
-                """,
+                head + widgets.row_number_pill(numbers[row["id"]], is_sel) + tail,
                 unsafe_allow_html=True,
             )
 
-            btn1, btn2, btn3, btn4, _spacer = st.columns([1.3, 1.1, 1, 1, 3])
+            st.markdown("<div style='height:4px'></div>", unsafe_allow_html=True)
 
-            with btn1:
-                if st.button("✅ Approve & Post", key=f"cm_approve_{row_id}", type="primary"):
-                    ok, resp = _api("post", f"/comments/{row_id}/approve", api_url)
-                    if ok:
-                        st.toast("✅ Comment posted to LinkedIn")
-                        st.rerun()
-                    else:
-                        err = resp.get("error", "Unknown error")
-                        st.error(f"Failed to post: {err}")
-
-            with btn2:
-                scheduling_this = st.session_state.get("scheduling_comment_id") == row_id
-                label = "⏰ Cancel Schedule" if scheduling_this else "⏰ Schedule"
-                if st.button(label, key=f"cm_schedule_btn_{row_id}"):
-                    if scheduling_this:
-                        st.session_state.pop("scheduling_comment_id", None)
-                    else:
-                        st.session_state["scheduling_comment_id"] = row_id
-                        st.session_state.pop(f"cm_editing_{row_id}", None)
-                    st.rerun()
 
-            with btn3:
-                if st.button("✏️ Edit", key=f"cm_edit_{row_id}"):
-                    st.session_state[f"cm_editing_{row_id}"] = not st.session_state.get(
-                        f"cm_editing_{row_id}", False
-                    )
-                    st.session_state.pop("scheduling_comment_id", None)
-                    st.rerun()
+def _comment_card_html(row: dict, inf_name: str, inits: str, is_sel: bool) -> tuple[str, str]:
+    """The card split where the '#n' pill goes."""
+    post_url     = row.get("post_url") or ""
+    post_content = row.get("post_content") or row.get("post_snippet") or ""
+    comment_text = row.get("comment_text") or ""
+    created      = row.get("created_at", "")[:16]
 
-            with btn4:
-                if st.button("🚫 Ignore", key=f"cm_ignore_{row_id}"):
-                    _api("post", f"/comments/{row_id}/ignore", api_url)
-                    db.update_comment_status(row_id, "ignored")
-                    st.rerun()
+    # View original post link — only shown for real https:// URLs
+    if post_url.startswith("https://"):
+        post_link_html = (
+            '<div style="margin-bottom:8px;">'
+            f'<a class="row-link" href="{post_url}" target="_blank" rel="noopener noreferrer">'
+            'View original post →</a></div>'
+        )
+    else:
+        post_link_html = ""
+
+    # "Commenting on:" post context block
+    if post_content:
+        ctx_text = post_content[:200] + ("..." if len(post_content) > 200 else "")
+        post_context_html = (
+            '<div class="ctx-label">Commenting on:</div>'
+            f'<div class="ctx-block">{ctx_text}</div>'
+        )
+    else:
+        post_context_html = (
+            '<div class="ctx-label">Commenting on:</div>'
+            '<div class="ctx-block empty">'
+            'Post content unavailable — view original post for context</div>'
+        )
 
-            # Inline scheduler
-            if st.session_state.get("scheduling_comment_id") == row_id:
-                slots = _generate_time_slots()
-                if not slots:
-                    st.warning("No scheduling slots available in the next 12 hours.")
-                else:
-                    with st.form(key=f"cm_schedule_form_{row_id}"):
-                        slot_labels = [s[0] for s in slots]
-                        slot_isos   = [s[1] for s in slots]
-                        choice_idx = st.selectbox(
-                            "Post at:",
-                            range(len(slot_labels)),
-                            format_func=lambda i: slot_labels[i],
-                            key=f"cm_slot_select_{row_id}",
-                        )
-                        sc, cc = st.columns(2)
-                        with sc:
-                            if st.form_submit_button("Confirm Schedule", use_container_width=True, type="primary"):
-                                result = db.schedule_comment(row_id, slot_isos[choice_idx])
-                                if result.get("ok"):
-                                    st.session_state.pop("scheduling_comment_id", None)
-                                    st.toast(f"⏰ Scheduled: {slot_labels[choice_idx]}")
-                                    st.rerun()
-                                else:
-                                    st.error(result.get("error", "Failed to schedule"))
-                        with cc:
-                            if st.form_submit_button("Cancel", use_container_width=True):
-                                st.session_state.pop("scheduling_comment_id", None)
-                                st.rerun()
-
-            # Inline edit form
-            if st.session_state.get(f"cm_editing_{row_id}"):
-                with st.form(key=f"cm_edit_form_{row_id}"):
-                    new_text = st.text_area("Edit reply", value=comment_text, height=130)
-                    sc, cc = st.columns(2)
-                    with sc:
-                        if st.form_submit_button("💾 Save", use_container_width=True):
-                            db.update_comment_text(row_id, new_text)
-                            st.session_state[f"cm_editing_{row_id}"] = False
-                            st.toast("✅ Reply updated")
-                            st.rerun()
-                    with cc:
-                        if st.form_submit_button("Cancel", use_container_width=True):
-                            st.session_state[f"cm_editing_{row_id}"] = False
+    head = f"""
+        <div class="comment-card{" selected" if is_sel else ""}">
+            <div class="influencer-header">
+                <div class="inf-avatar">{inits}</div>
+                <div>
+                    <div class="inf-name">{inf_name}</div>
+                    <div class="card-meta">Drafted {created}</div>
+                </div>
+                <div style="margin-left:auto;">{widgets.offline_badge(row)}"""
+    tail = f"""</div>
+            </div>
+            {post_link_html}
+            {post_context_html}
+            <div class="reply-box">{comment_text}</div>
+        </div>
+        """
+    return head, tail
+
+
+def _render_comment_actions(row: dict, api_url: str) -> None:
+    row_id       = row["id"]
+    comment_text = row.get("comment_text") or ""
+    panel        = st.session_state.get("cm_panel")
+
+    btn1, btn2, btn3, btn4, _spacer = st.columns([1.3, 1.1, 1, 1, 3])
+
+    with btn1:
+        if st.button("✅ Approve & Post", key="cm_approve", type="primary"):
+            resp = db.approve_comment(row_id)
+            if resp.get("queued"):
+                _reset_comment_panel()
+                st.toast("📴 Backend unreachable — approval saved, it will post once the backend is back")
+                st.rerun()
+            elif resp.get("ok"):
+                st.toast("✅ Comment posted to LinkedIn")
+                st.rerun()
+            elif resp.get("reconnect"):
+                st.error("LinkedIn session expired — please reconnect.")
+            elif resp.get("unknown"):
+                st.warning(resp["error"])
+            else:
+                err = resp.get("error", "Unknown error")
+                st.error(f"Failed to post: {err}")
+
+    with btn2:
+        label = "⏰ Cancel Schedule" if panel == "schedule" else "⏰ Schedule"
+        if st.button(label, key="cm_schedule_btn"):
+            st.session_state["cm_panel"] = None if panel == "schedule" else "schedule"
+            st.rerun()
+
+    with btn3:
+        if st.button("✏️ Edit", key="cm_edit"):
+            st.session_state["cm_panel"] = None if panel == "edit" else "edit"
+            st.rerun()
+
+    with btn4:
+        if st.button("🚫 Ignore", key="cm_ignore"):
+            db.ignore_comment(row_id)
+            db.update_comment_status(row_id, "ignored")
+            _reset_comment_panel()
+            st.rerun()
+
+    # Inline scheduler
+    if panel == "schedule":
+        slots = _generate_time_slots()
+        if not slots:
+            st.warning("No scheduling slots available in the next 12 hours.")
+        else:
+            with st.form(key="cm_schedule_form"):
+                slot_labels = [s[0] for s in slots]
+                slot_isos   = [s[1] for s in slots]
+                choice_idx = st.selectbox(
+                    "Post at:",
+                    range(len(slot_labels)),
+                    format_func=lambda i: slot_labels[i],
+                    key="cm_slot_select",
+                )
+                sc, cc = st.columns(2)
+                with sc:
+                    if st.form_submit_button("Confirm Schedule", use_container_width=True, type="primary"):
+                        result = db.schedule_comment(row_id, slot_isos[choice_idx])
+                        if result.get("ok"):
+                            _reset_comment_panel()
+                            st.toast(f"⏰ Scheduled: {slot_labels[choice_idx]}")
                             st.rerun()
+                        else:
+                            st.error(result.get("error", "Failed to schedule"))
+                with cc:
+                    if st.form_submit_button("Cancel", use_container_width=True):
+                        _reset_comment_panel()
+                        st.rerun()
 
-            st.markdown("<div style='height:4px'></div>", unsafe_allow_html=True)
+    # Inline edit form
+    if panel == "edit":
+        with st.form(key=f"cm_edit_form_{row_id}"):
+            new_text = st.text_area("Edit reply", value=comment_text, height=130)
+            sc, cc = st.columns(2)
+            with sc:
+                if st.form_submit_button("💾 Save", use_container_width=True):
+                    db.update_comment_text(row_id, new_text)
+                    _reset_comment_panel()
+                    st.toast("✅ Reply updated")
+                    st.rerun()
+            with cc:
+                if st.form_submit_button("Cancel", use_container_width=True):
+                    _reset_comment_panel()
+                    st.rerun()
 
 
 def _render_scheduled_rows(rows: list[dict], api_url: str) -> None:
     if not rows:
         st.markdown(
-            '<div class="empty-state"><div class="empty-icon">⏰</div>No scheduled comments</div>',
+            '<div class="empty-state lg"><div class="empty-icon">⏰</div>No scheduled comments</div>',
             unsafe_allow_html=True,
         )
         return
 
     st.info("Scheduled comments are posted automatically every 15 minutes.")
 
+    # ── Shared action bar: one selector + one Cancel button for the list ──────
+    sel_col, bar_col = st.columns([3, 2])
+    with sel_col:
+        selected = widgets.row_selector(
+            rows,
+            key="cm_sched_selected",
+            label_fn=_comment_label,
+            placeholder="Select a scheduled comment to act on…",
+        )
+    if selected:
+        with bar_col:
+            if st.button("↩ Cancel schedule", key="cm_sched_cancel", help="Return to pending",
+                         use_container_width=True):
+                db.update_comment_status(selected["id"], "pending")
+                st.rerun()
+    selected_id = selected["id"] if selected else None
+
     # Table header
     st.markdown(
         "<div style='display:flex;padding:6px 0;border-bottom:2px solid #374151;"
         "font-size:0.72rem;color:#6B7280;text-transform:uppercase;letter-spacing:0.06em;gap:12px;'>"
-        "<span style='flex:2;'>Influencer</span>"
-        "<span style='flex:4;'>Comment</span>"
-        "<span style='flex:2;'>Scheduled For</span>"
-        "<span style='flex:1;'>Action</span>"
+        "<span class='row-num-cell'>#</span>"
+        "<span class='flex-2'>Influencer</span>"
+        "<span class='flex-4'>Comment</span>"
+        "<span class='flex-2'>Scheduled For</span>"
         "</div>",
         unsafe_allow_html=True,
     )
 
-    for row in rows:
-        inf_name     = _extract_influencer_name(row.get("post_url", ""), row.get("influencer_name", ""))
-        comment_text = row.get("comment_text") or ""
-        scheduled_at = row.get("scheduled_at") or ""
-        row_id       = row["id"]
-        truncated    = comment_text[:80] + ("…" if len(comment_text) > 80 else "")
-        time_label   = _format_scheduled_time(scheduled_at)
-        inits        = "?" if inf_name in ("", "Influencer") else _initials(inf_name)
-
-        col_info, col_btn = st.columns([10, 1.5])
-        with col_info:
-            st.markdown(
-                f"<div style='display:flex;align-items:center;padding:9px 0;"
-                f"border-bottom:1px solid #2D3748;gap:12px;'>"
-                f"<span style='flex:2;font-size:0.85rem;font-weight:700;color:#FAFAFA;'>{inf_name}</span>"
-                f"<span style='flex:4;font-size:0.83rem;color:#9AA0B2;'>{truncated}</span>"
-                f"<span style='flex:2;font-size:0.78rem;color:#F59E0B;font-weight:600;'>{time_label}</span>"
-                f"</div>",
-                unsafe_allow_html=True,
-            )
-        with col_btn:
-            if st.button("Cancel", key=f"cm_sched_cancel_{row_id}", help="Return to pending"):
-                db.update_comment_status(row_id, "pending")
-                st.rerun()
+    for n, row in enumerate(rows, start=1):
+        is_sel = row["id"] == selected_id
+        cells  = card_cache.cached("cm_scheduled", row, lambda: _scheduled_row_cells(row))
+        st.markdown(
+            f"<div class='list-row{' selected' if is_sel else ''}'>"
+            f"<span class='row-num-cell'>{widgets.row_number_pill(n, is_sel)}</span>{cells}</div>",
+            unsafe_allow_html=True,
+        )
+
+
+def _scheduled_row_cells(row: dict) -> str:
+    inf_name     = _extract_influencer_name(row.get("post_url", ""), row.get("influencer_name", ""))
+    comment_text = row.get("comment_text") or ""
+    truncated    = comment_text[:80] + ("…" if len(comment_text) > 80 else "")
+    time_label   = _format_scheduled_time(row.get("scheduled_at") or "")
+    return (
+        f"<span class='cell-name flex-2'>{inf_name}</span>"
+        f"<span class='cell-text flex-4'>{truncated}</span>"
+        f"<span class='cell-when flex-2'>{time_label}{widgets.offline_badge(row)}</span>"
+    )
 
 
 def _render_posted_rows(rows: list[dict]) -> None:
     if not rows:
         st.markdown(
-            '<div class="empty-state"><div class="empty-icon">📭</div>No posted comments yet</div>',
+            '<div class="empty-state lg"><div class="empty-icon">📭</div>No posted comments yet</div>',
             unsafe_allow_html=True,
         )
         return
@@ -397,66 +363,73 @@ def _render_posted_rows(rows: list[dict]) -> None:
     st.markdown(
         "<div style='display:flex;padding:6px 0;border-bottom:2px solid #374151;"
         "font-size:0.72rem;color:#6B7280;text-transform:uppercase;letter-spacing:0.06em;gap:12px;'>"
-        "<span style='flex:2;'>Influencer</span>"
-        "<span style='flex:4;'>Comment</span>"
-        "<span style='flex:1.5;'>Posted</span>"
-        "<span style='flex:1;'>Link</span>"
+        "<span class='flex-2'>Influencer</span>"
+        "<span class='flex-4'>Comment</span>"
+        "<span class='flex-1-5'>Posted</span>"
+        "<span class='flex-1'>Link</span>"
         "</div>",
         unsafe_allow_html=True,
     )
 
     for row in rows:
-        inf_name     = _extract_influencer_name(row.get("post_url", ""), row.get("influencer_name", ""))
-        comment_text = row.get("comment_text") or ""
-        post_url     = row.get("post_url") or ""
-        posted_at    = (row.get("posted_at") or row.get("created_at") or "")[:16]
-        truncated    = comment_text[:80] + ("…" if len(comment_text) > 80 else "")
-
-        link_html = (
-            f'<a href="{post_url}" target="_blank" '
-            f'style="color:#0A66C2;text-decoration:none;font-size:0.8rem;">View post →</a>'
-            if post_url
-            else '<span style="color:#4B5563;font-size:0.8rem;">—</span>'
-        )
-
         st.markdown(
-            f"<div style='display:flex;align-items:center;padding:9px 0;"
-            f"border-bottom:1px solid #2D3748;gap:12px;'>"
-            f"<span style='flex:2;font-size:0.85rem;font-weight:700;color:#FAFAFA;'>{inf_name}</span>"
-            f"<span style='flex:4;font-size:0.83rem;color:#9AA0B2;'>{truncated}</span>"
-            f"<span style='flex:1.5;font-size:0.75rem;color:#6B7280;'>{posted_at}</span>"
-            f"<span style='flex:1;'>{link_html}</span>"
-            f"</div>",
+            card_cache.cached("cm_posted", row, lambda: _posted_row_html(row)),
             unsafe_allow_html=True,
         )
 
 
+def _posted_row_html(row: dict) -> str:
+    inf_name     = _extract_influencer_name(row.get("post_url", ""), row.get("influencer_name", ""))
+    comment_text = row.get("comment_text") or ""
+    post_url     = row.get("post_url") or ""
+    posted_at    = (row.get("posted_at") or row.get("created_at") or "")[:16]
+    truncated    = comment_text[:80] + ("…" if len(comment_text) > 80 else "")
+
+    link_html = (
+        f'<a class="row-link" href="{post_url}" target="_blank">View post →</a>'
+        if post_url
+        else '<span class="row-link-empty">—</span>'
+    )
+    return (
+        f"<div class='list-row'>"
+        f"<span class='cell-name flex-2'>{inf_name}</span>"
+        f"<span class='cell-text flex-4'>{truncated}</span>"
+        f"<span class='cell-date flex-1-5'>{posted_at}</span>"
+        f"<span class='flex-1'>{link_html}{widgets.offline_badge(row)}</span>"
+        f"</div>"
+    )
+
+
 def _render_ignored_rows(rows: list[dict]) -> None:
     if not rows:
         st.markdown(
-            '<div class="empty-state"><div class="empty-icon">🚫</div>No ignored comments</div>',
+            '<div class="empty-state lg"><div class="empty-icon">🚫</div>No ignored comments</div>',
             unsafe_allow_html=True,
         )
         return
 
     for row in rows:
-        inf_name     = _extract_influencer_name(row.get("post_url", ""), row.get("influencer_name", ""))
-        comment_text = row.get("comment_text") or ""
-        created      = (row.get("created_at") or "")[:16]
-        truncated    = comment_text[:80] + ("…" if len(comment_text) > 80 else "")
         st.markdown(
-            f"<div style='display:flex;align-items:center;padding:9px 0;"
-            f"border-bottom:1px solid #2D3748;gap:12px;color:#4B5563;'>"
-            f"<span style='flex:2;font-size:0.85rem;'>{inf_name}</span>"
-            f"<span style='flex:4;font-size:0.83rem;'>{truncated}</span>"
-            f"<span style='flex:1.5;font-size:0.75rem;'>{created}</span>"
-            f"</div>",
+            card_cache.cached("cm_ignored", row, lambda: _ignored_row_html(row)),
             unsafe_allow_html=True,
         )
 
 
+def _ignored_row_html(row: dict) -> str:
+    inf_name     = _extract_influencer_name(row.get("post_url", ""), row.get("influencer_name", ""))
+    comment_text = row.get("comment_text") or ""
+    created      = (row.get("created_at") or "")[:16]
+    truncated    = comment_text[:80] + ("…" if len(comment_text) > 80 else "")
+    return (
+        f"<div class='list-row muted'>"
+        f"<span class='cell-name flex-2'>{inf_name}</span>"
+        f"<span class='cell-text flex-4'>{truncated}</span>"
+        f"<span class='cell-date flex-1-5'>{created}{widgets.offline_badge(row)}</span>"
+        f"</div>"
+    )
+
+
 def render(api_url: str = "http://localhost:8000") -> None:
-    st.markdown(_CSS, unsafe_allow_html=True)
 
     all_rows  = db.get_comment_queue()
     pending   = [r for r in all_rows if r["status"] in ("pending", "pending_urn")]
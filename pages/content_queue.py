@@ -4,19 +4,14 @@ Content Queue page — LinkedIn post cards with approval flow.
 """
 
 import re
-import requests as _requests
 import streamlit as st
 from datetime import datetime, timedelta
+import card_cache
 import db
-
-_NICHE_KEYWORDS = {
-    "AML": ["aml", "anti-money", "money laundering", "bsa", "suspicious", "sar"],
-    "Fraud": ["fraud", "scam", "synthetic", "identity theft", "mule"],
-    "KYC": ["kyc", "know your customer", "onboarding", "verification", "cdd"],
-    "Sanctions": ["sanctions", "ofac", "sdn", "compliance", "prohibited"],
-    "RegTech": ["regtech", "regulation", "fincen", "compliance tech", "ai", "model"],
-    "Crypto": ["crypto", "blockchain", "defi", "digital asset", "bitcoin", "ethereum"],
-}
+import niches
+import profile_cache
+import publish_queue
+import widgets
 
 _NICHE_COLORS = {
     "AML":       "#0A66C2",
@@ -27,97 +22,8 @@ _NICHE_COLORS = {
     "Crypto":    "#F39C12",
 }
 
-_CSS = """
-<style>
-.post-card {
-    background: #1E2130;
-    border-radius: 8px;
-    padding: 24px;
-    margin-bottom: 6px;
-    border: 1px solid #2D3748;
-    box-shadow: 0 1px 4px rgba(0,0,0,0.35);
-}
-.post-card-header {
-    display: flex;
-    align-items: center;
-    gap: 10px;
-    margin-bottom: 12px;
-}
-.post-avatar {
-    width: 40px;
-    height: 40px;
-    border-radius: 50%;
-    background: #0A66C2;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    flex-shrink: 0;
-    font-size: 1.1rem;
-    color: #fff;
-}
-.post-avatar img {
-    width: 40px;
-    height: 40px;
-    border-radius: 50%;
-    object-fit: cover;
-}
-.post-profile-name {
-    font-size: 0.9rem;
-    font-weight: 700;
-    color: #FAFAFA;
-}
-.post-profile-sub {
-    font-size: 0.75rem;
-    color: #9AA0B2;
-}
-.post-body {
-    font-size: 0.88rem;
-    color: #D0D4E0;
-    line-height: 1.6;
-    white-space: pre-wrap;
-    margin-bottom: 14px;
-}
-.post-footer {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    flex-wrap: wrap;
-    gap: 6px;
-}
-.niche-pill {
-    display: inline-block;
-    padding: 2px 10px;
-    border-radius: 20px;
-    font-size: 0.70rem;
-    font-weight: 700;
-    color: #fff;
-}
-.char-badge {
-    font-size: 0.72rem;
-    padding: 2px 10px;
-    border-radius: 20px;
-    font-weight: 600;
-}
-.char-ok   { background: #1A2A1A; color: #6B9B6B; }
-.char-warn { background: #2A2000; color: #F5A623; }
-.char-over { background: #2A0000; color: #CC1016; }
-.empty-state {
-    text-align: center;
-    color: #6B7280;
-    font-size: 0.9rem;
-    padding: 60px 0 40px;
-}
-.empty-icon { font-size: 2.5rem; margin-bottom: 10px; }
-</style>
-"""
-
-
-def _extract_topic(title: str, body: str) -> str:
-    text = (title + " " + body).lower()
-    for niche, kws in _NICHE_KEYWORDS.items():
-        if any(kw in text for kw in kws):
-            return niche
-    return "FinCrime"
+_PUBLISH_POLL   = 1.0   # seconds between progress refreshes while a batch runs
+_PUBLISH_ICONS  = {"queued": "⏳", "publishing": "📤", "done": "✅", "failed": "❌"}
 
 
 def _char_badge(n: int) -> str:
@@ -202,6 +108,15 @@ def _format_scheduled_time(iso_str: str) -> str:
     return f"Tomorrow at {hour_12}:00 {ampm} ET"
 
 
+def _reset_draft_panel() -> None:
+    st.session_state.pop("cq_panel", None)
+
+
+def _draft_label(n: int, row: dict) -> str:
+    title = row.get("title") or (row.get("body") or "")[:60] or "Untitled"
+    return f"#{n} · {title[:70]}"
+
+
 def _render_draft_cards(rows: list[dict], api_url: str) -> None:
     if not rows:
         st.markdown(
@@ -212,174 +127,256 @@ def _render_draft_cards(rows: list[dict], api_url: str) -> None:
         )
         return
 
-    pic_url       = st.session_state.get("linkedin_profile_picture_url") or ""
-    profile_name  = st.session_state.get("linkedin_profile_name") or ""
-    profile_title = st.session_state.get("linkedin_profile_title") or ""
+    # ── Publish queue: several drafts at once, off the script thread ──────────
+    _render_publish_bar(rows)
+
+    # ── Shared action bar: one selector + one set of buttons for the list ─────
+    sel_col, _ = st.columns([3, 2])
+    with sel_col:
+        selected = widgets.row_selector(
+            rows,
+            key="cq_selected",
+            label_fn=_draft_label,
+            placeholder="Select a draft to act on…",
+            on_change=_reset_draft_panel,
+        )
+    if selected:
+        _render_draft_actions(selected, api_url)
+    st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
+
+    profile       = profile_cache.current()
+    pic_url       = profile["picture_url"]
+    profile_name  = profile["name"]
+    profile_title = profile["headline"]
+    profile_fp    = card_cache.fingerprint(pic_url, profile_name, profile_title)
+    avatar_html   = _avatar_html(pic_url, profile_name, profile_title)
+    selected_id   = selected["id"] if selected else None
+
+    # The '#n' pill depends on the row's position, so it is joined in here
+    # rather than cached: a row moving up the list keeps its cached card.
+    for n, row in enumerate(rows, start=1):
+        is_sel     = row["id"] == selected_id
+        head, tail = card_cache.cached(
+            "cq_draft", row,
+            lambda: _draft_card_html(row, is_sel, avatar_html),
+            is_sel, profile_fp,
+        )
+        st.markdown(head + widgets.row_number_pill(n, is_sel) + tail, unsafe_allow_html=True)
 
-    for row in rows:
-        row_id     = row["id"]
-        title      = row.get("title") or "Untitled"
-        body       = row.get("body") or ""
-        created    = row.get("created_at", "")[:16]
-        char_count = len(body)
-        topic      = _extract_topic(title, body)
 
-        avatar_html = _avatar_html(pic_url, profile_name, profile_title)
+def _draft_card_html(row: dict, is_sel: bool, avatar_html: str) -> tuple[str, str]:
+    """The card split where the '#n' pill goes."""
+    title      = row.get("title") or "Untitled"
+    body       = row.get("body") or ""
+    created    = row.get("created_at", "")[:16]
+    char_count = len(body)
+    topic      = niches.extract_topic(title, body)
 
-        st.markdown(
-            f"""
-            <div class="post-card">
-                <div class="post-card-header">
-                    {avatar_html}
-                </div>
-                <div class="post-body">{body[:600]}{"…" if len(body) > 600 else ""}</div>
-                <div class="post-footer">
-                    <div>{_niche_pill(topic)}</div>
-                    <div>
-                        {_char_badge(char_count)}
-                        &nbsp;<span style="font-size:0.72rem;color:#6B7280;">{created}</span>
-                    </div>
+    head = f"""
+        <div class="post-card{" selected" if is_sel else ""}">
+            <div class="post-card-header">
+                {avatar_html}
+            </div>
+            <div class="post-body">{body[:600]}{"…" if len(body) > 600 else ""}</div>
+            <div class="post-footer">
+                <div>"""
+    tail = f""" {_niche_pill(topic)}{widgets.offline_badge(row)}</div>
+                <div>
+                    {_char_badge(char_count)}
+                    &nbsp;<span class="card-meta">{created}</span>
                 </div>
             </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        </div>
+        """
+    return head, tail
 
-        scheduling_this = st.session_state.get("cq_scheduling_id") == row_id
-        confirming_delete = st.session_state.get(f"cq_confirm_delete_{row_id}", False)
 
-        btn1, btn1b, btn2, btn3, btn4, _spacer = st.columns([1.2, 1.2, 1.2, 1, 0.6, 2])
+def _publish_busy() -> bool:
+    batch = publish_queue.get(st.session_state.get("cq_batch"))
+    return batch is not None and not batch.done
 
-        with btn1:
-            if st.button("📤 Post Now", key=f"cq_postnow_{row_id}", type="primary"):
-                try:
-                    r    = _requests.post(f"{api_url}/posts/{row_id}/publish", timeout=20)
-                    data = r.json()
-                    if data.get("ok"):
-                        li_id = data.get("linkedin_post_id", "")
-                        st.toast(f"✅ Posted to LinkedIn!{' ID: ' + li_id if li_id else ''}")
-                        st.rerun()
-                    elif data.get("action") == "reconnect" or r.status_code == 401:
-                        st.error(
-                            "LinkedIn session expired — please disconnect and reconnect "
-                            "LinkedIn from the top of the page."
-                        )
-                    else:
-                        err = data.get("error") or "Publish failed"
-                        details = data.get("details")
-                        msg = f"Post failed: {err}"
-                        if details:
-                            msg += f"\n\nDetails: {details}"
-                        st.error(msg)
-                except Exception as e:
-                    st.error(f"Error: {e}")
-
-        with btn1b:
-            if st.button("📋 Save to LinkedIn", key=f"cq_draft_{row_id}"):
-                try:
-                    r = _requests.post(f"{api_url}/posts/{row_id}/publish-draft", timeout=20)
-                    data = r.json()
-                    if data.get("ok"):
-                        st.toast("✅ Saved as draft on LinkedIn!")
-                        st.rerun()
-                    elif data.get("action") == "reconnect" or r.status_code == 401:
-                        st.error("LinkedIn session expired — please reconnect.")
-                    else:
-                        st.error(f"Failed: {data.get('error', 'Unknown error')}")
-                except Exception as e:
-                    st.error(f"Error: {e}")
-
-        with btn2:
-            sched_label = "⏰ Cancel" if scheduling_this else "⏰ Schedule"
-            if st.button(sched_label, key=f"cq_sched_btn_{row_id}"):
-                if scheduling_this:
-                    st.session_state.pop("cq_scheduling_id", None)
-                else:
-                    st.session_state["cq_scheduling_id"] = row_id
-                    st.session_state.pop(f"cq_editing_{row_id}", None)
-                st.rerun()
 
-        with btn3:
-            if st.button("✏️ Edit", key=f"cq_edit_{row_id}"):
-                st.session_state[f"cq_editing_{row_id}"] = not st.session_state.get(
-                    f"cq_editing_{row_id}", False
-                )
-                st.session_state.pop("cq_scheduling_id", None)
-                st.rerun()
+def _start_publish(action: str, rows: list[dict]) -> None:
+    batch, skipped = publish_queue.submit(action, rows)
+    if skipped:
+        st.toast(f"{len(skipped)} draft(s) already publishing — skipped")
+    if batch is not None:
+        publish_queue.forget(st.session_state.get("cq_batch"))
+        st.session_state["cq_batch"] = batch.id
+        st.session_state.pop("cq_multi", None)
+        st.rerun()
 
-        with btn4:
-            if not confirming_delete:
-                if st.button("🗑️", key=f"cq_delete_{row_id}", help="Delete post"):
-                    st.session_state[f"cq_confirm_delete_{row_id}"] = True
-                    st.rerun()
-            else:
-                if st.button("Confirm", key=f"cq_delete_confirm_{row_id}", type="primary"):
-                    r = _requests.delete(f"{api_url}/posts/{row_id}", timeout=5)
-                    db.delete_content(row_id)
-                    st.session_state.pop(f"cq_confirm_delete_{row_id}", None)
-                    st.rerun()
 
-        # Delete confirmation prompt
-        if confirming_delete:
-            c1, c2, _ = st.columns([1, 1, 5])
-            with c1:
-                st.warning("Delete this post?")
-            with c2:
-                if st.button("Cancel", key=f"cq_delete_cancel_{row_id}"):
-                    st.session_state.pop(f"cq_confirm_delete_{row_id}", None)
-                    st.rerun()
+def _render_publish_bar(rows: list[dict]) -> None:
+    multi_col, post_col, save_col = st.columns([3, 1, 1])
+    with multi_col:
+        picked = widgets.row_multiselect(
+            rows, key="cq_multi", label_fn=_draft_label,
+            placeholder="Select drafts to publish together…",
+        )
+    busy = _publish_busy()
+    with post_col:
+        if st.button(
+            f"📤 Post {len(picked)}" if picked else "📤 Post selected",
+            key="cq_multi_post", type="primary", use_container_width=True,
+            disabled=busy or not picked,
+        ):
+            _start_publish("publish", picked)
+    with save_col:
+        if st.button(
+            "📋 Save to LinkedIn", key="cq_multi_draft", use_container_width=True,
+            disabled=busy or not picked,
+        ):
+            _start_publish("draft", picked)
+
+
+def _publish_progress_html(batch: publish_queue.Batch) -> str:
+    counts = batch.counts()
+    verb   = "Saving" if batch.action == "draft" else "Publishing"
+    if batch.done:
+        head = f"{counts['done']} succeeded · {counts['failed']} failed"
+    else:
+        head = f"{verb} {len(batch.items)} draft(s) — {counts['done'] + counts['failed']} finished"
+    items = "".join(
+        f"<div class='publish-item {item['state']}'>"
+        f"<span class='publish-state'>{_PUBLISH_ICONS[item['state']]}</span>"
+        f"<span class='publish-title'>{item['title'][:70]}</span>"
+        f"<span class='publish-msg'>{item['message']}</span>"
+        f"</div>"
+        for item in batch.items
+    )
+    return f"<div class='publish-progress'><div class='publish-head'>{head}</div>{items}</div>"
 
-        # Inline scheduler
-        if scheduling_this:
-            slots = _generate_time_slots()
-            if not slots:
-                st.warning("No scheduling slots available in the next 12 hours.")
-            else:
-                with st.form(key=f"cq_sched_form_{row_id}"):
-                    slot_labels = [s[0] for s in slots]
-                    slot_isos   = [s[1] for s in slots]
-                    choice_idx = st.selectbox(
-                        "Publish at:",
-                        range(len(slot_labels)),
-                        format_func=lambda i: slot_labels[i],
-                        key=f"cq_slot_select_{row_id}",
-                    )
-                    sc, cc = st.columns(2)
-                    with sc:
-                        if st.form_submit_button("Confirm Schedule", use_container_width=True, type="primary"):
-                            result = db.schedule_post(row_id, slot_isos[choice_idx])
-                            if result.get("ok"):
-                                st.session_state.pop("cq_scheduling_id", None)
-                                st.toast(f"⏰ Scheduled: {slot_labels[choice_idx]}")
-                                st.rerun()
-                            else:
-                                st.error(result.get("error", "Failed to schedule"))
-                    with cc:
-                        if st.form_submit_button("Cancel", use_container_width=True):
-                            st.session_state.pop("cq_scheduling_id", None)
-                            st.rerun()
 
-        # Inline edit form
-        if st.session_state.get(f"cq_editing_{row_id}"):
-            with st.form(key=f"cq_edit_form_{row_id}"):
-                new_body = st.text_area("Edit post", value=body, height=200)
-                if len(new_body) > 3000:
-                    st.warning(f"⚠️ {len(new_body)} chars — over LinkedIn 3000 char limit")
-                elif len(new_body) > 2500:
-                    st.warning(f"⚠️ {len(new_body)} chars — approaching limit")
+def _render_publish_progress() -> None:
+    """Per-item progress of this session's batch, shown above every filter
+    (the batch may have posted the last draft). Polls as a fragment while the
+    batch runs; the fragment settles a finished batch once — dropping metrics
+    and doing one full rerun to refresh the queue."""
+    batch = publish_queue.get(st.session_state.get("cq_batch"))
+    if batch is None:
+        return
+
+    @st.experimental_fragment(run_every=None if batch.done else _PUBLISH_POLL)
+    def progress() -> None:
+        current = publish_queue.get(st.session_state.get("cq_batch"))
+        if current is None:
+            return
+        if current.done and st.session_state.get("cq_batch_settled") != current.id:
+            st.session_state["cq_batch_settled"] = current.id
+            db.invalidate_metrics()
+            db.invalidate_analytics()
+            st.rerun()
+        st.markdown(_publish_progress_html(current), unsafe_allow_html=True)
+        if any(item["reconnect"] for item in current.items):
+            st.error("LinkedIn session expired — please disconnect and reconnect LinkedIn from the top of the page.")
+        if current.done and st.button("Dismiss", key="cq_batch_dismiss"):
+            publish_queue.forget(current.id)
+            st.session_state.pop("cq_batch", None)
+            st.rerun()
+
+    progress()
+
+
+def _render_draft_actions(row: dict, api_url: str) -> None:
+    row_id = row["id"]
+    body   = row.get("body") or ""
+    panel  = st.session_state.get("cq_panel")
+
+    btn1, btn1b, btn2, btn3, btn4, _spacer = st.columns([1.2, 1.2, 1.2, 1, 0.6, 2])
+
+    busy = _publish_busy()
+
+    with btn1:
+        if st.button("📤 Post Now", key="cq_postnow", type="primary", disabled=busy):
+            _start_publish("publish", [row])
+
+    with btn1b:
+        if st.button("📋 Save to LinkedIn", key="cq_draft", disabled=busy):
+            _start_publish("draft", [row])
+
+    with btn2:
+        sched_label = "⏰ Cancel" if panel == "schedule" else "⏰ Schedule"
+        if st.button(sched_label, key="cq_sched_btn"):
+            st.session_state["cq_panel"] = None if panel == "schedule" else "schedule"
+            st.rerun()
+
+    with btn3:
+        if st.button("✏️ Edit", key="cq_edit"):
+            st.session_state["cq_panel"] = None if panel == "edit" else "edit"
+            st.rerun()
+
+    with btn4:
+        if panel != "delete":
+            if st.button("🗑️", key="cq_delete", help="Delete post"):
+                st.session_state["cq_panel"] = "delete"
+                st.rerun()
+        else:
+            if st.button("Confirm", key="cq_delete_confirm", type="primary"):
+                db.delete_post(row_id)
+                db.delete_content(row_id)
+                _reset_draft_panel()
+                st.rerun()
+
+    # Delete confirmation prompt
+    if panel == "delete":
+        c1, c2, _ = st.columns([1, 1, 5])
+        with c1:
+            st.warning("Delete this post?")
+        with c2:
+            if st.button("Cancel", key="cq_delete_cancel"):
+                _reset_draft_panel()
+                st.rerun()
+
+    # Inline scheduler
+    if panel == "schedule":
+        slots = _generate_time_slots()
+        if not slots:
+            st.warning("No scheduling slots available in the next 12 hours.")
+        else:
+            with st.form(key="cq_sched_form"):
+                slot_labels = [s[0] for s in slots]
+                slot_isos   = [s[1] for s in slots]
+                choice_idx = st.selectbox(
+                    "Publish at:",
+                    range(len(slot_labels)),
+                    format_func=lambda i: slot_labels[i],
+                    key="cq_slot_select",
+                )
                 sc, cc = st.columns(2)
                 with sc:
-                    if st.form_submit_button("💾 Save Changes", use_container_width=True):
-                        db.update_content_body(row_id, new_body)
-                        st.session_state[f"cq_editing_{row_id}"] = False
-                        st.toast("✅ Post updated")
-                        st.rerun()
+                    if st.form_submit_button("Confirm Schedule", use_container_width=True, type="primary"):
+                        result = db.schedule_post(row_id, slot_isos[choice_idx])
+                        if result.get("ok"):
+                            _reset_draft_panel()
+                            st.toast(f"⏰ Scheduled: {slot_labels[choice_idx]}")
+                            st.rerun()
+                        else:
+                            st.error(result.get("error", "Failed to schedule"))
                 with cc:
                     if st.form_submit_button("Cancel", use_container_width=True):
-                        st.session_state[f"cq_editing_{row_id}"] = False
+                        _reset_draft_panel()
                         st.rerun()
 
-        st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
+    # Inline edit form
+    if panel == "edit":
+        with st.form(key=f"cq_edit_form_{row_id}"):
+            new_body = st.text_area("Edit post", value=body, height=200)
+            if len(new_body) > 3000:
+                st.warning(f"⚠️ {len(new_body)} chars — over LinkedIn 3000 char limit")
+            elif len(new_body) > 2500:
+                st.warning(f"⚠️ {len(new_body)} chars — approaching limit")
+            sc, cc = st.columns(2)
+            with sc:
+                if st.form_submit_button("💾 Save Changes", use_container_width=True):
+                    db.update_content_body(row_id, new_body)
+                    _reset_draft_panel()
+                    st.toast("✅ Post updated")
+                    st.rerun()
+            with cc:
+                if st.form_submit_button("Cancel", use_container_width=True):
+                    _reset_draft_panel()
+                    st.rerun()
 
 
 def _render_scheduled_rows(rows: list[dict], api_url: str) -> None:
@@ -392,42 +389,56 @@ def _render_scheduled_rows(rows: list[dict], api_url: str) -> None:
 
     st.info("Scheduled posts publish automatically at the scheduled time.")
 
+    # ── Shared action bar: one selector + one Cancel button for the list ──────
+    sel_col, bar_col = st.columns([3, 2])
+    with sel_col:
+        selected = widgets.row_selector(
+            rows,
+            key="cq_sched_selected",
+            label_fn=_draft_label,
+            placeholder="Select a scheduled post to act on…",
+        )
+    if selected:
+        with bar_col:
+            if st.button("↩ Cancel schedule", key="cq_sched_cancel", help="Return to drafts",
+                         use_container_width=True):
+                db.update_content_status(selected["id"], "draft")
+                st.rerun()
+    selected_id = selected["id"] if selected else None
+
     # Table header
     st.markdown(
         "<div style='display:flex;padding:6px 0;border-bottom:2px solid #374151;"
         "font-size:0.72rem;color:#6B7280;text-transform:uppercase;letter-spacing:0.06em;gap:12px;'>"
-        "<span style='flex:1.5;'>Topic</span>"
-        "<span style='flex:5;'>Post</span>"
-        "<span style='flex:2;'>Scheduled For</span>"
-        "<span style='flex:1;'>Action</span>"
+        "<span class='row-num-cell'>#</span>"
+        "<span class='flex-1-5'>Topic</span>"
+        "<span class='flex-5'>Post</span>"
+        "<span class='flex-2'>Scheduled For</span>"
         "</div>",
         unsafe_allow_html=True,
     )
 
-    for row in rows:
-        row_id       = row["id"]
-        title        = row.get("title") or ""
-        body         = row.get("body") or ""
-        scheduled_at = row.get("scheduled_at") or ""
-        topic        = _extract_topic(title, body)
-        truncated    = body[:100] + ("…" if len(body) > 100 else "")
-        time_label   = _format_scheduled_time(scheduled_at)
-
-        col_info, col_btn = st.columns([10, 1.5])
-        with col_info:
-            st.markdown(
-                f"<div style='display:flex;align-items:center;padding:9px 0;"
-                f"border-bottom:1px solid #2D3748;gap:12px;'>"
-                f"<span style='flex:1.5;'>{_niche_pill(topic)}</span>"
-                f"<span style='flex:5;font-size:0.83rem;color:#9AA0B2;'>{truncated}</span>"
-                f"<span style='flex:2;font-size:0.78rem;color:#F59E0B;font-weight:600;'>{time_label}</span>"
-                f"</div>",
-                unsafe_allow_html=True,
-            )
-        with col_btn:
-            if st.button("Cancel", key=f"cq_sched_cancel_{row_id}", help="Return to drafts"):
-                db.update_content_status(row_id, "draft")
-                st.rerun()
+    for n, row in enumerate(rows, start=1):
+        is_sel = row["id"] == selected_id
+        cells  = card_cache.cached("cq_scheduled", row, lambda: _scheduled_row_cells(row))
+        st.markdown(
+            f"<div class='list-row{' selected' if is_sel else ''}'>"
+            f"<span class='row-num-cell'>{widgets.row_number_pill(n, is_sel)}</span>{cells}</div>",
+            unsafe_allow_html=True,
+        )
+
+
+def _scheduled_row_cells(row: dict) -> str:
+    title      = row.get("title") or ""
+    body       = row.get("body") or ""
+    topic      = niches.extract_topic(title, body)
+    truncated  = body[:100] + ("…" if len(body) > 100 else "")
+    time_label = _format_scheduled_time(row.get("scheduled_at") or "")
+    return (
+        f"<span class='flex-1-5'>{_niche_pill(topic)}</span>"
+        f"<span class='cell-text flex-5'>{truncated}</span>"
+        f"<span class='cell-when flex-2'>{time_label}{widgets.offline_badge(row)}</span>"
+    )
 
 
 def _render_posted_rows(rows: list[dict]) -> None:
@@ -442,40 +453,43 @@ def _render_posted_rows(rows: list[dict]) -> None:
     st.markdown(
         "<div style='display:flex;padding:6px 0;border-bottom:2px solid #374151;"
         "font-size:0.72rem;color:#6B7280;text-transform:uppercase;letter-spacing:0.06em;gap:12px;'>"
-        "<span style='flex:1.5;'>Topic</span>"
-        "<span style='flex:5;'>Post</span>"
-        "<span style='flex:1.5;'>Posted</span>"
-        "<span style='flex:1;'>Link</span>"
+        "<span class='flex-1-5'>Topic</span>"
+        "<span class='flex-5'>Post</span>"
+        "<span class='flex-1-5'>Posted</span>"
+        "<span class='flex-1'>Link</span>"
         "</div>",
         unsafe_allow_html=True,
     )
 
     for row in rows:
-        title     = row.get("title") or ""
-        body      = row.get("body") or ""
-        posted_at = (row.get("posted_at") or row.get("created_at") or "")[:16]
-        topic     = _extract_topic(title, body)
-        truncated = body[:100] + ("…" if len(body) > 100 else "")
-        li_id     = row.get("linkedin_post_id") or ""
-        link_html = (
-            f"<a href='https://www.linkedin.com/feed/update/{li_id}' target='_blank' "
-            f"style='color:#0A66C2;font-size:0.75rem;text-decoration:none;'>View ↗</a>"
-            if li_id else
-            "<span style='font-size:0.75rem;color:#4B5563;'>—</span>"
-        )
-
         st.markdown(
-            f"<div style='display:flex;align-items:center;padding:9px 0;"
-            f"border-bottom:1px solid #2D3748;gap:12px;'>"
-            f"<span style='flex:1.5;'>{_niche_pill(topic)}</span>"
-            f"<span style='flex:5;font-size:0.83rem;color:#9AA0B2;'>{truncated}</span>"
-            f"<span style='flex:1.5;font-size:0.75rem;color:#6B7280;'>{posted_at}</span>"
-            f"<span style='flex:1;'>{link_html}</span>"
-            f"</div>",
+            card_cache.cached("cq_posted", row, lambda: _posted_row_html(row)),
             unsafe_allow_html=True,
         )
 
 
+def _posted_row_html(row: dict) -> str:
+    title     = row.get("title") or ""
+    body      = row.get("body") or ""
+    posted_at = (row.get("posted_at") or row.get("created_at") or "")[:16]
+    topic     = niches.extract_topic(title, body)
+    truncated = body[:100] + ("…" if len(body) > 100 else "")
+    li_id     = row.get("linkedin_post_id") or ""
+    link_html = (
+        f"<a class='row-link' href='https://www.linkedin.com/feed/update/{li_id}' target='_blank'>View ↗</a>"
+        if li_id else
+        "<span class='row-link-empty'>—</span>"
+    )
+    return (
+        f"<div class='list-row'>"
+        f"<span class='flex-1-5'>{_niche_pill(topic)}</span>"
+        f"<span class='cell-text flex-5'>{truncated}</span>"
+        f"<span class='cell-date flex-1-5'>{posted_at}</span>"
+        f"<span class='flex-1'>{link_html}</span>"
+        f"</div>"
+    )
+
+
 def _render_ignored_rows(rows: list[dict]) -> None:
     if not rows:
         st.markdown(
@@ -485,36 +499,28 @@ def _render_ignored_rows(rows: list[dict]) -> None:
         return
 
     for row in rows:
-        title     = row.get("title") or ""
-        body      = row.get("body") or ""
-        created   = (row.get("created_at") or "")[:16]
-        topic     = _extract_topic(title, body)
-        truncated = body[:100] + ("…" if len(body) > 100 else "")
-
         st.markdown(
-            f"<div style='display:flex;align-items:center;padding:9px 0;"
-            f"border-bottom:1px solid #2D3748;gap:12px;color:#4B5563;'>"
-            f"<span style='flex:1.5;'>{_niche_pill(topic)}</span>"
-            f"<span style='flex:5;font-size:0.83rem;'>{truncated}</span>"
-            f"<span style='flex:1.5;font-size:0.75rem;'>{created}</span>"
-            f"</div>",
+            card_cache.cached("cq_ignored", row, lambda: _ignored_row_html(row)),
             unsafe_allow_html=True,
         )
 
 
-def render(api_url: str = "http://localhost:8000") -> None:
-    st.markdown(_CSS, unsafe_allow_html=True)
+def _ignored_row_html(row: dict) -> str:
+    title     = row.get("title") or ""
+    body      = row.get("body") or ""
+    created   = (row.get("created_at") or "")[:16]
+    topic     = niches.extract_topic(title, body)
+    truncated = body[:100] + ("…" if len(body) > 100 else "")
+    return (
+        f"<div class='list-row muted'>"
+        f"<span class='flex-1-5'>{_niche_pill(topic)}</span>"
+        f"<span class='cell-text flex-5'>{truncated}</span>"
+        f"<span class='cell-date flex-1-5'>{created}</span>"
+        f"</div>"
+    )
 
-    # Auto-fetch LinkedIn profile if not already in session state
-    if not st.session_state.get("linkedin_profile_name"):
-        try:
-            prof = _requests.get(f"{api_url}/auth/linkedin/profile", timeout=5).json()
-            if prof.get("connected"):
-                st.session_state["linkedin_profile_name"]        = prof.get("name", "")
-                st.session_state["linkedin_profile_picture_url"] = prof.get("picture_url", "")
-                st.session_state["linkedin_profile_title"]       = prof.get("headline", "")
-        except Exception:
-            pass
+
+def render(api_url: str = "http://localhost:8000") -> None:
 
     all_rows  = db.get_content_queue()
     drafts    = [r for r in all_rows if r["status"] in ("draft", "draft_saved", "pending")]
@@ -548,6 +554,8 @@ def render(api_url: str = "http://localhost:8000") -> None:
 
     st.markdown("<div style='height:12px'></div>", unsafe_allow_html=True)
 
+    _render_publish_progress()
+
     active_filter = st.session_state.cq_filter
 
     if active_filter == "drafts":
@@ -3,7 +3,10 @@ Influencer Manager — Watchlist + Discover tabs.
 """
 
 import streamlit as st
+import background
+import card_cache
 import db
+import widgets
 
 _ALL_NICHES = ["AML", "KYC", "Fraud", "Sanctions", "RegTech", "AI/Agentic", "Compliance", "Regulatory"]
 
@@ -18,107 +21,16 @@ _NICHE_COLORS = {
     "Regulatory": "#DC2626",
 }
 
-_CSS = """
-<style>
-.inf-row {
-    display: flex;
-    align-items: center;
-    padding: 10px 14px;
-    border-bottom: 1px solid #2D3748;
-    gap: 12px;
-}
-.inf-row:hover { background: #1A1C2A; }
-.inf-name {
-    font-size: 0.9rem;
-    font-weight: 700;
-    color: #FAFAFA;
-    flex: 2;
-}
-.inf-handle {
-    font-size: 0.82rem;
-    color: #0A66C2;
-    flex: 2;
-}
-.inf-handle a { color: #0A66C2; text-decoration: none; }
-.inf-handle a:hover { text-decoration: underline; }
-.pill {
-    display: inline-block;
-    padding: 2px 9px;
-    border-radius: 20px;
-    font-size: 0.68rem;
-    font-weight: 700;
-    color: #fff;
-    margin-right: 4px;
-}
-.pill-active    { background: #057642; }
-.pill-hibernated { background: #92400E; color: #FDE68A; }
-.discover-card {
-    background: #1E2130;
-    border: 1px solid #2D3748;
-    border-radius: 8px;
-    padding: 16px 18px;
-    margin-bottom: 12px;
-}
-.discover-name {
-    font-size: 0.95rem;
-    font-weight: 700;
-    color: #FAFAFA;
-    margin-bottom: 2px;
-}
-.discover-headline {
-    font-size: 0.8rem;
-    color: #9AA0B2;
-    margin-bottom: 8px;
-}
-.discover-reason {
-    font-size: 0.83rem;
-    color: #CBD5E1;
-    font-style: italic;
-    margin-bottom: 10px;
-    line-height: 1.5;
-}
-.pattern-card {
-    background: #1A2744;
-    border: 1px solid #2563EB;
-    border-radius: 8px;
-    padding: 12px 16px;
-    margin-bottom: 16px;
-    font-size: 0.85rem;
-    color: #93C5FD;
-    line-height: 1.5;
-}
-.add-form-panel {
-    background: #161825;
-    border: 1px solid #2D3748;
-    border-radius: 10px;
-    padding: 18px 20px;
-    margin-bottom: 16px;
-}
-.empty-state {
-    text-align: center;
-    color: #6B7280;
-    font-size: 0.88rem;
-    padding: 48px 0;
-}
-.section-header {
-    font-size: 1rem;
-    font-weight: 700;
-    color: #FAFAFA;
-    margin-bottom: 10px;
-}
-</style>
-"""
-
 
 def _niche_pill(niche: str) -> str:
     color = _NICHE_COLORS.get(niche, "#374151")
-    return f'<span class="pill" style="background:{color};">{niche or "—"}</span>'
+    return f'<span class="im-pill" style="background:{color};">{niche or "—"}</span>'
 
 
 def _status_pill(status: str) -> str:
     if status == "hibernated":
-        return '<span class="pill pill-hibernated">Hibernated</span>'
-    return '<span class="pill pill-active">Active</span>'
+        return '<span class="im-pill im-pill-hibernated">Hibernated</span>'
+    return '<span class="im-pill im-pill-active">Active</span>'
 
 
 def _init_im_states() -> None:
@@ -135,12 +47,11 @@ def _init_im_states() -> None:
 
 # ── Watchlist tab ─────────────────────────────────────────────────────────────
 
-def _render_watchlist() -> None:
+def _render_watchlist(influencers: list[dict]) -> None:
     # Header row
     hdr_l, hdr_r = st.columns([3, 1])
     with hdr_l:
-        count_row = db.get_influencers()
-        total = len(count_row)
+        total = len(influencers)
         st.markdown(
             f"<div class='section-header'>Watchlist "
             f"<span style='font-size:0.78rem;font-weight:400;color:#9AA0B2;'>"
@@ -208,7 +119,7 @@ def _render_watchlist() -> None:
     # Load influencers
     f = st.session_state.im_filter
     status_param = None if f == "All" else f.lower()
-    rows = db.get_influencers(status=status_param)
+    rows = influencers if status_param is None else [r for r in influencers if r.get("status") == status_param]
 
     if not rows:
         msg = (
@@ -216,7 +127,7 @@ def _render_watchlist() -> None:
             if f == "All"
             else f"No {f.lower()} influencers."
         )
-        st.markdown(f"<div class='empty-state'>{msg}</div>", unsafe_allow_html=True)
+        st.markdown(f"<div class='empty-state compact'>{msg}</div>", unsafe_allow_html=True)
         return
 
     # Table header
@@ -237,11 +148,7 @@ def _render_watchlist() -> None:
     for row in rows:
         row_id         = row["id"]
         name           = row["name"]
-        handle         = row.get("linkedin_handle") or row.get("handle") or ""
-        url            = f"https://www.linkedin.com/in/{handle}/" if handle else "#"
-        niche          = row.get("niche") or ""
         status         = row.get("status") or "active"
-        comments_posted = int(row.get("comments_posted") or 0)
 
         # Check if this row is pending remove confirmation
         if st.session_state.im_remove_confirm == row_id:
@@ -261,44 +168,11 @@ def _render_watchlist() -> None:
                     st.rerun()
             continue
 
+        cells = card_cache.cached("im_watch", row, lambda: _watchlist_cells(row))
         col_name, col_company, col_handle, col_niche, col_status, col_comments, col_actions = st.columns([2, 2, 2, 1, 1, 1, 1])
-        with col_name:
-            st.markdown(
-                f"<div style='font-size:0.88rem;font-weight:700;color:#FAFAFA;"
-                f"padding:6px 0;'>{name}</div>",
-                unsafe_allow_html=True,
-            )
-        with col_company:
-            headline = row.get("headline") or ""
-            st.markdown(
-                f"<div style='font-size:0.82rem;color:#9AA0B2;padding:6px 0;'>{headline or '—'}</div>",
-                unsafe_allow_html=True,
-            )
-        with col_handle:
-            st.markdown(
-                f"<div style='padding:6px 0;font-size:0.82rem;'>"
-                f"<a href='{url}' target='_blank' style='color:#0A66C2;text-decoration:none;'>"
-                f"@{handle or '—'}</a></div>",
-                unsafe_allow_html=True,
-            )
-        with col_niche:
-            st.markdown(
-                f"<div style='padding:6px 0;'>{_niche_pill(niche)}</div>",
-                unsafe_allow_html=True,
-            )
-        with col_status:
-            st.markdown(
-                f"<div style='padding:6px 0;'>{_status_pill(status)}</div>",
-                unsafe_allow_html=True,
-            )
-        with col_comments:
-            st.markdown(
-                f"<div style='padding:6px 0;'>"
-                f"<span style='background:#2D3748;color:#9AA0B2;padding:2px 8px;"
-                f"border-radius:10px;font-size:0.72rem;'>{comments_posted} comments</span>"
-                f"</div>",
-                unsafe_allow_html=True,
-            )
+        for col, html in zip((col_name, col_company, col_handle, col_niche, col_status, col_comments), cells):
+            with col:
+                st.markdown(html, unsafe_allow_html=True)
         with col_actions:
             btn_a, btn_b = st.columns(2)
             with btn_a:
@@ -318,9 +192,28 @@ def _render_watchlist() -> None:
                     st.rerun()
 
 
+def _watchlist_cells(row: dict) -> tuple[str, ...]:
+    """HTML for the six static cells of a watchlist row (everything but the buttons)."""
+    handle          = row.get("linkedin_handle") or row.get("handle") or ""
+    url             = f"https://www.linkedin.com/in/{handle}/" if handle else "#"
+    headline        = row.get("headline") or ""
+    comments_posted = int(row.get("comments_posted") or 0)
+    return (
+        f"<div class='im-cell-name'>{row['name']}</div>",
+        f"<div class='im-cell-sub'>{headline or '—'}</div>",
+        f"<div class='im-cell-handle'>"
+        f"<a href='{url}' target='_blank'>@{handle or '—'}</a></div>",
+        f"<div style='padding:6px 0;'>{_niche_pill(row.get('niche') or '')}</div>",
+        f"<div style='padding:6px 0;'>{_status_pill(row.get('status') or 'active')}{widgets.offline_badge(row)}</div>",
+        f"<div style='padding:6px 0;'>"
+        f"<span class='im-count-badge'>{comments_posted} comments</span>"
+        f"</div>",
+    )
+
+
 # ── Discover tab ──────────────────────────────────────────────────────────────
 
-def _render_discover() -> None:
+def _render_discover(pattern_data: dict, suggestions: list[dict]) -> None:
     st.markdown(
         "<div class='section-header'>Discover</div>"
         "<div style='font-size:0.82rem;color:#6B7280;margin-top:-6px;margin-bottom:14px;'>"
@@ -329,7 +222,6 @@ def _render_discover() -> None:
     )
 
     # Pattern card (only after 10+ signals)
-    pattern_data = db.get_discover_pattern()
     pattern_text = pattern_data.get("pattern")
     signal_count = pattern_data.get("signal_count", 0)
     if pattern_text:
@@ -340,12 +232,9 @@ def _render_discover() -> None:
             unsafe_allow_html=True,
         )
 
-    # Load suggestions
-    suggestions = db.get_discover_suggestions()
-
     if not suggestions:
         st.markdown(
-            "<div class='empty-state'>Generating suggestions…</div>",
+            "<div class='empty-state compact'>Generating suggestions…</div>",
             unsafe_allow_html=True,
         )
         with st.spinner("Calling Claude…"):
@@ -354,20 +243,11 @@ def _render_discover() -> None:
         return
 
     for s in suggestions:
-        sid     = s["id"]
-        name    = s.get("name") or "Unknown"
-        handle  = s.get("linkedin_handle") or ""
-        headline = s.get("headline") or ""
-        niche   = s.get("niche") or ""
-        reason  = s.get("reason") or ""
+        sid  = s["id"]
+        name = s.get("name") or "Unknown"
 
         st.markdown(
-            f"<div class='discover-card'>"
-            f"<div class='discover-name'><a href='https://www.linkedin.com/in/{handle}/' target='_blank' style='color:#FAFAFA;text-decoration:none;'>{name} ↗</a></div>"
-            f"<div class='discover-headline'>{headline}</div>"
-            f"{_niche_pill(niche)}"
-            f"<div class='discover-reason' style='margin-top:8px;'>{reason}</div>"
-            f"</div>",
+            card_cache.cached("im_discover", s, lambda: _discover_card_html(s)),
             unsafe_allow_html=True,
         )
         btn_l, btn_r, _ = st.columns([1, 1, 4])
@@ -402,10 +282,25 @@ def _render_discover() -> None:
         st.rerun()
 
 
+def _discover_card_html(s: dict) -> str:
+    name     = s.get("name") or "Unknown"
+    handle   = s.get("linkedin_handle") or ""
+    headline = s.get("headline") or ""
+    niche    = s.get("niche") or ""
+    reason   = s.get("reason") or ""
+    return (
+        f"<div class='discover-card'>"
+        f"<div class='discover-name'><a href='https://www.linkedin.com/in/{handle}/' target='_blank'>{name} ↗</a></div>"
+        f"<div class='discover-headline'>{headline}</div>"
+        f"{_niche_pill(niche)}"
+        f"<div class='discover-reason' style='margin-top:8px;'>{reason}</div>"
+        f"</div>"
+    )
+
+
 # ── Main render ───────────────────────────────────────────────────────────────
 
 def render() -> None:
-    st.markdown(_CSS, unsafe_allow_html=True)
     _init_im_states()
 
     st.markdown(
@@ -439,7 +334,14 @@ def render() -> None:
 
     st.markdown("<div style='height:12px'></div>", unsafe_allow_html=True)
 
+    # Only the active subtab's data; Discover's two resources come in one
+    # round trip when the backend supports it.
     if st.session_state.im_tab == 0:
-        _render_watchlist()
+        data = db.bootstrap("influencers", ["influencers"])
+        _render_watchlist(background.result(data["influencers"], []))
     else:
-        _render_discover()
+        data = db.bootstrap("influencers", ["discover_pattern", "discover_suggestions"])
+        _render_discover(
+            background.result(data["discover_pattern"], {}),
+            background.result(data["discover_suggestions"], []),
+        )
@@ -2,237 +2,16 @@
 Strategy Manager page — Topic Intelligence, ICP, posting strategy, comment rules, quality gates.
 """
 
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, NamedTuple
+
 import streamlit as st
+import background
+import card_cache
 import db
-
-# ── CSS ───────────────────────────────────────────────────────────────────────
-
-_CSS = """
-<style>
-/* ── Health cards ── */
-.health-card {
-    background: #1E2130;
-    border-radius: 8px;
-    padding: 16px 18px;
-    border: 1px solid #2D3748;
-    box-shadow: 0 1px 4px rgba(0,0,0,0.35);
-    min-height: 90px;
-}
-.health-card.warn { border-left: 3px solid #F5A623; }
-.health-card.ok   { border-left: 3px solid #22C55E; }
-.health-label {
-    font-size: 0.72rem;
-    color: #9AA0B2;
-    text-transform: uppercase;
-    letter-spacing: 0.07em;
-    margin-bottom: 4px;
-}
-.health-value {
-    font-size: 1.6rem;
-    font-weight: 700;
-    color: #FAFAFA;
-    line-height: 1.1;
-}
-.health-sub {
-    font-size: 0.72rem;
-    color: #6B7280;
-    margin-top: 3px;
-}
-.flagged-item {
-    background: #2D2010;
-    border: 1px solid #F5A623;
-    border-radius: 6px;
-    padding: 8px 12px;
-    font-size: 0.83rem;
-    color: #F5A623;
-    margin-bottom: 6px;
-}
-.section-header {
-    font-size: 1rem;
-    font-weight: 700;
-    color: #FAFAFA;
-    margin-bottom: 12px;
-}
-
-/* ── Topic cards ── */
-.topic-card {
-    background: #1E2130;
-    border: 1px solid #2D3748;
-    border-radius: 8px;
-    padding: 16px;
-    margin-bottom: 12px;
-    box-shadow: 0 1px 4px rgba(0,0,0,0.3);
-}
-.topic-card.inactive { opacity: 0.5; }
-.topic-tag {
-    display: inline-block;
-    background: #0A66C2;
-    color: #fff;
-    padding: 4px 14px;
-    border-radius: 20px;
-    font-size: 0.92rem;
-    font-weight: 700;
-    margin-bottom: 8px;
-}
-.topic-tag.inactive-tag { background: #374151; }
-.topic-weight {
-    font-size: 1.4rem;
-    font-weight: 700;
-    color: #FAFAFA;
-}
-.topic-ctx {
-    font-size: 0.78rem;
-    color: #9AA0B2;
-    margin-top: 6px;
-    line-height: 1.5;
-}
-
-/* ── Chat UI ── */
-.chat-outer {
-    background: #141622;
-    border: 1px solid #2D3748;
-    border-radius: 8px;
-    padding: 16px;
-    height: 400px;
-    overflow-y: auto;
-    margin-bottom: 12px;
-}
-.chat-row-user {
-    display: flex;
-    justify-content: flex-end;
-    margin-bottom: 10px;
-}
-.chat-row-asst {
-    display: flex;
-    justify-content: flex-start;
-    margin-bottom: 10px;
-}
-.bubble-user {
-    background: #0A66C2;
-    color: #fff;
-    padding: 10px 14px;
-    border-radius: 12px 12px 2px 12px;
-    max-width: 78%;
-    font-size: 0.87rem;
-    line-height: 1.5;
-    white-space: pre-wrap;
-}
-.bubble-asst {
-    background: #1E2130;
-    color: #FAFAFA;
-    padding: 10px 14px;
-    border-radius: 12px 12px 12px 2px;
-    max-width: 78%;
-    font-size: 0.87rem;
-    line-height: 1.5;
-    border: 1px solid #2D3748;
-    white-space: pre-wrap;
-}
-
-/* ── ICP profile card ── */
-.icp-card {
-    background: #1E2130;
-    border: 1px solid #2D3748;
-    border-radius: 8px;
-    padding: 20px;
-    box-shadow: 0 1px 4px rgba(0,0,0,0.3);
-}
-.icp-label {
-    font-size: 0.72rem;
-    color: #9AA0B2;
-    text-transform: uppercase;
-    letter-spacing: 0.07em;
-    margin-bottom: 4px;
-    margin-top: 12px;
-}
-.icp-value {
-    font-size: 0.88rem;
-    color: #FAFAFA;
-    line-height: 1.6;
-}
-.pill {
-    display: inline-block;
-    background: #2D3748;
-    color: #FAFAFA;
-    padding: 3px 10px;
-    border-radius: 12px;
-    font-size: 0.78rem;
-    margin: 2px 4px 2px 0;
-}
-.empty-state {
-    background: #1E2130;
-    border: 1px dashed #4B5563;
-    border-radius: 8px;
-    padding: 32px;
-    text-align: center;
-    color: #6B7280;
-    font-size: 0.88rem;
-}
-
-/* ── Feed rows ── */
-.feed-list-header {
-    font-size: 0.72rem;
-    color: #6B7280;
-    text-transform: uppercase;
-    letter-spacing: 0.07em;
-    font-weight: 700;
-    padding: 4px 0;
-}
-.cat-pill {
-    display: inline-block;
-    padding: 1px 8px;
-    border-radius: 20px;
-    font-size: 0.67rem;
-    font-weight: 700;
-    color: #fff;
-}
-.add-form-panel {
-    background: #161825;
-    border: 1px solid #2D3748;
-    border-radius: 8px;
-    padding: 18px 20px;
-    margin-bottom: 20px;
-}
-
-/* ── Feed discover cards ── */
-.feed-disc-card {
-    background: #1E2130;
-    border: 1px solid #2D3748;
-    border-radius: 8px;
-    padding: 14px 16px;
-    margin-bottom: 10px;
-}
-.feed-disc-name {
-    font-size: 0.92rem;
-    font-weight: 700;
-    color: #FAFAFA;
-    margin-bottom: 2px;
-}
-.feed-disc-url {
-    font-size: 0.75rem;
-    color: #0A66C2;
-    word-break: break-all;
-    margin-bottom: 6px;
-}
-.feed-disc-reason {
-    font-size: 0.82rem;
-    color: #CBD5E1;
-    font-style: italic;
-    margin-bottom: 8px;
-    line-height: 1.4;
-}
-.feed-pattern-card {
-    background: #1A2744;
-    border: 1px solid #2563EB;
-    border-radius: 8px;
-    padding: 12px 16px;
-    margin-bottom: 16px;
-    font-size: 0.85rem;
-    color: #93C5FD;
-    line-height: 1.5;
-}
-</style>
-"""
+import form_state
+import metrics_history
+import widgets
 
 
 # ── Session state helpers ─────────────────────────────────────────────────────
@@ -483,15 +262,13 @@ def _render_profile_row(label: str, field: str, display_html: str, edit_value: s
     lc, vc, pc = st.columns([1.8, 5, 0.5])
     with lc:
         st.markdown(
-            f"<div style='font-size:0.72rem;color:#9AA0B2;text-transform:uppercase;"
-            f"letter-spacing:0.07em;padding-top:10px;'>{label}</div>",
+            f"<div class='vp-row-label'>{label}</div>",
             unsafe_allow_html=True,
         )
     with vc:
         if not editing:
             st.markdown(
-                f"<div style='font-size:0.88rem;color:#FAFAFA;padding:8px 0;line-height:1.5;'>"
-                f"{display_html}</div>",
+                f"<div class='vp-row-value'>{display_html}</div>",
                 unsafe_allow_html=True,
             )
         else:
@@ -502,7 +279,10 @@ def _render_profile_row(label: str, field: str, display_html: str, edit_value: s
             sv, cv = st.columns(2)
             with sv:
                 if st.button("Save", key=f"sm_vp_save_{field}", type="primary", use_container_width=True):
-                    result = db.update_voice_field(field, new_val)
+                    if not form_state.diff({field: edit_value}, {field: new_val}):
+                        result = {"ok": True, "unchanged": True}
+                    else:
+                        result = db.update_voice_field(field, new_val)
                     if result.get("ok"):
                         st.session_state.sm_voice_editing_field = None
                         st.toast(f"{label} updated")
@@ -518,7 +298,7 @@ def _render_profile_row(label: str, field: str, display_html: str, edit_value: s
             if st.button("✏️", key=f"sm_vp_edit_{field}", help=f"Edit {label}"):
                 st.session_state.sm_voice_editing_field = field
                 st.rerun()
-    st.markdown("<div style='height:4px;border-bottom:1px solid #2D3748;margin-bottom:4px;'></div>", unsafe_allow_html=True)
+    st.markdown("<div class='vp-row-divider'></div>", unsafe_allow_html=True)
 
 
 _VOICE_FIELD_TIPS = {
@@ -645,7 +425,7 @@ def _render_voice_refine() -> None:
         st.rerun()
 
 
-def _render_voice_section() -> None:
+def _render_voice_section(vp: dict, history: list[dict]) -> None:
     st.markdown(
         "<div class='section-header'>Your Voice</div>"
         "<div style='font-size:0.82rem;color:#6B7280;margin-top:-8px;margin-bottom:12px;'>"
@@ -655,14 +435,13 @@ def _render_voice_section() -> None:
 
     if st.session_state.sm_voice_chat_active:
         _render_voice_copilot()
-        _render_voice_learning()
-        _render_voice_changelog()
+        _render_voice_learning(history)
+        _render_voice_changelog(history)
         return
 
-    vp = db.get_voice_profile()
     if not vp.get("exists") or vp.get("status") != "confirmed":
         st.markdown(
-            "<div class='empty-state'>"
+            "<div class='empty-state boxed'>"
             "Your agents are using the baseline voice.<br>"
             "Define your authentic voice to make every post sound like you wrote it."
             "</div>",
@@ -681,11 +460,11 @@ def _render_voice_section() -> None:
     # Confirmed: show structured editable card
     _render_voice_profile_card(vp)
     _render_voice_refine()
-    _render_voice_learning()
-    _render_voice_changelog()
+    _render_voice_learning(history)
+    _render_voice_changelog(history)
 
 
-def _render_voice_learning() -> None:
+def _render_voice_learning(history: list[dict]) -> None:
     """Render the 'What I've Learned' section from edit analysis."""
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
     st.markdown(
@@ -695,7 +474,6 @@ def _render_voice_learning() -> None:
         unsafe_allow_html=True,
     )
 
-    history = db.get_voice_history()
     pending = [h for h in history if h.get("source") == "edit_analysis" and h.get("accepted") == 0][:5]
 
     if not pending:
@@ -713,10 +491,9 @@ def _render_voice_learning() -> None:
         created   = (item.get("created_at") or "")[:10]
 
         st.markdown(
-            f"<div class='icp-card' style='padding:12px 16px;margin-bottom:8px;'>"
-            f"<div style='font-size:0.75rem;color:#9AA0B2;text-transform:uppercase;"
-            f"letter-spacing:0.06em;'>{field} &nbsp;·&nbsp; {created}</div>"
-            f"<div style='font-size:0.85rem;color:#FAFAFA;margin-top:4px;'>{new_val}</div>"
+            f"<div class='icp-card learn-card'>"
+            f"<div class='learn-meta'>{field} &nbsp;·&nbsp; {created}</div>"
+            f"<div class='learn-value'>{new_val}</div>"
             f"</div>",
             unsafe_allow_html=True,
         )
@@ -732,13 +509,12 @@ def _render_voice_learning() -> None:
                 st.rerun()
 
 
-def _render_voice_changelog() -> None:
+def _render_voice_changelog(history: list[dict]) -> None:
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
     st.markdown(
         "<div style='font-size:0.9rem;font-weight:700;color:#FAFAFA;margin-bottom:8px;'>Change History</div>",
         unsafe_allow_html=True,
     )
-    history = db.get_voice_history()
     accepted = [h for h in history if h.get("accepted") == 1]
     if not accepted:
         st.markdown("<div style='font-size:0.82rem;color:#6B7280;font-style:italic;'>No changes recorded yet.</div>", unsafe_allow_html=True)
@@ -750,11 +526,11 @@ def _render_voice_changelog() -> None:
         date = (item.get("created_at") or "")[:10]
         source = item.get("source") or "manual"
         st.markdown(
-            f"<div style='border-left:3px solid #0A66C2;padding:8px 12px;margin-bottom:8px;background:#141622;border-radius:0 6px 6px 0;'>"
-            f"<div style='font-size:0.72rem;color:#6B7280;'>{date} · {source}</div>"
-            f"<div style='font-size:0.82rem;color:#9AA0B2;margin-top:2px;'><strong>{field}</strong></div>"
-            f"<div style='font-size:0.78rem;color:#6B7280;margin-top:2px;'>Was: {old_val[:100]}</div>"
-            f"<div style='font-size:0.82rem;color:#FAFAFA;margin-top:2px;'>Now: {new_val[:100]}</div>"
+            f"<div class='history-item'>"
+            f"<div class='history-date'>{date} · {source}</div>"
+            f"<div class='history-field'><strong>{field}</strong></div>"
+            f"<div class='history-old'>Was: {old_val[:100]}</div>"
+            f"<div class='history-new'>Now: {new_val[:100]}</div>"
             f"</div>",
             unsafe_allow_html=True,
         )
@@ -860,7 +636,7 @@ def _render_topic_copilot() -> None:
 
 # ── Topic Intelligence section ────────────────────────────────────────────────
 
-def _render_topic_intelligence() -> None:
+def _render_topic_intelligence(topics: list[dict]) -> None:
     header_col, btn_col = st.columns([3, 1])
     with header_col:
         st.markdown("<div class='section-header'>Topic Intelligence</div>", unsafe_allow_html=True)
@@ -889,10 +665,9 @@ def _render_topic_intelligence() -> None:
         _render_topic_copilot()
         return
 
-    topics = db.get_topics()
     if not topics:
         st.markdown(
-            "<div class='empty-state'>No topics yet. Click <strong>+ Add Topic</strong> "
+            "<div class='empty-state boxed'>No topics yet. Click <strong>+ Add Topic</strong> "
             "to define your first content topic with the co-pilot.</div>",
             unsafe_allow_html=True,
         )
@@ -1073,7 +848,7 @@ def _render_icp_copilot() -> None:
 
 # ── ICP section ───────────────────────────────────────────────────────────────
 
-def _render_icp_section() -> None:
+def _render_icp_section(icp: dict, icp_history: list[dict]) -> None:
     header_col, btn_col = st.columns([3, 1])
     with header_col:
         st.markdown(
@@ -1089,10 +864,9 @@ def _render_icp_section() -> None:
         _render_icp_copilot()
         return
 
-    icp = db.get_icp()
     if not icp.get("exists"):
         st.markdown(
-            "<div class='empty-state'>"
+            "<div class='empty-state boxed'>"
             "No ICP defined yet.<br>"
             "Define your target audience to optimize every post for the right person."
             "</div>",
@@ -1182,28 +956,23 @@ def _render_icp_section() -> None:
         "<div style='font-size:0.9rem;font-weight:700;color:#FAFAFA;margin-bottom:8px;'>ICP Change History</div>",
         unsafe_allow_html=True,
     )
-    try:
-        import requests as _req
-        icp_history = _req.get(f"{db.API_URL}/icp/history", timeout=5).json()
-        if not icp_history:
-            st.markdown("<div style='font-size:0.82rem;color:#6B7280;font-style:italic;'>No changes recorded yet.</div>", unsafe_allow_html=True)
-        else:
-            for item in icp_history[:10]:
-                field = (item.get("field_changed") or "").replace("_", " ").title()
-                old_val = item.get("old_value") or "—"
-                new_val = item.get("new_value") or "—"
-                date = (item.get("created_at") or "")[:10]
-                st.markdown(
-                    f"<div style='border-left:3px solid #057642;padding:8px 12px;margin-bottom:8px;background:#141622;border-radius:0 6px 6px 0;'>"
-                    f"<div style='font-size:0.72rem;color:#6B7280;'>{date}</div>"
-                    f"<div style='font-size:0.82rem;color:#9AA0B2;margin-top:2px;'><strong>{field}</strong></div>"
-                    f"<div style='font-size:0.78rem;color:#6B7280;margin-top:2px;'>Was: {str(old_val)[:100]}</div>"
-                    f"<div style='font-size:0.82rem;color:#FAFAFA;margin-top:2px;'>Now: {str(new_val)[:100]}</div>"
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
-    except Exception:
-        pass
+    if not icp_history:
+        st.markdown("<div style='font-size:0.82rem;color:#6B7280;font-style:italic;'>No changes recorded yet.</div>", unsafe_allow_html=True)
+        return
+    for item in icp_history[:10]:
+        field = (item.get("field_changed") or "").replace("_", " ").title()
+        old_val = item.get("old_value") or "—"
+        new_val = item.get("new_value") or "—"
+        date = (item.get("created_at") or "")[:10]
+        st.markdown(
+            f"<div class='history-item icp'>"
+            f"<div class='history-date'>{date}</div>"
+            f"<div class='history-field'><strong>{field}</strong></div>"
+            f"<div class='history-old'>Was: {str(old_val)[:100]}</div>"
+            f"<div class='history-new'>Now: {str(new_val)[:100]}</div>"
+            f"</div>",
+            unsafe_allow_html=True,
+        )
 
 
 # ── Feed section helpers ──────────────────────────────────────────────────────
@@ -1300,17 +1069,89 @@ def _render_feed_form_sm(key_prefix: str, defaults: dict, on_save, on_cancel) ->
     st.markdown("</div>", unsafe_allow_html=True)
 
 
-def _render_feeds_tab() -> None:
+def _feed_row_cells(feed: dict) -> tuple[str, str, str]:
+    """Name, category and last-fetched cells; the caller puts the '#n' pill
+    in front of the name, since it depends on the row's position."""
+    url      = feed.get("url") or ""
+    category = feed.get("category") or "Other"
+    active   = int(feed.get("active", 1))
+    last_str = (feed.get("last_fetched") or "")[:10] or "Never"
+    star     = "⭐" if (feed.get("priority") or "standard") == "priority" else "☆"
+    state    = "" if active else "&nbsp;<span class='feed-paused'>⏸ paused</span>"
+    return (
+        f"{star}&nbsp;"
+        f"<span class='feed-row-name'>{feed['name']}</span>&nbsp;"
+        f"<a class='feed-row-url' href='{url}' target='_blank'>"
+        f"{_feed_truncate_url(url, 40)}</a>{state}",
+        f"<div style='padding:8px 0;'>{_feed_cat_pill(category)}</div>",
+        f"<div class='feed-row-date'>{last_str}</div>",
+    )
+
+
+def _render_feed_actions(feed: dict) -> None:
+    """Action bar for the selected feed row."""
+    row_id    = feed["id"]
+    name      = feed["name"]
+    url       = feed.get("url") or ""
+    category  = feed.get("category") or "Other"
+    priority  = feed.get("priority") or "standard"
+    feed_type = feed.get("feed_type") or "rss"
+    active    = int(feed.get("active", 1))
+
+    # Delete confirmation
+    if st.session_state.sm_feed_delete_confirm == row_id:
+        st.warning(f"Remove **{name}** from your research feeds?")
+        dc, cc2 = st.columns(2)
+        with dc:
+            if st.button("Confirm Remove", key="sm_feed_delconf", type="primary", use_container_width=True):
+                db.delete_feed(row_id)
+                st.session_state.sm_feed_delete_confirm = None
+                st.toast(f"Removed {name}", icon="🗑️")
+                st.rerun()
+        with cc2:
+            if st.button("Cancel", key="sm_feed_delcancel", use_container_width=True):
+                st.session_state.sm_feed_delete_confirm = None
+                st.rerun()
+        return
+
+    c_star, c_tog, c_edit, c_del = st.columns(4)
+    with c_star:
+        star = "⭐" if priority == "priority" else "☆"
+        if st.button(star, key="sm_feed_star", help="Toggle priority", use_container_width=True):
+            new_p = "standard" if priority == "priority" else "priority"
+            db.update_feed(row_id, name, url, feed_type, new_p, category, active)
+            st.rerun()
+    with c_tog:
+        if st.button(
+            "⏸" if active else "▶",
+            key="sm_feed_toggle",
+            help="Pause/Resume",
+            use_container_width=True,
+        ):
+            db.toggle_feed_active(row_id, 0 if active else 1)
+            st.rerun()
+    with c_edit:
+        if st.button("✏️", key="sm_feed_edit", help="Edit", use_container_width=True):
+            current = st.session_state.sm_feed_editing
+            st.session_state.sm_feed_editing = None if current == row_id else row_id
+            st.session_state.sm_feed_adding  = False
+            st.rerun()
+    with c_del:
+        if st.button("🗑️", key="sm_feed_del", help="Delete", use_container_width=True):
+            st.session_state.sm_feed_delete_confirm = row_id
+            st.rerun()
+
+
+def _render_feeds_tab(all_feeds: list[dict]) -> None:
     """Feeds sub-tab: list view with add/edit/delete."""
     # Header row
     hdr_l, hdr_r = st.columns([4, 1])
     with hdr_l:
-        all_f = db.get_feeds()
-        priority_f = [f for f in all_f if f.get("priority") == "priority"]
-        active_f   = [f for f in all_f if f.get("active")]
+        priority_f = [f for f in all_feeds if f.get("priority") == "priority"]
+        active_f   = [f for f in all_feeds if f.get("active")]
         st.markdown(
             f"<div style='font-size:0.78rem;color:#6B7280;margin-bottom:12px;'>"
-            f"{len(all_f)} feeds &nbsp;·&nbsp; {len(priority_f)} priority &nbsp;·&nbsp; {len(active_f)} active</div>",
+            f"{len(all_feeds)} feeds &nbsp;·&nbsp; {len(priority_f)} priority &nbsp;·&nbsp; {len(active_f)} active</div>",
             unsafe_allow_html=True,
         )
     with hdr_r:
@@ -1337,15 +1178,14 @@ def _render_feeds_tab() -> None:
             on_cancel=lambda: st.session_state.update({"sm_feed_adding": False}),
         )
 
-    # Load feeds — priority first
-    all_feeds  = db.get_feeds()
+    # Priority feeds first
     pri_feeds  = [f for f in all_feeds if f.get("priority") == "priority"]
     std_feeds  = [f for f in all_feeds if f.get("priority") != "priority"]
     sorted_feeds = pri_feeds + std_feeds
 
     if not sorted_feeds:
         st.markdown(
-            "<div class='empty-state'>"
+            "<div class='empty-state boxed'>"
             "No feeds added yet. Use the <strong>Discover</strong> tab to find relevant RSS feeds, "
             "or add one manually above.<br/><br/>"
             "<span style='font-size:0.78rem;color:#4B5563;'>"
@@ -1355,8 +1195,23 @@ def _render_feeds_tab() -> None:
         )
         return
 
+    # ── Shared action bar: one selector + one set of buttons for the list ─────
+    sel_col, bar_col = st.columns([3, 2])
+    with sel_col:
+        selected = widgets.row_selector(
+            sorted_feeds,
+            key="sm_feed_selected",
+            label_fn=lambda n, f: f"#{n} · {f['name']}",
+            placeholder="Select a feed to act on…",
+            on_change=lambda: st.session_state.update({"sm_feed_delete_confirm": None}),
+        )
+    if selected:
+        with bar_col:
+            _render_feed_actions(selected)
+    selected_id = selected["id"] if selected else None
+
     # List header
-    lh1, lh2, lh3, _, _, _, _ = st.columns([3.5, 1.2, 1.2, 0.6, 0.6, 0.6, 0.6])
+    lh1, lh2, lh3 = st.columns([3.5, 1.2, 1.2])
     for col, label in [(lh1, "Feed"), (lh2, "Category"), (lh3, "Last Fetched")]:
         col.markdown(
             f"<div class='feed-list-header'>{label}</div>",
@@ -1364,76 +1219,16 @@ def _render_feeds_tab() -> None:
         )
     st.markdown("<div style='height:4px'></div>", unsafe_allow_html=True)
 
-    for feed in sorted_feeds:
-        row_id    = feed["id"]
-        name      = feed["name"]
-        url       = feed.get("url") or ""
-        category  = feed.get("category") or "Other"
-        priority  = feed.get("priority") or "standard"
-        feed_type = feed.get("feed_type") or "rss"
-        active    = int(feed.get("active", 1))
-        last_str  = (feed.get("last_fetched") or "")[:10] or "Never"
-
-        # Delete confirmation
-        if st.session_state.sm_feed_delete_confirm == row_id:
-            st.warning(f"Remove **{name}** from your research feeds?")
-            dc, cc2, _ = st.columns([1, 1, 4])
-            with dc:
-                if st.button("Confirm Remove", key=f"sm_feed_delconf_{row_id}", type="primary"):
-                    db.delete_feed(row_id)
-                    st.session_state.sm_feed_delete_confirm = None
-                    st.toast(f"Removed {name}", icon="🗑️")
-                    st.rerun()
-            with cc2:
-                if st.button("Cancel", key=f"sm_feed_delcancel_{row_id}"):
-                    st.session_state.sm_feed_delete_confirm = None
-                    st.rerun()
-            continue
-
-        c_info, c_cat, c_last, c_star, c_tog, c_edit, c_del = st.columns([3.5, 1.2, 1.2, 0.6, 0.6, 0.6, 0.6])
-        with c_info:
-            st.markdown(
-                f"<div style='padding:6px 0;'>"
-                f"<span style='font-size:0.88rem;font-weight:700;color:#FAFAFA;'>{name}</span>&nbsp;"
-                f"<a href='{url}' target='_blank' style='font-size:0.72rem;color:#0A66C2;'>"
-                f"{_feed_truncate_url(url, 40)}</a></div>",
-                unsafe_allow_html=True,
-            )
-        with c_cat:
-            st.markdown(
-                f"<div style='padding:8px 0;'>{_feed_cat_pill(category)}</div>",
-                unsafe_allow_html=True,
-            )
-        with c_last:
-            st.markdown(
-                f"<div style='padding:6px 0;font-size:0.72rem;color:#6B7280;'>{last_str}</div>",
-                unsafe_allow_html=True,
-            )
-        with c_star:
-            star = "⭐" if priority == "priority" else "☆"
-            if st.button(star, key=f"sm_feed_star_{row_id}", help="Toggle priority", use_container_width=True):
-                new_p = "standard" if priority == "priority" else "priority"
-                db.update_feed(row_id, name, url, feed_type, new_p, category, active)
-                st.rerun()
-        with c_tog:
-            if st.button(
-                "⏸" if active else "▶",
-                key=f"sm_feed_toggle_{row_id}",
-                help="Pause/Resume",
-                use_container_width=True,
-            ):
-                db.toggle_feed_active(row_id, 0 if active else 1)
-                st.rerun()
-        with c_edit:
-            if st.button("✏️", key=f"sm_feed_edit_{row_id}", help="Edit", use_container_width=True):
-                current = st.session_state.sm_feed_editing
-                st.session_state.sm_feed_editing = None if current == row_id else row_id
-                st.session_state.sm_feed_adding  = False
-                st.rerun()
-        with c_del:
-            if st.button("🗑️", key=f"sm_feed_del_{row_id}", help="Delete", use_container_width=True):
-                st.session_state.sm_feed_delete_confirm = row_id
-                st.rerun()
+    for n, feed in enumerate(sorted_feeds, start=1):
+        is_sel = feed["id"] == selected_id
+        name, category, fetched = card_cache.cached("sm_feed", feed, lambda: _feed_row_cells(feed))
+        cells = (
+            f"<div style='padding:6px 0;'>{widgets.row_number_pill(n, is_sel)}&nbsp;{name}</div>",
+            category, fetched,
+        )
+        for col, html in zip(st.columns([3.5, 1.2, 1.2]), cells):
+            with col:
+                st.markdown(html, unsafe_allow_html=True)
 
     # Inline edit form
     editing_id = st.session_state.sm_feed_editing
@@ -1475,7 +1270,7 @@ def _render_feed_discover_tab() -> None:
 
     if not suggestions:
         st.markdown(
-            "<div class='empty-state'>Generating suggestions…</div>",
+            "<div class='empty-state boxed'>Generating suggestions…</div>",
             unsafe_allow_html=True,
         )
         with st.spinner("Calling Claude…"):
@@ -1494,7 +1289,7 @@ def _render_feed_discover_tab() -> None:
             f"<div class='feed-disc-card'>"
             f"<div class='feed-disc-name'>{name}</div>"
             f"<div class='feed-disc-url'>"
-            f"<a href='{url}' target='_blank' style='color:#0A66C2;text-decoration:none;'>{url}</a>"
+            f"<a href='{url}' target='_blank'>{url}</a>"
             f"</div>"
             f"{_feed_cat_pill(category)}"
             f"<div class='feed-disc-reason' style='margin-top:8px;'>{reason}</div>"
@@ -1538,45 +1333,35 @@ def _render_feed_discover_tab() -> None:
     )
 
 
-# ── Main render ───────────────────────────────────────────────────────────────
-
-def render() -> None:
-    st.markdown(_CSS, unsafe_allow_html=True)
-    _init_states()
-
-    st.markdown(
-        "<div style='font-size:1.3rem;font-weight:800;color:#FAFAFA;margin-bottom:4px;'>"
-        "Strategy Manager</div>"
-        "<div style='font-size:0.83rem;color:#6B7280;margin-bottom:20px;'>"
-        "Configure topics, ICP, posting limits, content mix, comment rules, and quality gates.</div>",
-        unsafe_allow_html=True,
-    )
-
-    # ── Section 1: Voice Profile ────────────────────────────────────────────────
-    _render_voice_section()
-
-    st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
-    st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
-    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+# ── Progressive sections ──────────────────────────────────────────────────────
 
-    # ── Section 2: Topic Intelligence ──────────────────────────────────────────
-    _render_topic_intelligence()
+class _Section(NamedTuple):
+    title: str
+    deps: tuple[str, ...]              # keys into the render() futures dict
+    draw: Callable[[dict], None]       # called with {dep: result}
+    optional: tuple[str, ...] = ()     # deps whose failure is passed through as None
 
-    st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
-    st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
-    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
-
-    # ── Section 3: ICP ─────────────────────────────────────────────────────────
-    _render_icp_section()
 
-    st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
-    st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
-    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+def _render_section(section: _Section, futures: dict) -> None:
+    errors = [
+        f.exception() for k, f in futures.items()
+        if k not in section.optional and f.exception() is not None
+    ]
+    if errors:
+        st.markdown(
+            f"<div class='section-header'>{section.title}</div>"
+            f"<div class='section-error'>⚠ Couldn't load this section — the backend did not respond. "
+            f"Other sections are unaffected.</div>",
+            unsafe_allow_html=True,
+        )
+        print(f"[strategy] {section.title}: {errors[0]}")
+        if st.button("Retry", key=f"sm_retry_{section.deps[0]}"):
+            st.rerun()
+        return
+    section.draw({k: None if f.exception() else f.result() for k, f in futures.items()})
 
-    cfg    = db.get_strategy()
-    health = db.get_strategy_health()
 
-    # ── Section 4: Strategy Health ─────────────────────────────────────────────
+def _render_strategy_health(health: dict) -> None:
     st.markdown("<div class='section-header'>Strategy Health</div>", unsafe_allow_html=True)
 
     c1, c2, c3, c4 = st.columns(4)
@@ -1586,6 +1371,12 @@ def render() -> None:
     max_posts      = health["max_posts_week"]
     archived       = health["archived_this_week"]
 
+    def trend(series: str, good_when_up: bool = True) -> str:
+        return (
+            f"<div class='metric-trend'>{widgets.sparkline(metrics_history.series(series))}"
+            f"{widgets.trend_delta(metrics_history.delta(series), good_when_up)}</div>"
+        )
+
     with c1:
         warn = comments_today >= max_comments
         st.markdown(
@@ -1593,6 +1384,7 @@ def render() -> None:
                 <div class='health-label'>Comments Today</div>
                 <div class='health-value'>{comments_today}/{max_comments}</div>
                 <div class='health-sub'>{"⚠ Limit reached" if warn else "posted to LinkedIn"}</div>
+                {trend("comments_today")}
             </div>""",
             unsafe_allow_html=True,
         )
@@ -1603,6 +1395,7 @@ def render() -> None:
                 <div class='health-label'>Posted This Week</div>
                 <div class='health-value'>{posts_week}/{max_posts}</div>
                 <div class='health-sub'>{"⚠ Limit reached" if warn else "posted to LinkedIn"}</div>
+                {trend("posts_this_week")}
             </div>""",
             unsafe_allow_html=True,
         )
@@ -1623,6 +1416,7 @@ def render() -> None:
                 <div class='health-label'>Archived (Quality)</div>
                 <div class='health-value'>{archived}</div>
                 <div class='health-sub'>posts failed quality gate this week</div>
+                {trend("archived_this_week", good_when_up=False)}
             </div>""",
             unsafe_allow_html=True,
         )
@@ -1648,10 +1442,22 @@ def render() -> None:
         for item in flagged:
             st.markdown(f"<div class='flagged-item'>{item}</div>", unsafe_allow_html=True)
 
-    st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
-    st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
-    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
 
+def _save_strategy(cfg: dict, values: dict, saved: str) -> None:
+    """Send only the settings that differ from cfg; db patches the cached
+    config, so the next rerun diffs against what was saved."""
+    changes = form_state.diff(cfg, values)
+    if not changes:
+        st.toast("No changes to save")
+        return
+    result = db.update_strategy(changes)
+    if result.get("ok") is False:
+        st.error(result.get("error", "Failed to save settings"))
+    else:
+        st.toast(saved, icon="✅")
+
+
+def _render_strategy_settings(cfg: dict, archived: int) -> None:
     # ── Section 4: Posting Strategy ────────────────────────────────────────────
     st.markdown("<div class='section-header'>Posting Strategy</div>", unsafe_allow_html=True)
 
@@ -1707,13 +1513,12 @@ def render() -> None:
 
     if st.button("Save Posting Strategy", key="strat_save_posting", type="primary"):
         times_list = [t.strip() for t in times_str.split(",") if t.strip()]
-        db.update_strategy({
+        _save_strategy(cfg, {
             "max_posts_per_day":  new_max_posts_day,
             "max_posts_per_week": new_max_posts_week,
             "best_posting_times": times_list,
             "topic_weights":      new_weights,
-        })
-        st.toast("Posting strategy saved", icon="✅")
+        }, "Posting strategy saved")
 
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
     st.markdown(
@@ -1732,8 +1537,7 @@ def render() -> None:
         label_visibility="collapsed",
     )
     if st.button("Save Footer", key="strat_save_footer", type="primary"):
-        db.update_strategy({"post_footer": new_footer.strip()})
-        st.toast("Post footer saved", icon="✅")
+        _save_strategy(cfg, {"post_footer": new_footer.strip()}, "Post footer saved")
 
     st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
     st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
@@ -1786,15 +1590,14 @@ def render() -> None:
     )
 
     if st.button("Save Comment Co-Pilot", key="strat_save_comments", type="primary"):
-        db.update_strategy({
+        _save_strategy(cfg, {
             "max_comments_per_day":                 new_max_comments_day,
             "max_comments_per_influencer_per_week": new_max_per_inf,
             "comment_cooldown_hours":               new_cooldown,
             "comment_tone_rules":                   [r.strip() for r in tone_raw.splitlines() if r.strip()],
             "avoided_intent_keywords":              [k.strip() for k in avoided_raw.splitlines() if k.strip()],
             "never_comment_accounts":               [a.strip() for a in never_raw.split(",") if a.strip()],
-        })
-        st.toast("Comment settings saved", icon="✅")
+        }, "Comment settings saved")
 
     st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
     st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
@@ -1830,8 +1633,7 @@ def render() -> None:
         )
 
     if st.button("Save Quality Gate", key="strat_save_quality", type="primary"):
-        db.update_strategy({"min_post_quality_score": new_min_score})
-        st.toast("Quality gate saved", icon="✅")
+        _save_strategy(cfg, {"min_post_quality_score": new_min_score}, "Quality gate saved")
 
     st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
     st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
@@ -1899,18 +1701,14 @@ def render() -> None:
 
     st.markdown("<div style='height:10px'></div>", unsafe_allow_html=True)
     if st.button("Save Connection Settings", key="strat_save_conn", type="primary"):
-        db.update_strategy({
+        _save_strategy(cfg, {
             "connection_auto_send":      new_auto,
             "connection_pace":           new_pace,
             "connection_pause_weekends": new_pause_weekends,
-        })
-        st.toast("Connection settings saved", icon="✅")
+        }, "Connection settings saved")
 
-    st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
-    st.markdown("<hr style='border-color:#2D3748;'/>", unsafe_allow_html=True)
-    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
 
-    # ── Section 8: Research Agent Data Feeds ───────────────────────────────────
+def _render_feeds_section(all_feeds: list[dict]) -> None:
     st.markdown("<div class='section-header'>Research Agent Data Feeds</div>", unsafe_allow_html=True)
     st.markdown(
         "<div style='font-size:0.83rem;color:#9AA0B2;margin-bottom:16px;'>"
@@ -1942,6 +1740,78 @@ def render() -> None:
     st.markdown("<div style='height:12px'></div>", unsafe_allow_html=True)
 
     if st.session_state.sm_feed_tab == 0:
-        _render_feeds_tab()
+        _render_feeds_tab(all_feeds)
     else:
         _render_feed_discover_tab()
+
+
+# ── Main render ───────────────────────────────────────────────────────────────
+
+def render() -> None:
+    _init_states()
+
+    st.markdown(
+        "<div style='font-size:1.3rem;font-weight:800;color:#FAFAFA;margin-bottom:4px;'>"
+        "Strategy Manager</div>"
+        "<div style='font-size:0.83rem;color:#6B7280;margin-bottom:20px;'>"
+        "Configure topics, ICP, posting limits, content mix, comment rules, and quality gates.</div>",
+        unsafe_allow_html=True,
+    )
+
+    # Every section's data is requested up front: in one round trip when the
+    # backend has /bootstrap/strategy, otherwise concurrently per endpoint. Each
+    # section gets a placeholder in page order and is drawn as soon as its own
+    # data arrives, so one slow endpoint only delays its own section. Histories
+    # keep the lenient getters (empty list on failure); the primary data is
+    # fetched strictly so a dead endpoint shows a local error instead of empty
+    # content (see db.TAB_RESOURCES).
+    futures = db.bootstrap("strategy")
+
+    sections = [
+        _Section("Your Voice", ("voice", "voice_history"),
+                 lambda d: _render_voice_section(d["voice"], d["voice_history"])),
+        _Section("Topic Intelligence", ("topics",),
+                 lambda d: _render_topic_intelligence(d["topics"])),
+        _Section("Ideal Customer Profile", ("icp", "icp_history"),
+                 lambda d: _render_icp_section(d["icp"], d["icp_history"])),
+        _Section("Strategy Health", ("health",),
+                 lambda d: _render_strategy_health(d["health"])),
+        _Section("Posting Strategy", ("strategy", "health"),
+                 lambda d: _render_strategy_settings(d["strategy"], (d["health"] or {}).get("archived_this_week", 0)),
+                 optional=("health",)),
+    ]
+
+    slots = []
+    for section in sections:
+        box = st.container()
+        with box:
+            skeleton = st.empty()
+            skeleton.markdown(
+                f"<div class='section-header'>{section.title}</div>"
+                f"<div class='section-skeleton'></div>",
+                unsafe_allow_html=True,
+            )
+        st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
+        st.markdown("<hr/>", unsafe_allow_html=True)
+        st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+        slots.append((box, skeleton))
+
+    pending = set(range(len(sections)))
+    while pending:
+        for i in sorted(pending):
+            deps = [futures[k] for k in sections[i].deps]
+            if not all(f.done() for f in deps):
+                continue
+            pending.discard(i)
+            box, skeleton = slots[i]
+            skeleton.empty()
+            with box:
+                _render_section(sections[i], {k: futures[k] for k in sections[i].deps})
+        if pending:
+            wait(
+                [futures[k] for i in pending for k in sections[i].deps if not futures[k].done()],
+                return_when=FIRST_COMPLETED,
+            )
+
+    # ── Research Agent Data Feeds ──────────────────────────────────────────────
+    _render_feeds_section(background.result(futures["feeds"], []))
@@ -0,0 +1,269 @@
+"""
+FinSignal UI — Pipeline analytics.
+Funnel, time-in-state, daily throughput and backlog age for the content and
+comment queues. Every row is parsed once into a DataFrame of timestamps keyed
+by (queue, id); a refresh only re-parses rows whose version changed since the
+last one (see card_cache.row_version) and drops rows that disappeared. The
+aggregates are plain vectorized groupbys over that frame.
+
+Time in state, from the timestamps the backend sends:
+  open       created_at → status change (scheduled / archived / ignored rows),
+             or created_at → posted_at for rows posted straight from the queue
+  scheduled  status change → scheduled_at (how far ahead the slot was booked)
+  total      created_at → posted_at
+The status change time is status_changed_at, falling back to updated_at.
+
+pandas and plotly are imported on first use, like analytics_engine.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Optional
+
+import analytics_engine
+import background
+import card_cache
+import db
+
+REFRESH_TTL     = float(os.getenv("ANALYTICS_TTL_SECONDS", "60"))
+THROUGHPUT_DAYS = int(os.getenv("PIPELINE_THROUGHPUT_DAYS", "30"))
+
+QUEUES = ("content", "comments")
+STAGE_OF = {
+    "draft": "open", "draft_saved": "open", "pending": "open", "pending_urn": "open",
+    "scheduled": "scheduled",
+    "posted": "posted",
+    "archived": "dropped", "ignored": "dropped",
+}
+STAGES      = ("open", "scheduled", "posted", "dropped")
+PERCENTILES = (0.5, 0.9)
+
+_STAMPS = ("created_at", "changed_at", "scheduled_at", "posted_at")
+_COLORS = {"scheduled": "#0A66C2", "posted": "#22C55E", "dropped": "#F5A623"}
+
+
+# ── Row frame ─────────────────────────────────────────────────────────────────
+
+def _raw(queue: str, row: dict) -> dict:
+    return {
+        "queue":        queue,
+        "id":           row.get("id"),
+        "version":      card_cache.row_version(row),
+        "stage":        STAGE_OF.get(row.get("status"), "open"),
+        "created_at":   row.get("created_at"),
+        "changed_at":   row.get("status_changed_at") or row.get("updated_at"),
+        "scheduled_at": row.get("scheduled_at"),
+        "posted_at":    row.get("posted_at"),
+    }
+
+
+def _parse(pd, records: list[dict]):
+    frame = pd.DataFrame.from_records(
+        records, columns=["queue", "id", "version", "stage", *_STAMPS],
+    ).set_index(["queue", "id"])
+    for col in _STAMPS:
+        frame[col] = pd.to_datetime(frame[col], utc=True, errors="coerce", format="ISO8601")
+    return frame
+
+
+class _Pipeline:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.rows: Any = None       # DataFrame indexed by (queue, id)
+        self.summary: Optional[dict] = None
+        self.version = 0
+        self.refreshed_at = 0.0
+        self.day = None             # UTC day the throughput window ends on
+        self.figures: dict[tuple, tuple[int, Any]] = {}
+
+
+_state = _Pipeline()
+
+
+def _merge(pd, fetched: list[dict]) -> bool:
+    """Fold the fetched rows into _state.rows, parsing only new or changed ones."""
+    if not fetched:
+        changed = _state.rows is None or not _state.rows.empty
+        _state.rows = _parse(pd, [])
+        return changed
+    keys = pd.DataFrame.from_records(fetched, columns=["queue", "id", "version"]).set_index(["queue", "id"])
+    keys = keys[~keys.index.duplicated(keep="last")]
+    if _state.rows is None:
+        _state.rows = _parse(pd, fetched)
+        return True
+
+    known = _state.rows["version"].reindex(keys.index)
+    dirty = keys.index[known.ne(keys["version"])]
+    gone  = _state.rows.index.difference(keys.index)
+    if dirty.empty and gone.empty:
+        return False
+
+    want = set(dirty)
+    fresh = _parse(pd, [r for r in fetched if (r["queue"], r["id"]) in want])
+    kept  = _state.rows.drop(index=gone.union(dirty), errors="ignore")
+    _state.rows = pd.concat([kept, fresh[~fresh.index.duplicated(keep="last")]])
+    return True
+
+
+# ── Aggregates ────────────────────────────────────────────────────────────────
+
+def _hours(delta):
+    return delta.dt.total_seconds() / 3600
+
+
+def _percentiles(grouped):
+    """One pN column per PERCENTILES entry; still well-formed when there are no rows."""
+    table = grouped.quantile(list(PERCENTILES)).unstack().reindex(columns=list(PERCENTILES))
+    table.columns = [f"p{int(q * 100)}" for q in PERCENTILES]
+    return table
+
+
+def _time_in_state(pd, rows):
+    """Percentiles (hours) of time spent per state, per queue."""
+    stamps = rows.reset_index()
+    decided = stamps["changed_at"].where(stamps["stage"].isin(["scheduled", "dropped"]))
+    direct  = (stamps["stage"] == "posted") & stamps["scheduled_at"].isna()
+    decided = decided.fillna(stamps["posted_at"].where(direct))
+
+    durations = pd.concat([
+        pd.DataFrame({"queue": stamps["queue"], "state": "open",
+                      "hours": _hours(decided - stamps["created_at"])}),
+        pd.DataFrame({"queue": stamps["queue"], "state": "scheduled",
+                      "hours": _hours(stamps["scheduled_at"] - stamps["changed_at"])
+                               .where(stamps["stage"] == "scheduled")}),
+        pd.DataFrame({"queue": stamps["queue"], "state": "total",
+                      "hours": _hours(stamps["posted_at"] - stamps["created_at"])}),
+    ])
+    durations = durations[durations["hours"] >= 0]
+    grouped = durations.groupby(["queue", "state"])["hours"]
+    table = _percentiles(grouped)
+    table["rows"] = grouped.size()
+    return table.round(1)
+
+
+def _throughput(pd, rows, now):
+    """Rows leaving the open state per day over the last THROUGHPUT_DAYS, by outcome."""
+    exited = rows["posted_at"].where(rows["stage"] == "posted", rows["changed_at"])
+    exits = pd.DataFrame({"day": exited.dt.floor("D"), "outcome": rows["stage"]})
+    exits = exits[exits["outcome"].isin(list(_COLORS)) & exits["day"].notna()]
+    days = pd.date_range(end=now.floor("D"), periods=THROUGHPUT_DAYS, freq="D")
+    exits = exits[exits["day"] >= days[0]]
+    table = pd.crosstab(exits["day"], exits["outcome"]) if not exits.empty else pd.DataFrame()
+    return table.reindex(index=days, columns=list(_COLORS), fill_value=0).astype("int64")
+
+
+def _backlog_age(pd, rows, now):
+    """Age (hours) of rows still open: count and percentiles per queue."""
+    open_rows = rows[rows["stage"] == "open"]
+    age = _hours(now - open_rows["created_at"]).dropna().groupby(level="queue")
+    table = _percentiles(age)
+    table["max"]   = age.max()
+    table["count"] = open_rows.groupby(level="queue").size()
+    return table.reindex(list(QUEUES)).fillna(0).round(1)
+
+
+def _funnel(pd, rows):
+    counts = rows.groupby([rows.index.get_level_values("queue"), rows["stage"]]).size().unstack(fill_value=0)
+    return counts.reindex(index=list(QUEUES), columns=list(STAGES), fill_value=0).fillna(0).astype("int64")
+
+
+def refresh(force: bool = False) -> int:
+    """Bring the row frame and aggregates up to date; return the data version.
+
+    Throttled to once per REFRESH_TTL seconds. The queues are read through
+    db.get_queue_snapshot, the same fetch analytics_engine uses. The version
+    changes when a row was added, changed or removed, or when the day rolls
+    over (the throughput window moves); backlog ages are recomputed on every
+    refresh since they grow with the clock. When the backend cannot be
+    reached the rows are kept as they were.
+    """
+    import pandas as pd
+
+    with _state.lock:
+        fresh = time.monotonic() - _state.refreshed_at < REFRESH_TTL
+        if _state.summary is not None and fresh and not force:
+            return _state.version
+
+        content_f = background.submit(db.fetch_strict, db.get_queue_snapshot, "content")
+        comment_f = background.submit(db.fetch_strict, db.get_queue_snapshot, "comments")
+        try:
+            fetched = (
+                [_raw("content", r) for r in content_f.result()]
+                + [_raw("comments", r) for r in comment_f.result()]
+            )
+        except db.BackendUnavailable as e:
+            print(f"[pipeline] refresh skipped: {e}")
+            fetched = None
+        changed = _merge(pd, fetched) if fetched is not None or _state.rows is None else False
+
+        now = pd.Timestamp.now(tz="UTC")
+        rows = _state.rows
+        if changed or _state.summary is None or _state.day != now.date():
+            _state.version += 1
+            _state.day = now.date()
+            _state.summary = {
+                "funnel":        _funnel(pd, rows),
+                "time_in_state": _time_in_state(pd, rows),
+                "throughput":    _throughput(pd, rows, now),
+            }
+        _state.summary["backlog_age"] = _backlog_age(pd, rows, now)
+        _state.refreshed_at = time.monotonic()
+        if fetched is None:   # retry sooner than a full REFRESH_TTL
+            _state.refreshed_at -= max(REFRESH_TTL - analytics_engine.RETRY_AFTER, 0)
+        return _state.version
+
+
+def funnel() -> Any:
+    """Row count per queue (index) and stage (columns)."""
+    refresh()
+    return _state.summary["funnel"]
+
+
+def time_in_state() -> Any:
+    """p50 / p90 hours and row count per (queue, state)."""
+    refresh()
+    return _state.summary["time_in_state"]
+
+
+def throughput() -> Any:
+    """Rows leaving the open state per day, one column per outcome."""
+    refresh()
+    return _state.summary["throughput"]
+
+
+def backlog_age() -> Any:
+    """Open rows per queue with p50 / p90 / max age in hours."""
+    refresh()
+    return _state.summary["backlog_age"]
+
+
+# ── Figures ───────────────────────────────────────────────────────────────────
+
+def throughput_figure():
+    """Stacked bars of daily exits from the open state by outcome."""
+    version = refresh()
+    key = ("throughput", _state.day)
+    with _state.lock:
+        hit = _state.figures.get(key)
+        if hit and hit[0] == version:
+            return hit[1]
+
+    import plotly.graph_objects as go
+
+    frame = _state.summary["throughput"]
+    fig = go.Figure([
+        go.Bar(x=frame.index, y=frame[c], name=c.title(), marker_color=color)
+        for c, color in _COLORS.items()
+    ])
+    fig.update_layout(barmode="stack")
+    fig = analytics_engine.style_figure(fig, f"Throughput — last {THROUGHPUT_DAYS} days")
+    with _state.lock:
+        _state.figures = {k: v for k, v in _state.figures.items() if k[0] != "throughput"}
+        _state.figures[key] = (version, fig)
+    return fig
+
+
+def clear() -> None:
+    global _state
+    _state = _Pipeline()
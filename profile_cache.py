@@ -0,0 +1,71 @@
+"""
+FinSignal UI — LinkedIn profile cache.
+The one place the connected LinkedIn profile lives for a session. The header,
+Content Queue cards and Analytics all read through here instead of keeping
+their own session keys or calling /auth/linkedin/profile themselves. Pages
+use current()/peek(), which never block: app.py owns the one refresh.
+"Not connected" is cached too (for a shorter TTL), so disconnected users do
+not pay a backend round trip on every rerun. A failed fetch is not an answer
+and is never stored: the last known profile stays and the next rerun asks
+again. Connect and logout overwrite the entry directly.
+"""
+
+import os
+import time
+from typing import Optional
+
+import streamlit as st
+
+PROFILE_TTL          = int(os.getenv("PROFILE_TTL_SECONDS", "600"))
+PROFILE_NEGATIVE_TTL = int(os.getenv("PROFILE_NEGATIVE_TTL_SECONDS", "120"))
+
+_KEY = "li_profile_cache"
+
+_DISCONNECTED = {"connected": False, "name": "", "headline": "", "picture_url": ""}
+
+
+def _normalize(raw: dict) -> dict:
+    if not raw.get("connected"):
+        return dict(_DISCONNECTED)
+    return {
+        "connected":   True,
+        "name":        raw.get("name", "") or "",
+        "headline":    raw.get("headline") or raw.get("email", "") or "",
+        "picture_url": raw.get("picture_url", "") or "",
+    }
+
+
+def store(raw: dict) -> dict:
+    """Cache a /auth/linkedin/profile response (or an equivalent dict) and return it normalized."""
+    profile = _normalize(raw)
+    ttl = PROFILE_TTL if profile["connected"] else PROFILE_NEGATIVE_TTL
+    st.session_state[_KEY] = {"profile": profile, "expires": time.monotonic() + ttl}
+    return profile
+
+
+def peek() -> Optional[dict]:
+    """Last cached profile, even if expired; None if nothing was ever fetched. Never blocks."""
+    entry = st.session_state.get(_KEY)
+    return entry["profile"] if entry else None
+
+
+def current() -> dict:
+    """Profile for drawing a tab without blocking: the last cached one (app.py
+    refreshes an expired entry in the background), or the disconnected
+    placeholder until the first fetch lands."""
+    return peek() or dict(_DISCONNECTED)
+
+
+def is_fresh() -> bool:
+    entry = st.session_state.get(_KEY)
+    return bool(entry) and time.monotonic() < entry["expires"]
+
+
+def mark_connected(name: str, headline: str, picture_url: str) -> dict:
+    """OAuth redirect landed: trust its profile without another round trip."""
+    return store({"connected": True, "name": name, "headline": headline, "picture_url": picture_url})
+
+
+def mark_disconnected() -> None:
+    """After logout: cache the negative result so the next rerun doesn't ask again."""
+    store({"connected": False})
@@ -0,0 +1,155 @@
+"""
+FinSignal UI — Publish queue.
+Publishes drafts to LinkedIn off the script thread. A batch of selected
+drafts goes onto a small dedicated pool (PUBLISH_CONCURRENCY workers), and
+calls start no faster than PUBLISH_RATE_PER_MINUTE across the whole process.
+The Content Queue polls the batch for per-item progress and reruns once when
+it finishes.
+
+A draft already in flight is never queued a second time. This holds across
+sessions, so a double click or a second tab cannot post it twice.
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import db
+
+PUBLISH_CONCURRENCY  = int(os.getenv("PUBLISH_CONCURRENCY", "2"))
+PUBLISH_RATE_PER_MIN = float(os.getenv("PUBLISH_RATE_PER_MINUTE", "12"))
+BATCH_RETENTION      = 3600   # finished batches are forgotten after an hour
+
+ACTIONS = {
+    "publish": db.publish_post,
+    "draft":   db.publish_linkedin_draft,
+}
+
+_executor  = ThreadPoolExecutor(max_workers=PUBLISH_CONCURRENCY, thread_name_prefix="finsignal-publish")
+_lock      = threading.Lock()
+_batches: dict[str, "Batch"] = {}
+_in_flight: set[int] = set()
+_next_start = 0.0
+
+
+class Batch:
+    """One submitted set of drafts. Items are dicts with row_id, title, state
+    (queued → publishing → done | failed), message and reconnect."""
+
+    def __init__(self, action: str, rows: list[dict]) -> None:
+        self.id = uuid.uuid4().hex
+        self.action = action
+        self.created = time.time()
+        self.finished_at: Optional[float] = None
+        self.items = [
+            {
+                "row_id":    row["id"],
+                "title":     row.get("title") or (row.get("body") or "")[:60] or "Untitled",
+                "state":     "queued",
+                "message":   "",
+                "reconnect": False,
+            }
+            for row in rows
+        ]
+
+    @property
+    def done(self) -> bool:
+        return all(item["state"] in ("done", "failed") for item in self.items)
+
+    def counts(self) -> dict[str, int]:
+        out = {"queued": 0, "publishing": 0, "done": 0, "failed": 0}
+        for item in self.items:
+            out[item["state"]] += 1
+        return out
+
+
+# ── Workers ───────────────────────────────────────────────────────────────────
+
+def _throttle() -> None:
+    """Space call starts at least 60 / PUBLISH_RATE_PER_MIN seconds apart."""
+    global _next_start
+    with _lock:
+        now   = time.monotonic()
+        start = max(now, _next_start)
+        _next_start = start + 60.0 / PUBLISH_RATE_PER_MIN
+    if start > now:
+        time.sleep(start - now)
+
+
+def _message(action: str, result: dict) -> str:
+    if result.get("ok"):
+        li_id = result.get("linkedin_post_id", "")
+        if action == "draft":
+            return "Saved as draft on LinkedIn"
+        return f"Posted to LinkedIn{' · ID ' + li_id if li_id else ''}"
+    if result.get("reconnect"):
+        return "LinkedIn session expired — disconnect and reconnect LinkedIn from the top of the page."
+    msg = result.get("error") or "Publish failed"
+    if result.get("details"):
+        msg += f" — {result['details']}"
+    return msg
+
+
+def _run(batch: Batch, item: dict) -> None:
+    try:
+        _throttle()
+        item["state"] = "publishing"
+        try:
+            result = ACTIONS[batch.action](item["row_id"])
+        except Exception as e:
+            result = {"ok": False, "error": str(e)}
+        item["message"]   = _message(batch.action, result)
+        item["reconnect"] = bool(result.get("reconnect"))
+        item["state"]     = "done" if result.get("ok") else "failed"
+    finally:
+        if item["state"] not in ("done", "failed"):
+            item["state"], item["message"] = "failed", item["message"] or "Publish failed"
+        with _lock:
+            _in_flight.discard(item["row_id"])
+            if batch.done and batch.finished_at is None:
+                batch.finished_at = time.time()
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def submit(action: str, rows: list[dict]) -> tuple[Optional[Batch], list[int]]:
+    """Queue `rows` for `action` ("publish" or "draft").
+
+    Returns (batch, skipped_ids). Rows already being published by any
+    session are skipped. batch is None when nothing was left to queue.
+    """
+    with _lock:
+        cutoff = time.time() - BATCH_RETENTION
+        for bid in [b.id for b in _batches.values() if b.finished_at and b.finished_at < cutoff]:
+            del _batches[bid]
+        skipped = [row["id"] for row in rows if row["id"] in _in_flight]
+        rows    = [row for row in rows if row["id"] not in _in_flight]
+        if not rows:
+            return None, skipped
+        batch = Batch(action, rows)
+        _batches[batch.id] = batch
+        _in_flight.update(item["row_id"] for item in batch.items)
+    for item in batch.items:
+        _executor.submit(_run, batch, item)
+    return batch, skipped
+
+
+def get(batch_id: Optional[str]) -> Optional[Batch]:
+    with _lock:
+        return _batches.get(batch_id) if batch_id else None
+
+
+def forget(batch_id: Optional[str]) -> None:
+    """Drop a finished batch once its results have been shown."""
+    with _lock:
+        batch = _batches.get(batch_id) if batch_id else None
+        if batch is not None and batch.done:
+            del _batches[batch_id]
+
+
+def in_flight(row_id: int) -> bool:
+    with _lock:
+        return row_id in _in_flight
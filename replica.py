@@ -0,0 +1,222 @@
+"""
+FinSignal UI — Local read replica.
+Optional SQLite copy of the list endpoints (content queue, comment queue,
+influencers, feeds, topics, connections). It is kept in the UI container so
+list views read locally instead of waiting on an HTTP round trip. Enable it by
+setting REPLICA_PATH; when that is unset, db reads the backend as before.
+
+A background thread keeps the copy in sync. Every REPLICA_SYNC_SECONDS it
+fetches each collection with updated_since=<newest updated_at seen> and
+upserts the rows. Deletions do not show up in a delta, so a full refetch
+replaces the table every REPLICA_FULL_SYNC_SECONDS, and also right after
+this UI changes the collection (db calls invalidate() on a successful
+write). Until that refetch lands, the collection is read from the backend,
+so a view never shows older data than the write that was just made.
+
+Each table keeps the backend's row order (rows a delta adds go first, as
+newest) and has indexes on (status, created_at) for the filtered list views.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+REPLICA_PATH              = os.path.expanduser(os.getenv("REPLICA_PATH", ""))
+REPLICA_SYNC_SECONDS      = float(os.getenv("REPLICA_SYNC_SECONDS", "15"))
+REPLICA_FULL_SYNC_SECONDS = float(os.getenv("REPLICA_FULL_SYNC_SECONDS", "300"))
+
+_TABLE = """
+CREATE TABLE IF NOT EXISTS {t} (
+    id          INTEGER PRIMARY KEY,
+    pos         REAL NOT NULL,
+    status      TEXT,
+    created_at  TEXT,
+    updated_at  TEXT,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS {t}_status_created ON {t} (status, created_at);
+CREATE INDEX IF NOT EXISTS {t}_created ON {t} (created_at);
+CREATE INDEX IF NOT EXISTS {t}_pos ON {t} (pos);
+"""
+
+
+class _Collection:
+    def __init__(self, name: str, path: str) -> None:
+        self.name = name
+        self.path = path
+        self.loaded = False        # a full fetch has landed
+        self.generation = 0        # bumped by invalidate()
+        self.synced = -1           # generation the last full fetch covered
+        self.full_at = 0.0         # monotonic time of the last full fetch
+        self.cursor = ""           # newest updated_at seen
+
+
+_lock = threading.Lock()
+_wake = threading.Event()
+_conn: Optional[sqlite3.Connection] = None
+_collections: dict[str, _Collection] = {}
+_started = False
+
+
+def enabled() -> bool:
+    return bool(REPLICA_PATH)
+
+
+def _db() -> sqlite3.Connection:
+    """The replica connection (caller holds _lock)."""
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(REPLICA_PATH) or ".", exist_ok=True)
+        _conn = sqlite3.connect(REPLICA_PATH, check_same_thread=False, isolation_level=None)
+        _conn.execute("PRAGMA journal_mode=WAL")
+    return _conn
+
+
+# ── Sync ──────────────────────────────────────────────────────────────────────
+
+def _record(row: dict, pos: float) -> tuple:
+    return (
+        row["id"], pos, row.get("status"), row.get("created_at"), row.get("updated_at"),
+        json.dumps(row, default=str),
+    )
+
+
+def _sync(coll: _Collection, fetch: Callable[..., Any]) -> None:
+    with _lock:
+        generation = coll.generation
+        full = (
+            not coll.loaded or coll.synced != generation
+            or time.monotonic() - coll.full_at >= REPLICA_FULL_SYNC_SECONDS
+        )
+        cursor = coll.cursor
+    rows = fetch(coll.path) if full else fetch(coll.path, updated_since=cursor or None)
+    rows = [r for r in rows if isinstance(r, dict) and r.get("id") is not None] if isinstance(rows, list) else []
+    newest = max((str(r.get("updated_at") or "") for r in rows), default="")
+
+    with _lock:
+        conn = _db()
+        conn.execute("BEGIN")
+        try:
+            if full:
+                conn.execute(f"DELETE FROM {coll.name}")
+                conn.executemany(
+                    f"INSERT INTO {coll.name} VALUES (?, ?, ?, ?, ?, ?)",
+                    [_record(r, i) for i, r in enumerate(rows)],
+                )
+            elif rows:
+                front = conn.execute(f"SELECT COALESCE(MIN(pos), 0) FROM {coll.name}").fetchone()[0]
+                known = {
+                    r[0]: r[1] for r in conn.execute(
+                        f"SELECT id, pos FROM {coll.name} WHERE id IN ({','.join('?' * len(rows))})",
+                        [r["id"] for r in rows],
+                    )
+                }
+                added = [r for r in rows if r["id"] not in known]
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {coll.name} VALUES (?, ?, ?, ?, ?, ?)",
+                    [_record(r, known[r["id"]]) for r in rows if r["id"] in known]
+                    + [_record(r, front - len(added) + i) for i, r in enumerate(added)],
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if full:
+            coll.loaded = True
+            coll.synced = generation
+            coll.full_at = time.monotonic()
+            coll.cursor = newest
+        elif newest > coll.cursor:
+            coll.cursor = newest
+
+
+def _loop(fetch: Callable[..., Any]) -> None:
+    while True:
+        _wake.clear()
+        for coll in list(_collections.values()):
+            try:
+                _sync(coll, fetch)
+            except Exception as e:
+                print(f"[replica] sync of {coll.name} failed: {e}")
+        _wake.wait(timeout=REPLICA_SYNC_SECONDS)
+
+
+def start(fetch: Callable[..., Any], collections: dict[str, str]) -> None:
+    """Create the tables and start the sync thread (once per process; no-op
+    when REPLICA_PATH is unset). fetch(path, **params) returns the rows or
+    raises; collections maps a collection name to its list endpoint."""
+    global _started
+    if not enabled():
+        return
+    with _lock:
+        if _started:
+            return
+        _started = True
+        conn = _db()
+        for name, path in collections.items():
+            conn.executescript(_TABLE.format(t=name))
+            _collections[name] = _Collection(name, path)
+    threading.Thread(target=_loop, args=(fetch,), name="finsignal-replica", daemon=True).start()
+
+
+def invalidate(collection: Optional[str]) -> None:
+    """This UI changed `collection`: read it from the backend until a full
+    refetch has landed, and start that refetch now."""
+    with _lock:
+        coll = _collections.get(collection or "")
+        if coll is None:
+            return
+        coll.generation += 1
+    _wake.set()
+
+
+def upsert(collection: str, row: dict) -> None:
+    """Apply one pushed row change (events.py) without waiting for the next sync."""
+    with _lock:
+        coll = _collections.get(collection)
+        if coll is None or not coll.loaded or row.get("id") is None:
+            return
+        conn = _db()
+        known = conn.execute(f"SELECT pos FROM {collection} WHERE id = ?", (row["id"],)).fetchone()
+        if known is None:
+            front = conn.execute(f"SELECT COALESCE(MIN(pos), 0) FROM {collection}").fetchone()[0]
+            pos = front - 1
+        else:
+            pos = known[0]
+        conn.execute(f"INSERT OR REPLACE INTO {collection} VALUES (?, ?, ?, ?, ?, ?)", _record(row, pos))
+        stamp = str(row.get("updated_at") or "")
+        if stamp > coll.cursor:
+            coll.cursor = stamp
+
+
+# ── Reads ─────────────────────────────────────────────────────────────────────
+
+def _current(coll: Optional[_Collection]) -> bool:
+    return coll is not None and coll.loaded and coll.synced == coll.generation
+
+
+def ready(collection: str) -> bool:
+    """True when rows() can answer for `collection` without the backend."""
+    with _lock:
+        return _current(_collections.get(collection))
+
+
+def rows(collection: str, status: Optional[str] = None, **filters) -> Optional[list[dict]]:
+    """The collection in backend order, optionally filtered; None when the
+    replica cannot answer (disabled, not loaded yet, or behind a local write)."""
+    with _lock:
+        if not _current(_collections.get(collection)):
+            return None
+        if status is None:
+            cur = _db().execute(f"SELECT data FROM {collection} ORDER BY pos")
+        else:
+            cur = _db().execute(f"SELECT data FROM {collection} WHERE status = ? ORDER BY pos", (status,))
+        raw = cur.fetchall()
+    out = [json.loads(r[0]) for r in raw]
+    for field, value in filters.items():
+        if value is not None:
+            out = [r for r in out if r.get(field) == value]
+    return out
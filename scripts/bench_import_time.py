@@ -0,0 +1,140 @@
+"""
+Measure cold-start import cost of the app shell with `python -X importtime`.
+
+Streamlit itself is imported first and excluded from the total (use
+--include-streamlit to count it); what is measured is everything app.py pulls
+in before the active tab renders: the repo's own modules among app.py's
+top-level imports, read from its source so the list cannot drift. Each run
+uses a fresh interpreter and the median run is compared with the budget, so
+one noisy run neither passes nor fails the check. Fails when the total
+exceeds the budget or when a heavy library (pandas, plotly) is imported at
+startup — those belong behind function-level imports in the page that
+needs them.
+
+Measured baseline: medians of 88–152 ms on one unchanged tree (four
+invocations, five runs each), about 80 ms of it requests, which db needs at
+startup. The 200 ms default budget leaves over 30% headroom above the worst
+median, so the gate only trips on a real regression. Re-measure and adjust
+both numbers when the startup set changes on purpose.
+
+Usage:  python scripts/bench_import_time.py [--budget-ms N] [--runs N] [--page NAME] [--include-streamlit]
+Exits 1 on a regression, 2 when the import itself fails.
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT      = Path(__file__).resolve().parent.parent
+FORBIDDEN = ("pandas", "plotly")
+MARKER    = "-- finsignal startup --"
+BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "200"))   # baseline + headroom, see module docstring
+
+
+def startup_modules() -> list[str]:
+    """The repo modules app.py imports at top level, in source order."""
+    tree = ast.parse((ROOT / "app.py").read_text(encoding="utf-8"))
+    names: list[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    local = [n for n in names if (ROOT / f"{n.split('.')[0]}.py").exists() or (ROOT / n.split(".")[0]).is_dir()]
+    return list(dict.fromkeys(local))
+
+
+class Entry(NamedTuple):
+    name: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[Entry]:
+    """Entries printed after MARKER, in the order -X importtime reports them."""
+    entries: list[Entry] = []
+    started = False
+    for line in stderr.splitlines():
+        if line.strip() == MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header row
+        raw   = fields[2].rstrip()
+        name  = raw.lstrip()
+        depth = (len(raw) - len(name) - 1) // 2
+        entries.append(Entry(name, depth, int(fields[0]), int(fields[1])))
+    return entries
+
+
+def _run_once(modules: list[str], include_streamlit: bool) -> list[Entry]:
+    preload = "" if include_streamlit else "import streamlit; "
+    code = (
+        f"import sys; {preload}"
+        f"sys.stderr.write({MARKER!r} + '\\n'); sys.stderr.flush(); "
+        + "; ".join(f"import {m}" for m in modules)
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        raise RuntimeError("\n".join(tail[-5:]) or f"exit {proc.returncode}")
+    return parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5,
+                        help="take the median of N fresh interpreters (default 5)")
+    parser.add_argument("--page", action="append", default=[],
+                        help="also import pages.<NAME>, as on first activation of that tab")
+    parser.add_argument("--include-streamlit", action="store_true")
+    parser.add_argument("--top", type=int, default=10, help="slowest entries to list")
+    args = parser.parse_args()
+
+    modules = startup_modules() + [f"pages.{p}" for p in args.page]
+    if args.include_streamlit:
+        modules = ["streamlit", *modules]
+
+    try:
+        runs = [_run_once(modules, args.include_streamlit) for _ in range(max(1, args.runs))]
+    except RuntimeError as e:
+        print(f"import failed:\n{e}", file=sys.stderr)
+        return 2
+
+    totals   = [sum(e.cumulative_us for e in es if e.depth == 0) / 1000 for es in runs]
+    total_ms = statistics.median(totals)
+    typical  = min(zip(totals, runs), key=lambda tr: abs(tr[0] - total_ms))[1]
+    heavy    = sorted({e.name for es in runs for e in es
+                       if e.name.split(".")[0] in FORBIDDEN})
+
+    print(f"startup imports ({', '.join(modules)})")
+    print(f"  median {total_ms:.1f} ms over {len(runs)} run(s), range {min(totals):.1f}–{max(totals):.1f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+    for e in sorted(typical, key=lambda e: e.self_us, reverse=True)[:args.top]:
+        print(f"  {e.self_us / 1000:8.1f} ms  {e.name}")
+
+    failed = False
+    if heavy:
+        print(f"FAIL: heavy libraries imported at startup: {', '.join(heavy)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: startup imports over budget by {total_ms - args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
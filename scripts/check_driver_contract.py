@@ -0,0 +1,90 @@
+"""
+Check that the HTTP and SQLite read drivers return identical shapes.
+
+Runs every route the SQLite driver serves (unfiltered, then once per status
+or priority value found in the data) through both drivers against the same
+backend, and compares: the container type, row ids and their order, each
+row's keys, and the JSON type of each value. Run it on a single-host install
+after a backend schema change, before enabling DATA_DRIVER=sqlite.
+
+Usage:  python scripts/check_driver_contract.py --api-url URL --db-path PATH
+Exits 1 when the drivers disagree.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import drivers  # noqa: E402
+
+
+def _kind(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    return type(value).__name__
+
+
+def _compare(label: str, http_rows, sqlite_rows) -> list[str]:
+    if not isinstance(http_rows, list) or not isinstance(sqlite_rows, list):
+        return [f"{label}: expected lists, got {type(http_rows).__name__} / {type(sqlite_rows).__name__}"]
+    problems = []
+    http_ids   = [r.get("id") for r in http_rows]
+    sqlite_ids = [r.get("id") for r in sqlite_rows]
+    if sorted(map(str, http_ids)) != sorted(map(str, sqlite_ids)):
+        problems.append(f"{label}: row ids differ ({len(http_ids)} over HTTP, {len(sqlite_ids)} from SQLite)")
+        return problems
+    if http_ids != sqlite_ids:
+        problems.append(f"{label}: same rows in a different order")
+    by_id = {r.get("id"): r for r in sqlite_rows}
+    for row in http_rows:
+        other = by_id[row.get("id")]
+        if set(row) != set(other):
+            only_http, only_sqlite = set(row) - set(other), set(other) - set(row)
+            problems.append(f"{label} id={row.get('id')}: keys only over HTTP {sorted(only_http)}, "
+                            f"only in SQLite {sorted(only_sqlite)}")
+            continue
+        for key, value in row.items():
+            if value is not None and other[key] is not None and _kind(value) != _kind(other[key]):
+                problems.append(f"{label} id={row.get('id')}.{key}: {_kind(value)} over HTTP, "
+                                f"{_kind(other[key])} from SQLite")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--api-url", required=True)
+    parser.add_argument("--db-path", required=True)
+    parser.add_argument("--timeout", type=float, default=15)
+    args = parser.parse_args()
+
+    http   = drivers.HttpDriver(args.api_url, args.timeout)
+    sqlite = drivers.SqliteDriver(args.db_path)
+    problems: list[str] = []
+    checked = 0
+    for path, route in drivers.SQLITE_ROUTES.items():
+        base = http.get(path, {})
+        cases = [({}, base)]
+        for name in route.filters:
+            values = sorted({str(r[name]) for r in base if isinstance(r, dict) and r.get(name) is not None})
+            cases += [({name: v}, None) for v in values]
+        for params, http_rows in cases:
+            label = path + (f"?{'&'.join(f'{k}={v}' for k, v in params.items())}" if params else "")
+            problems += _compare(label, http_rows if http_rows is not None else http.get(path, params),
+                                 sqlite.get(path, params))
+            checked += 1
+
+    for problem in problems:
+        print(problem)
+    print(f"\n{checked} request(s) checked, {len(problems)} mismatch(es)")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Check the SQLite read driver against a stub backend serving the same rows.
+
+Builds a fixture database with one table per route in drivers.SQLITE_ROUTES
+and starts a local HTTP server that answers those routes from the same
+rows, filtered and ordered the way the backend does. Every route is then
+read through both drivers (unfiltered, once per filter value, and as an
+updated_since delta) and the results must be identical. The fixture covers
+what SELECT * used to get wrong: internal columns that the endpoints do not
+return, 0/1 flags the endpoints return as booleans, rows that tie on
+created_at, and a table without updated_at.
+
+Needs nothing but the standard library and requests; run it after changing
+SQLITE_ROUTES. scripts/check_driver_contract.py does the live-install check.
+
+Usage:  python scripts/check_driver_fixture.py
+Exits 1 when the drivers disagree.
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import drivers  # noqa: E402
+from check_driver_contract import _compare  # noqa: E402
+
+# Columns the backend keeps but the endpoints never return.
+INTERNAL = {"owner_id": 7, "raw_payload": "{}"}
+
+
+def _stamp(day: int, hour: int = 9) -> str:
+    return f"2026-03-{day:02d}T{hour:02d}:00:00+00:00"
+
+
+# Endpoint rows per route, in the order the backend returns them.
+ROWS: dict[str, list[dict]] = {
+    "/content-queue": [
+        {"id": 4, "title": "Rates", "body": "Fed day.", "topic": "macro", "status": "draft",
+         "linkedin_post_id": None, "created_at": _stamp(9), "updated_at": _stamp(9, 10),
+         "status_changed_at": None, "scheduled_at": None, "posted_at": None},
+        {"id": 3, "title": "ETFs", "body": "Flows.", "topic": "etf", "status": "scheduled",
+         "linkedin_post_id": None, "created_at": _stamp(8), "updated_at": _stamp(9, 8),
+         "status_changed_at": _stamp(9, 8), "scheduled_at": _stamp(10), "posted_at": None},
+        {"id": 2, "title": "Yields", "body": "Curve.", "topic": "macro", "status": "posted",
+         "linkedin_post_id": "urn:li:share:2", "created_at": _stamp(8), "updated_at": _stamp(8, 12),
+         "status_changed_at": _stamp(8, 12), "scheduled_at": None, "posted_at": _stamp(8, 12)},
+    ],
+    "/comment-queue": [
+        {"id": 11, "influencer_name": "Ana", "post_url": "https://x/1", "post_content": "Long post",
+         "post_snippet": "Long", "comment_text": "Agreed.", "status": "pending",
+         "created_at": _stamp(9), "updated_at": _stamp(9), "status_changed_at": None,
+         "scheduled_at": None, "posted_at": None},
+        {"id": 10, "influencer_name": "Ben", "post_url": "https://x/2", "post_content": "Chart",
+         "post_snippet": "Chart", "comment_text": "Nice chart.", "status": "posted",
+         "created_at": _stamp(7), "updated_at": _stamp(8), "status_changed_at": _stamp(8),
+         "scheduled_at": None, "posted_at": _stamp(8)},
+    ],
+    "/influencers": [
+        {"id": 1, "name": "Ana", "linkedin_handle": "ana", "headline": "PM", "niche": "macro",
+         "status": "active", "comments_posted": 3, "created_at": _stamp(1), "updated_at": _stamp(9)},
+        {"id": 2, "name": "Ben", "linkedin_handle": "ben", "headline": None, "niche": "etf",
+         "status": "paused", "comments_posted": 0, "created_at": _stamp(2), "updated_at": _stamp(2)},
+    ],
+    "/feeds": [
+        {"id": 1, "name": "FT", "url": "https://ft/rss", "feed_type": "rss", "category": "news",
+         "priority": "high", "source": "manual", "active": True, "last_fetched": _stamp(9),
+         "created_at": _stamp(1), "updated_at": _stamp(9)},
+        {"id": 2, "name": "Blog", "url": "https://b/rss", "feed_type": "rss", "category": "blogs",
+         "priority": "low", "source": "discovered", "active": False, "last_fetched": None,
+         "created_at": _stamp(3), "updated_at": _stamp(3)},
+    ],
+    # No updated_at on this table: a delta must still answer.
+    "/topics": [
+        {"id": 1, "name": "Macro", "weight": 0.6, "context": "Rates and growth", "active": True,
+         "created_at": _stamp(1)},
+        {"id": 2, "name": "ETFs", "weight": 0.4, "context": "", "active": False,
+         "created_at": _stamp(1)},
+    ],
+    "/connections": [
+        {"id": 6, "name": "Cy", "linkedin_handle": "cy", "source": "comment", "status": "sent",
+         "sent_at": _stamp(9), "created_at": _stamp(9), "updated_at": _stamp(9)},
+        {"id": 5, "name": "Di", "linkedin_handle": "di", "source": "manual", "status": "pending",
+         "sent_at": None, "created_at": _stamp(9), "updated_at": _stamp(9)},
+    ],
+}
+
+
+def _build_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    for route_path, route in drivers.SQLITE_ROUTES.items():
+        rows = ROWS[route_path]
+        columns = [c for c in route.columns if c in rows[0]] + list(INTERNAL)
+        conn.execute(f"CREATE TABLE {route.table} ({', '.join(columns)})")
+        conn.executemany(
+            f"INSERT INTO {route.table} VALUES ({', '.join('?' * len(columns))})",
+            # Stored in reverse so the result order has to come from ORDER BY.
+            [[{**row, **INTERNAL}[c] for c in columns] for row in reversed(rows)],
+        )
+    conn.commit()
+    conn.close()
+
+
+def _serve(path: str, query: dict[str, list[str]]) -> list[dict]:
+    """What the backend answers: filter on equality and updated_since, keep the order."""
+    rows = ROWS[path]
+    for name in drivers.SQLITE_ROUTES[path].filters:
+        if name in query:
+            rows = [r for r in rows if str(r.get(name)) == query[name][0]]
+    if "updated_since" in query and all("updated_at" in r for r in rows):
+        rows = [r for r in rows if r["updated_at"] > query["updated_since"][0]]
+    return rows
+
+
+class _Stub(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path not in ROWS:
+            self.send_error(404)
+            return
+        body = json.dumps(_serve(url.path, parse_qs(url.query))).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _cases(path: str) -> list[dict]:
+    route, rows = drivers.SQLITE_ROUTES[path], ROWS[path]
+    cases: list[dict] = [{}]
+    for name in route.filters:
+        cases += [{name: v} for v in sorted({str(r[name]) for r in rows})]
+    stamps = sorted(str(r.get("updated_at") or r["created_at"]) for r in rows)
+    cases.append({"updated_since": stamps[len(stamps) // 2]})
+    return cases
+
+
+def main() -> int:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    problems: list[str] = []
+    checked = 0
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "backend.sqlite3"
+            _build_db(db_path)
+            http   = drivers.HttpDriver(f"http://127.0.0.1:{server.server_port}", 5)
+            sqlite = drivers.SqliteDriver(str(db_path))
+            for path in drivers.SQLITE_ROUTES:
+                for params in _cases(path):
+                    label = path + (f"?{'&'.join(f'{k}={v}' for k, v in params.items())}" if params else "")
+                    http_rows, sqlite_rows = http.get(path, params), sqlite.get(path, params)
+                    found = _compare(label, http_rows, sqlite_rows)
+                    if not found and http_rows != sqlite_rows:
+                        found = [f"{label}: same shape, different values"]
+                    problems += found
+                    checked += 1
+    finally:
+        server.shutdown()
+
+    for problem in problems:
+        print(problem)
+    print(f"\n{checked} request(s) checked, {len(problems)} mismatch(es)")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
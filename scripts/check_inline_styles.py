@@ -0,0 +1,107 @@
+"""
+Flag inline style="…" strings that are rebuilt once per row.
+
+Rows rendered in a loop repeat their inline styles once per row on every
+rerun; those belong in static/finsignal.css as classes. Checked: for-loop
+bodies, functions called from a loop in the same file (directly or through
+a lambda, e.g. card_cache.cached(..., lambda: _row_html(row))) and what they
+call in turn, and any *_row* / *_html helper. Dynamic values (f-string
+placeholders such as per-niche colours) and short spacers (height, width,
+margin, padding) are ignored.
+
+Usage:  python scripts/check_inline_styles.py [--min-length N] [files…]
+Exits 1 when anything is flagged, 2 when a file cannot be parsed.
+"""
+
+import argparse
+import ast
+import re
+import sys
+from pathlib import Path
+
+ROOT    = Path(__file__).resolve().parent.parent
+DEFAULT = [ROOT / "app.py", *sorted((ROOT / "pages").glob("*.py"))]
+SKIP    = {"__init__.py", "feed_manager_archived.py"}
+STYLE   = re.compile(r"""style=(['"])([^'"{}]*)\1""")
+SPACER  = re.compile(r"^\s*((height|width|margin|padding)[\w-]*\s*:[^;]*;?\s*)+$")
+ROW_FN  = re.compile(r"(_row|_html)$")
+
+_FUNCS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _called(nodes: list[ast.AST]) -> set[str]:
+    """Names of the functions called anywhere under `nodes`."""
+    names = set()
+    for stmt in nodes:
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Call):
+                func = node.func
+                if isinstance(func, ast.Name):
+                    names.add(func.id)
+                elif isinstance(func, ast.Attribute):
+                    names.add(func.attr)
+    return names
+
+
+def _per_row_code(tree: ast.Module) -> list[ast.AST]:
+    """Loop bodies plus the bodies of the per-row functions they reach."""
+    funcs = {f.name: f for f in ast.walk(tree) if isinstance(f, _FUNCS)}
+    bodies: list[ast.AST] = [
+        stmt for loop in ast.walk(tree) if isinstance(loop, (ast.For, ast.AsyncFor)) for stmt in loop.body
+    ]
+    todo = (_called(bodies) | {name for name in funcs if ROW_FN.search(name)}) & set(funcs)
+    seen: set[str] = set()
+    while todo:
+        name = todo.pop()
+        seen.add(name)
+        bodies += funcs[name].body
+        todo |= (_called(funcs[name].body) & set(funcs)) - seen
+    return bodies
+
+
+def _row_styles(path: Path, min_length: int) -> list[tuple[int, str]]:
+    tree  = ast.parse(path.read_text(), filename=str(path))
+    found = set()
+    for stmt in _per_row_code(tree):
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                for m in STYLE.finditer(node.value):
+                    style = m.group(2)
+                    if len(style) < min_length and SPACER.match(style):
+                        continue
+                    found.add((node.lineno, style))
+    return sorted(found)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--min-length", type=int, default=20,
+                        help="ignore spacer styles shorter than this (default 20)")
+    args = parser.parse_args()
+
+    files   = args.files or [p for p in DEFAULT if p.name not in SKIP]
+    flagged = 0
+    broken  = 0
+    for path in files:
+        name = path.relative_to(ROOT) if path.is_absolute() else path
+        try:
+            styles = _row_styles(path, args.min_length)
+        except SyntaxError as e:
+            print(f"{name}:{e.lineno}: ERROR cannot parse ({e.msg}) — check it with a newer Python")
+            broken += 1
+            continue
+        for lineno, style in styles:
+            print(f"{name}:{lineno}: inline style per row: {style}")
+            flagged += 1
+
+    if flagged:
+        print(f"\n{flagged} inline style(s) repeated per row — move them to static/finsignal.css")
+    if broken:
+        print(f"\n{broken} file(s) could not be checked")
+        return 2
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+FinSignal UI — Shared cache.
+Process-wide cache for single-tenant resources: strategy, topics, ICP,
+feeds, the voice profile and their histories. These are the same for every
+browser tab, so all sessions share one copy per (tenant, resource) and ten
+open tabs cost one backend fetch, not ten.
+
+  get_or_load   Single-flight: concurrent misses for a key wait on one load.
+                A failed load (it raised) is not cached.
+  patch         Update a cached value after a save. Copy-on-write: sessions
+                already holding the old object keep an unchanged snapshot.
+  invalidate    Drop a resource for every session. A load that was in flight
+                when it was invalidated is returned to its callers but not
+                cached, since it may predate the write.
+
+Entries live for SHARED_CACHE_TTL_SECONDS. Keys carry the tenant
+(FINSIGNAL_TENANT, "default" in the single-tenant deployment), so a
+multi-tenant setup can pass its own tenant without the entries colliding.
+This is a plain store rather than st.cache_data: values are patched in
+place, and invalidation has to work from background threads with no script
+context.
+"""
+
+import copy
+import os
+import threading
+from concurrent.futures import Future
+from typing import Callable, Hashable, Optional, TypeVar
+
+from ttl_cache import TTLCache
+
+T = TypeVar("T")
+
+TENANT           = os.getenv("FINSIGNAL_TENANT", "default")
+SHARED_CACHE_TTL = float(os.getenv("SHARED_CACHE_TTL_SECONDS", "60"))
+
+_cache: TTLCache = TTLCache(SHARED_CACHE_TTL)
+_lock = threading.Lock()
+_loading: dict[Hashable, Future] = {}
+_generations: dict[Hashable, int] = {}
+
+
+def key(resource: str, tenant: Optional[str] = None) -> tuple[str, str]:
+    return (tenant or TENANT, resource)
+
+
+def peek(resource: str, tenant: Optional[str] = None):
+    """The cached value, or None (never loads)."""
+    return _cache.get(key(resource, tenant))
+
+
+def get_or_load(resource: str, load: Callable[[], T], tenant: Optional[str] = None) -> T:
+    """The cached value for `resource`, loading it once if absent."""
+    k = key(resource, tenant)
+    value = _cache.get(k)
+    if value is not None:
+        return value
+    with _lock:
+        value = _cache.get(k)
+        if value is not None:
+            return value
+        pending = _loading.get(k)
+        owner = pending is None
+        if owner:
+            pending = Future()
+            _loading[k] = pending
+            generation = _generations.get(k, 0)
+    if not owner:
+        return pending.result()
+
+    try:
+        value = load()
+    except BaseException as e:
+        with _lock:
+            _loading.pop(k, None)
+        pending.set_exception(e)
+        raise
+    with _lock:
+        _loading.pop(k, None)
+        if _generations.get(k, 0) == generation:
+            _cache.set(k, value)
+    pending.set_result(value)
+    return value
+
+
+def patch(resource: str, update: Callable[[T], None], tenant: Optional[str] = None) -> None:
+    """Apply update() to a copy of the cached value, if there is one, and swap
+    the copy in. The cached object is shared by every session and may be
+    mid-render, so it is never changed in place. A load in flight predates
+    the save and is not cached."""
+    k = key(resource, tenant)
+    with _lock:
+        value = _cache.get(k)
+        if value is None:
+            return
+        value = copy.deepcopy(value)
+        update(value)
+        _generations[k] = _generations.get(k, 0) + 1
+        _cache.set(k, value)
+
+
+def set_ttl(seconds: float) -> None:
+    """Lifetime of entries cached from now on. db.revalidate lengthens it
+    while the backend reports change sequences, since staleness is then
+    signalled explicitly and the TTL is only a backstop."""
+    _cache.ttl = seconds
+
+
+def invalidate(*resources: str, tenant: Optional[str] = None) -> None:
+    """Drop `resources` for every session (all resources when none are given)."""
+    with _lock:
+        if not resources:
+            for k in list(_generations) + list(_loading):
+                _generations[k] = _generations.get(k, 0) + 1
+            _cache.invalidate()
+            return
+        for resource in resources:
+            k = key(resource, tenant)
+            _generations[k] = _generations.get(k, 0) + 1
+            _cache.invalidate(k)
@@ -0,0 +1,41 @@
+"""
+FinSignal UI — Stylesheet.
+All app and page CSS lives in static/finsignal.css. Streamlit serves it from
+/app/static, so each rerun only sends a short <link> tag; the content hash in
+the query string makes the browser fetch it once and refetch only on change.
+"""
+
+import hashlib
+from pathlib import Path
+
+import streamlit as st
+
+CSS_PATH    = Path(__file__).parent / "static" / "finsignal.css"
+_STATIC_URL = "app/static/finsignal.css"
+
+_hash_cache: dict[float, str] = {}
+
+
+def stylesheet_hash() -> str:
+    """Short content hash of the stylesheet, recomputed only when the file changes."""
+    mtime = CSS_PATH.stat().st_mtime
+    if mtime not in _hash_cache:
+        _hash_cache.clear()
+        _hash_cache[mtime] = hashlib.sha256(CSS_PATH.read_bytes()).hexdigest()[:12]
+    return _hash_cache[mtime]
+
+
+def inject() -> None:
+    """Link the shared stylesheet. Falls back to inlining it when static serving is off."""
+    try:
+        static_serving = bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        static_serving = False
+
+    if static_serving:
+        st.markdown(
+            f'<link rel="stylesheet" href="{_STATIC_URL}?v={stylesheet_hash()}">',
+            unsafe_allow_html=True,
+        )
+    else:
+        st.markdown(f"<style>{CSS_PATH.read_text()}</style>", unsafe_allow_html=True)
@@ -0,0 +1,124 @@
+"""
+FinSignal UI — Shared widgets.
+Small building blocks reused by several pages.
+"""
+
+from pathlib import Path
+from typing import Callable, Optional
+
+import streamlit as st
+
+_visibility = None
+
+
+def row_selector(
+    rows: list[dict],
+    key: str,
+    label_fn: Callable[[int, dict], str],
+    placeholder: str = "Select an item…",
+    on_change: Optional[Callable[[], None]] = None,
+) -> Optional[dict]:
+    """Single selectbox that picks one row out of a list.
+
+    Pages render their rows as plain HTML and put one shared action bar on
+    top of the selection, so the widget count per rerun stays constant no
+    matter how long the queue is. Returns the selected row, or None.
+    """
+    by_id  = {row["id"]: row for row in rows}
+    labels = {row["id"]: label_fn(i, row) for i, row in enumerate(rows, start=1)}
+
+    # Drop a stale selection (row was posted, deleted or filtered out)
+    if st.session_state.get(key) not in by_id:
+        st.session_state.pop(key, None)
+
+    selected_id = st.selectbox(
+        "Selected",
+        list(by_id),
+        index=None,
+        format_func=lambda rid: labels.get(rid, str(rid)),
+        placeholder=placeholder,
+        key=key,
+        on_change=on_change,
+        label_visibility="collapsed",
+    )
+    return by_id.get(selected_id)
+
+
+def row_multiselect(
+    rows: list[dict],
+    key: str,
+    label_fn: Callable[[int, dict], str],
+    placeholder: str = "Select items…",
+) -> list[dict]:
+    """Multiselect counterpart of row_selector, for actions that take several
+    rows at once. Stale ids are dropped before the widget is drawn."""
+    by_id  = {row["id"]: row for row in rows}
+    labels = {row["id"]: label_fn(i, row) for i, row in enumerate(rows, start=1)}
+
+    if key in st.session_state:
+        st.session_state[key] = [rid for rid in st.session_state[key] if rid in by_id]
+
+    selected_ids = st.multiselect(
+        "Selected",
+        list(by_id),
+        format_func=lambda rid: labels.get(rid, str(rid)),
+        placeholder=placeholder,
+        key=key,
+        label_visibility="collapsed",
+    )
+    return [by_id[rid] for rid in selected_ids if rid in by_id]
+
+
+def row_number_pill(n: int, selected: bool = False) -> str:
+    """Small '#n' marker shown on a card so it can be found in the selector."""
+    cls = "row-num selected" if selected else "row-num"
+    return f'<span class="{cls}">#{n}</span>'
+
+
+def sparkline(values: list[float], width: int = 120, height: int = 28, color: str = "#0A66C2") -> str:
+    """Inline SVG polyline of `values`; empty string until there are two points."""
+    if len(values) < 2:
+        return ""
+    lo, hi = min(values), max(values)
+    span   = (hi - lo) or 1.0
+    step   = width / (len(values) - 1)
+    points = " ".join(
+        f"{i * step:.1f},{height - 2 - (v - lo) / span * (height - 4):.1f}"
+        for i, v in enumerate(values)
+    )
+    return (
+        f'<svg class="sparkline" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{points}"/></svg>'
+    )
+
+
+def trend_delta(delta: Optional[float], good_when_up: bool = True) -> str:
+    """'▲ 3' / '▼ 2' badge for a change over the sampling window; '' when unknown or flat."""
+    if not delta:
+        return ""
+    up  = delta > 0
+    cls = "trend-up" if up == good_when_up else "trend-down"
+    return f'<span class="trend {cls}">{"▲" if up else "▼"} {abs(delta):g}</span>'
+
+
+def offline_badge(row: dict) -> str:
+    """'Queued offline' pill for a row whose change is still in the journal; '' otherwise."""
+    if not row.get("_journaled"):
+        return ""
+    return (
+        '<span class="offline-badge" title="Saved locally — it will be sent when the backend is reachable">'
+        "⏳ Queued offline</span>"
+    )
+
+
+def page_visible(key: str) -> bool:
+    """False while the browser tab is hidden. Draws a zero-height component;
+    a visibility change reruns the enclosing fragment (or the app)."""
+    global _visibility
+    if _visibility is None:
+        # Declared on first use: streamlit.components is not needed at startup.
+        import streamlit.components.v1 as components
+        _visibility = components.declare_component(
+            "page_visibility", path=str(Path(__file__).resolve().parent / "static" / "visibility"),
+        )
+    return _visibility(key=key, default="visible") != "hidden"
@@ -0,0 +1,229 @@
+"""
+FinSignal UI — Write-behind queue.
+Edits and toggles return immediately. The write is held for
+WRITE_BEHIND_SECONDS, and later writes to the same resource in that window
+replace it (the last state wins). Two pending flips of the same toggle
+cancel out. A background thread then flushes due writes on the shared pool,
+at most one in flight per resource, so writes to one resource land in
+order.
+
+Until a write has flushed, db getters overlay its change on the rows they
+return (apply / apply_one), so the rerun right after a click already shows
+the new state. A failed flush drops the overlay and is reported to the
+session that made the change (pop_failures).
+
+Any other mutation of a row (approve, publish, schedule, status, delete)
+first calls flush_row(), so it can never overtake a held edit of the same
+row: "Save edit → Approve & Post" posts the edited text, and the offline
+journal records the edit before the approval.
+"""
+
+import atexit
+import itertools
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import background
+
+WRITE_BEHIND_SECONDS = float(os.getenv("WRITE_BEHIND_SECONDS", "1.5"))
+
+Patch = Union[dict, Callable[[dict], dict]]
+
+
+class _Write:
+    def __init__(
+        self, key: str, send: Callable[[], Any], collection: str, row_id: Any,
+        patch: Optional[Patch], flip: bool, label: str,
+    ) -> None:
+        self.key = key
+        self.send = send
+        self.collection = collection
+        self.row_id = row_id
+        self.patch = patch
+        self.flip = flip
+        self.label = label
+        self.seq = next(_seq)
+        self.due = time.monotonic() + WRITE_BEHIND_SECONDS
+        ctx = get_script_run_ctx(suppress_warning=True)
+        self.owner = ctx.session_id if ctx else None
+
+
+_seq = itertools.count(1)
+_cond = threading.Condition()
+_pending: dict[str, _Write] = {}    # coalesced, waiting for their window to pass
+_inflight: dict[str, _Write] = {}   # being sent; one per resource
+_failures: dict[str, list[str]] = {}
+_started = False
+_local = threading.local()           # .flushing: this thread is sending a write
+
+
+# ── Queue ─────────────────────────────────────────────────────────────────────
+
+def submit(
+    key: str,
+    send: Callable[[], Any],
+    *,
+    collection: str = "",
+    row_id: Any = None,
+    patch: Optional[Patch] = None,
+    flip: bool = False,
+    label: str = "Saving a change",
+) -> None:
+    """Queue send() for `key` (one resource, e.g. "feed:12:active").
+
+    patch is overlaid on the matching row of `collection` until the write
+    has flushed: a dict of new field values, or for a flip a function from
+    the current row to the new fields.
+    """
+    global _started
+    with _cond:
+        prev = _pending.get(key)
+        if flip and prev is not None and prev.flip:
+            del _pending[key]
+            return
+        write = _Write(key, send, collection, row_id, patch, flip, label)
+        if prev is not None:
+            write.due = prev.due   # coalescing never delays past the first write's window
+        _pending[key] = write
+        if not _started:
+            _started = True
+            threading.Thread(target=_loop, name="finsignal-write-behind", daemon=True).start()
+        _cond.notify()
+
+
+def _take_due(now: float) -> list[_Write]:
+    due = [w for k, w in _pending.items() if w.due <= now and k not in _inflight]
+    for w in due:
+        del _pending[w.key]
+        _inflight[w.key] = w
+    return due
+
+
+def _loop() -> None:
+    while True:
+        with _cond:
+            now = time.monotonic()
+            due = _take_due(now)
+            if not due:
+                waits = [w.due - now for k, w in _pending.items() if k not in _inflight]
+                _cond.wait(timeout=min(waits) if waits else None)
+                continue
+        for write in due:
+            background.submit(_flush, write)
+
+
+def _flush(write: _Write) -> None:
+    _local.flushing = True
+    try:
+        result = write.send()
+    except Exception as e:
+        result = {"ok": False, "error": str(e)}
+    finally:
+        _local.flushing = False
+    failed = isinstance(result, dict) and result.get("ok") is False
+    with _cond:
+        _inflight.pop(write.key, None)
+        if failed:
+            print(f"[write_behind] {write.key} failed: {result.get('error', 'backend error')}")
+            if write.owner:
+                _failures.setdefault(write.owner, []).append(
+                    f"{write.label} failed: {result.get('error') or 'the backend did not accept it'}"
+                )
+        _cond.notify()
+
+
+def flush_row(collection: str, row_id: Any, timeout: float = 10.0) -> None:
+    """Send the row's held writes now and wait until they have landed. A
+    write's own send (which goes through db) is not held up by this."""
+    if getattr(_local, "flushing", False):
+        return
+    deadline = time.monotonic() + timeout
+
+    def mine(w: _Write) -> bool:
+        return w.collection == collection and w.row_id == row_id
+
+    with _cond:
+        for write in _pending.values():
+            if mine(write):
+                write.due = 0.0
+        _cond.notify_all()
+        while any(mine(w) for w in (*_pending.values(), *_inflight.values())):
+            left = deadline - time.monotonic()
+            if left <= 0:
+                print(f"[write_behind] {collection}:{row_id} still flushing after {timeout:.0f}s")
+                return
+            _cond.wait(timeout=min(left, 0.1))
+
+
+def flush(timeout: float = 10.0) -> None:
+    """Send everything still queued and wait for it (used at exit). Writes are
+    sent on this thread: the shared pool may already be shutting down."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with _cond:
+            ready = [w for k, w in _pending.items() if k not in _inflight]
+            for write in ready:
+                del _pending[write.key]
+                _inflight[write.key] = write
+            if not ready:
+                if not _pending and not _inflight:
+                    return
+                _cond.wait(timeout=0.1)
+                continue
+        for write in ready:
+            _flush(write)
+
+
+# concurrent.futures shuts its pools down from threading's exit hooks, which
+# run before atexit handlers; register there (later-registered hooks run
+# first) so queued writes are sent while the interpreter is still intact.
+try:
+    threading._register_atexit(flush)
+except (AttributeError, RuntimeError):
+    atexit.register(flush)
+
+
+# ── Read side ─────────────────────────────────────────────────────────────────
+
+def _writes_for(collection: str) -> list[_Write]:
+    with _cond:
+        writes = [w for w in (*_inflight.values(), *_pending.values()) if w.collection == collection]
+    return sorted(writes, key=lambda w: w.seq)
+
+
+def _patched(row: dict, writes: list[_Write]) -> dict:
+    out = dict(row)
+    for w in writes:
+        out.update(w.patch(out) if callable(w.patch) else w.patch)
+        out["_pending"] = w.seq   # see card_cache.row_version
+    return out
+
+
+def apply(collection: str, rows: list[dict]) -> list[dict]:
+    """rows with every unflushed write for `collection` overlaid (matched on id)."""
+    writes = [w for w in _writes_for(collection) if w.patch is not None]
+    if not writes:
+        return rows
+    by_row: dict[Any, list[_Write]] = {}
+    for w in writes:
+        by_row.setdefault(w.row_id, []).append(w)
+    return [_patched(r, by_row[r.get("id")]) if r.get("id") in by_row else r for r in rows]
+
+
+def apply_one(collection: str, row: dict) -> dict:
+    """A single record (e.g. the voice profile) with unflushed writes overlaid."""
+    writes = [w for w in _writes_for(collection) if w.patch is not None]
+    return _patched(row, writes) if writes else row
+
+
+def pop_failures() -> list[str]:
+    """Flush failures for the current session since the last call."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return []
+    with _cond:
+        return _failures.pop(ctx.session_id, [])